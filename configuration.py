@@ -1,3 +1,4 @@
+import hashlib
 import json
 import os
 import sys
@@ -691,6 +692,51 @@ class Configuration:
         """Gets the list of map types that must always be saved losslessly."""
         return self._core_settings.get('FORCE_LOSSLESS_MAP_TYPES', [])
 
+    @property
+    def max_workers(self) -> int:
+        """
+        Gets the number of assets to process concurrently (MAX_WORKERS in core settings).
+        Defaults to half the CPU cores, but at least 2, if missing or invalid.
+        """
+        value = self._core_settings.get('MAX_WORKERS')
+        if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+            return value
+        if value is not None:
+            log.warning(f"MAX_WORKERS must be a positive integer, got {value!r}. Using the CPU-based default.")
+        return max(2, (os.cpu_count() or 1) // 2)
+
+    @property
+    def require_full_content_hash(self) -> bool:
+        """
+        Whether the [SHA5] token is derived from the whole input archive (REQUIRE_FULL_CONTENT_HASH
+        in core settings). Defaults to False, hashing only the archive's first MiB and its size.
+        """
+        return bool(self._core_settings.get('REQUIRE_FULL_CONTENT_HASH', False))
+
+    @property
+    def use_ram_workspace(self) -> bool:
+        """
+        Whether inputs are extracted to a RAM-backed filesystem (/dev/shm) when one with enough
+        free space exists (USE_RAM_WORKSPACE in core settings). Defaults to False.
+        """
+        return bool(self._core_settings.get('USE_RAM_WORKSPACE', False))
+
+    @property
+    def settings_fingerprint(self) -> str:
+        """
+        SHA-256 over the loaded settings that affect processing output (core settings, preset,
+        asset/file type definitions and suppliers), used to tell whether earlier results were
+        produced with the same configuration.
+        """
+        settings = [
+            self._core_settings,
+            self._preset_settings,
+            self._asset_type_definitions,
+            self._file_type_definitions,
+            self._suppliers_config,
+        ]
+        return hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
     def get_bit_depth_rule(self, map_type_input: str) -> str:
         """
         Gets the bit depth rule ('respect', 'force_8bit', 'force_16bit') for a given map type identifier.
@@ -994,6 +1040,48 @@ def load_base_config(
 
     return base_settings
 
+def get_base_config_source_paths(
+    base_dir_user_config: Optional[Union[str, os.PathLike, Path]] = None,
+) -> list[Path]:
+    """Returns every file ``load_base_config`` may read its data from.
+
+    Callers that cache the parsed base configuration can stat these paths to
+    detect edits (e.g. definitions saved from the GUI editors). Paths are
+    returned whether or not they currently exist.
+
+    Args:
+        base_dir_user_config: Optional explicit user configuration root, resolved
+            the same way as in ``load_base_config``.
+
+    Returns:
+        A list of bundled and, when a user configuration root is set, user
+        configuration file paths.
+    """
+
+    if base_dir_user_config is None:
+        base_dir_user_config = _get_user_config_path_placeholder()
+
+    loader = Configuration.__new__(Configuration)
+    bundled_config_dir = (
+        loader._determine_base_dir_app_bundled()
+        / Configuration.BASE_DIR_APP_BUNDLED_CONFIG_SUBDIR_NAME
+    )
+    definition_filenames = (
+        Configuration.ASSET_TYPE_DEFINITIONS_FILENAME,
+        Configuration.FILE_TYPE_DEFINITIONS_FILENAME,
+    )
+
+    paths = [bundled_config_dir / Configuration.APP_SETTINGS_FILENAME]
+    paths.extend(bundled_config_dir / filename for filename in definition_filenames)
+    if base_dir_user_config:
+        user_dir = Path(base_dir_user_config)
+        paths.append(user_dir / Configuration.USER_SETTINGS_FILENAME)
+        paths.extend(
+            user_dir / Configuration.USER_CONFIG_SUBDIR_NAME / filename
+            for filename in definition_filenames
+        )
+    return paths
+
 # Global save/load functions for individual files are refactored to be methods
 # of the Configuration class or called by them, using instance paths.
 
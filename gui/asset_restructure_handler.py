@@ -65,19 +65,15 @@ class AssetRestructureHandler(QObject):
 
         # 1. Find existing target parent AssetRule within the same SourceRule
         if effective_new_target_name:
-            for i, asset in enumerate(source_rule.assets):
+            for asset in source_rule.assets:
                 if asset.asset_name == effective_new_target_name:
                     target_parent_asset = asset
-                    # Get QModelIndex for the target parent AssetRule
-                    try:
-                        source_rule_row = self.model._source_rules.index(source_rule)
-                        source_rule_index = self.model.createIndex(source_rule_row, 0, source_rule)
-                        target_parent_index = self.model.index(i, 0, source_rule_index) # QModelIndex for the target AssetRule
-                        if not target_parent_index.isValid():
-                             log.error(f"Handler: Failed to create valid QModelIndex for existing target parent '{effective_new_target_name}'.")
-                             target_parent_asset = None # Reset if index is invalid
-                    except ValueError:
-                         log.error(f"Handler: Could not find SourceRule index while looking for target parent '{effective_new_target_name}'.")
+                    # Get QModelIndex for the target parent AssetRule from the model's cached rows
+                    found_index = self.model.findIndexForItem(asset)
+                    if found_index is not None and found_index.isValid():
+                        target_parent_index = found_index # QModelIndex for the target AssetRule
+                    else:
+                         log.error(f"Handler: Failed to create valid QModelIndex for existing target parent '{effective_new_target_name}'.")
                          target_parent_asset = None # Reset if index is invalid
                     break
 
@@ -147,40 +143,12 @@ class AssetRestructureHandler(QObject):
         Helper to find the QModelIndex for a given FileRule or AssetRule item.
         Returns a valid QModelIndex or QModelIndex() if not found/invalid.
         """
-        if isinstance(item_to_find, FileRule):
-            parent_asset = getattr(item_to_find, 'parent_asset', None)
-            if not parent_asset: return QModelIndex()
-            source_rule = getattr(parent_asset, 'parent_source', None)
-            if not source_rule: return QModelIndex()
-
-            try:
-                source_rule_row = self.model._source_rules.index(source_rule)
-                source_rule_index = self.model.createIndex(source_rule_row, 0, source_rule)
-                if not source_rule_index.isValid(): return QModelIndex()
-
-                parent_asset_row = source_rule.assets.index(parent_asset)
-                parent_asset_index = self.model.index(parent_asset_row, 0, source_rule_index)
-                if not parent_asset_index.isValid(): return QModelIndex()
-
-                item_row = parent_asset.files.index(item_to_find)
-                return self.model.index(item_row, 0, parent_asset_index)
-            except ValueError:
-                log.error(f"Error finding item {item_to_find} in model hierarchy during QModelIndex reconstruction.")
-                return QModelIndex()
-
-        elif isinstance(item_to_find, AssetRule):
-            source_rule = getattr(item_to_find, 'parent_source', None)
-            if not source_rule: return QModelIndex()
-            try:
-                source_rule_row = self.model._source_rules.index(source_rule)
-                source_rule_index = self.model.createIndex(source_rule_row, 0, source_rule)
-                if not source_rule_index.isValid(): return QModelIndex()
-
-                item_row = source_rule.assets.index(item_to_find)
-                return self.model.index(item_row, 0, source_rule_index)
-            except ValueError:
-                log.error(f"Error finding asset {item_to_find.asset_name} in model hierarchy during QModelIndex reconstruction.")
-                return QModelIndex()
+        if isinstance(item_to_find, (FileRule, AssetRule)):
+            # The model resolves rows from the cached _row of each level
+            found_index = self.model.findIndexForItem(item_to_find)
+            if found_index is not None and found_index.isValid():
+                return found_index
+            log.error(f"Error finding item {item_to_find} in model hierarchy during QModelIndex reconstruction.")
         return QModelIndex()
 
     @Slot(AssetRule, str, QModelIndex)
@@ -1,6 +1,9 @@
 import sys
+import dataclasses
+from collections import deque
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QLabel, QLineEdit,
-                               QFormLayout, QComboBox, QCheckBox, QSpinBox, QDoubleSpinBox)
+                               QFormLayout, QComboBox, QCheckBox, QSpinBox, QDoubleSpinBox,
+                               QScrollArea, QFrame)
 from PySide6.QtCore import Signal, Slot, QObject
 
 
@@ -24,15 +27,24 @@ class RuleEditorWidget(QWidget):
          self.file_types = file_types if file_types else []
          self.current_rule_type = None
          self.current_rule_object = None
+         # Fields queued by load_rule but not yet turned into widgets (label_text, attr_name, attr_value)
+         self._pending_fields = deque()
+         # Live signal connections per editor widget, so reconnecting never stacks duplicate slots
+         self._connections = {}
  
          self.layout = QVBoxLayout(self)
          self.rule_type_label = QLabel("Select an item in the hierarchy to view/edit rules.")
          self.layout.addWidget(self.rule_type_label)
  
-         self.form_layout = QFormLayout()
-         self.layout.addLayout(self.form_layout)
- 
-         self.layout.addStretch() # Add stretch to push content to the top
+         # The form lives inside a scroll area so rows below the viewport can be created lazily
+         self.scroll_area = QScrollArea()
+         self.scroll_area.setWidgetResizable(True)
+         self.scroll_area.setFrameShape(QFrame.NoFrame)
+         self.form_container = QWidget()
+         self.form_layout = QFormLayout(self.form_container)
+         self.scroll_area.setWidget(self.form_container)
+         self.layout.addWidget(self.scroll_area)
+         self.scroll_area.verticalScrollBar().valueChanged.connect(self._materialize_visible_fields)
  
          self.setLayout(self.layout)
          self.clear_editor()
@@ -52,16 +64,59 @@ class RuleEditorWidget(QWidget):
          self.rule_type_label.setText(f"Editing: {rule_type_name}")
  
          if rule_object:
-             # Dynamically create form fields based on rule object attributes
-             for attr_name, attr_value in vars(rule_object).items():
+             field_labels = self._get_field_labels(type(rule_object))
+             # Queue form fields based on rule object attributes; widgets are created once visible.
+             # Rules are slotted dataclasses without a __dict__, so their fields are listed explicitly.
+             if dataclasses.is_dataclass(rule_object):
+                 attributes = ((field.name, getattr(rule_object, field.name)) for field in dataclasses.fields(rule_object))
+             else:
+                 attributes = vars(rule_object).items()
+             for attr_name, attr_value in attributes:
                  if attr_name.startswith('_'): # Skip private attributes
                      continue
  
-                 label = QLabel(attr_name.replace('_', ' ').title() + ":")
-                 editor_widget = self._create_editor_widget(attr_name, attr_value)
-                 if editor_widget:
-                     self.form_layout.addRow(label, editor_widget)
-                     self._connect_editor_signal(editor_widget, attr_name)
+                 label_text = field_labels.get(attr_name)
+                 if label_text is None:
+                     label_text = field_labels[attr_name] = attr_name.replace('_', ' ').title() + ":"
+                 self._pending_fields.append((label_text, attr_name, attr_value))
+             self._materialize_visible_fields()
+ 
+     @staticmethod
+     def _get_field_labels(rule_class):
+         """
+         Returns the attribute-name -> label-text cache stored on a rule class,
+         creating it on first use. Labels are filled in as attributes are seen.
+         """
+         field_labels = rule_class.__dict__.get('_afw_field_labels')
+         if field_labels is None:
+             field_labels = {}
+             rule_class._afw_field_labels = field_labels
+         return field_labels
+ 
+     def _materialize_visible_fields(self, *_):
+         """
+         Creates editor rows for queued fields until the form extends one viewport
+         beyond the currently visible area, so scrolling always has room to reveal more.
+         """
+         if not self._pending_fields:
+             return
+         scroll_bar = self.scroll_area.verticalScrollBar()
+         viewport_height = self.scroll_area.viewport().height()
+         fill_limit = scroll_bar.value() + 2 * viewport_height
+         # sizeHint reflects the cumulative height of the rows created so far
+         while self._pending_fields and self.form_container.sizeHint().height() <= fill_limit:
+             label_text, attr_name, attr_value = self._pending_fields.popleft()
+             editor_widget = self._create_editor_widget(attr_name, attr_value)
+             if editor_widget:
+                 self.form_layout.addRow(QLabel(label_text), editor_widget)
+                 self._connect_editor_signal(editor_widget, attr_name)
+ 
+     def resizeEvent(self, event):
+         """
+         Materializes additional rows when the widget grows and exposes more of the form.
+         """
+         super().resizeEvent(event)
+         self._materialize_visible_fields()
  
      def _create_editor_widget(self, attr_name, attr_value):
          """
@@ -116,18 +171,34 @@ class RuleEditorWidget(QWidget):
      def _connect_editor_signal(self, editor_widget, attr_name):
          """
          Connects the appropriate signal of the editor widget to the update logic.
+         Any connection previously made for the same widget is dropped first.
          """
+         self._disconnect_editor_signal(editor_widget)
          if isinstance(editor_widget, QLineEdit):
-             editor_widget.textChanged.connect(lambda text: self._update_rule_attribute(attr_name, text))
+             connection = editor_widget.textChanged.connect(lambda text: self._update_rule_attribute(attr_name, text))
          elif isinstance(editor_widget, QCheckBox):
-             editor_widget.toggled.connect(lambda checked: self._update_rule_attribute(attr_name, checked))
+             connection = editor_widget.toggled.connect(lambda checked: self._update_rule_attribute(attr_name, checked))
          elif isinstance(editor_widget, QSpinBox):
-             editor_widget.valueChanged.connect(lambda value: self._update_rule_attribute(attr_name, value))
+             connection = editor_widget.valueChanged.connect(lambda value: self._update_rule_attribute(attr_name, value))
          elif isinstance(editor_widget, QDoubleSpinBox):
-             editor_widget.valueChanged.connect(lambda value: self._update_rule_attribute(attr_name, value))
+             connection = editor_widget.valueChanged.connect(lambda value: self._update_rule_attribute(attr_name, value))
          elif isinstance(editor_widget, QComboBox):
              # Use currentTextChanged to get the string value directly
-             editor_widget.currentTextChanged.connect(lambda text: self._update_rule_attribute(attr_name, text))
+             connection = editor_widget.currentTextChanged.connect(lambda text: self._update_rule_attribute(attr_name, text))
+         else:
+             return
+         self._connections[editor_widget] = connection
+ 
+     def _disconnect_editor_signal(self, editor_widget):
+         """
+         Removes the tracked connection for an editor widget, if there is one.
+         """
+         connection = self._connections.pop(editor_widget, None)
+         if connection is not None:
+             try:
+                 QObject.disconnect(connection)
+             except (TypeError, RuntimeError):
+                 pass # Widget already destroyed or connection already gone
  
      def _update_rule_attribute(self, attr_name, value):
          """
@@ -160,6 +231,9 @@ class RuleEditorWidget(QWidget):
          """
          self.current_rule_object = None
          self.current_rule_type = None
+         self._pending_fields.clear()
+         for editor_widget in list(self._connections):
+             self._disconnect_editor_signal(editor_widget)
          self.rule_type_label.setText("Select an item in the hierarchy to view/edit rules.")
          while self.form_layout.rowCount() > 0:
              self.form_layout.removeRow(0)
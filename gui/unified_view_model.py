@@ -1,12 +1,93 @@
 # gui/unified_view_model.py
 import logging
+import os
 log = logging.getLogger(__name__)
-from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt, Signal, Slot, QMimeData, QByteArray, QDataStream, QIODevice
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt, Signal, Slot, QMimeData, QByteArray
 from PySide6.QtGui import QColor
 from pathlib import Path
+from collections import defaultdict
 from rule_structure import SourceRule, AssetRule, FileRule
-from configuration import load_base_config
+from configuration import load_base_config, get_base_config_source_paths
 from typing import List
+import functools
+import struct
+import uuid
+
+# Qt roles/flags and column numbers bound once at module level; data()/setData()/flags()
+# run for every visible cell on each repaint, so they avoid the Qt.* attribute chains.
+_DisplayRole = Qt.DisplayRole
+_EditRole = Qt.EditRole
+_BackgroundRole = Qt.BackgroundRole
+_ForegroundRole = Qt.ForegroundRole
+_DISPLAY_EDIT_ROLES = [_DisplayRole, _EditRole]
+_ITEM_TYPE_CHANGED_ROLES = (_DisplayRole, _EditRole, _BackgroundRole)
+_NoItemFlags = Qt.NoItemFlags
+_BASE_ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+_ItemIsEditable = Qt.ItemIsEditable
+_ItemIsDragEnabled = Qt.ItemIsDragEnabled
+_ItemIsDropEnabled = Qt.ItemIsDropEnabled
+
+_COL_NAME = 0
+_COL_TARGET_ASSET = 1
+_COL_SUPPLIER = 2
+_COL_ASSET_TYPE = 3
+_COL_ITEM_TYPE = 4
+
+def _definitions_cache_key() -> tuple:
+    """Returns (path, mtime_ns) for every base config source file; mtime is None for missing files."""
+    key = []
+    for path in get_base_config_source_paths():
+        try:
+            key.append((str(path), path.stat().st_mtime_ns))
+        except OSError:
+            key.append((str(path), None))
+    return tuple(key)
+
+@functools.lru_cache(maxsize=1)
+def _get_cached_definitions(config_mtime_key: tuple):
+    """
+    Parses the asset/file type definitions from the base config into sorted type keys and colors.
+    Cached at module level so every UnifiedViewModel shares one parse; `config_mtime_key` comes
+    from _definitions_cache_key(), so definitions edited on disk are picked up by the next model.
+
+    Returns:
+        (asset_type_keys, asset_type_colors, file_bg_colors, file_type_keys, file_type_colors)
+    """
+    base_config = load_base_config()
+    asset_type_defs = base_config.get('ASSET_TYPE_DEFINITIONS', {})
+    file_type_defs = base_config.get('FILE_TYPE_DEFINITIONS', {})
+
+    # Asset Type Definitions (Keys and Colors). FileRule rows use their parent asset's
+    # color darkened by ~30% (factor 130), built in the same pass.
+    asset_type_keys = sorted(list(asset_type_defs.keys()))
+    asset_type_colors, file_bg_colors = _build_color_maps(asset_type_defs, "asset type", darker_factor=130)
+
+    # File Type Definitions (Keys and Colors)
+    file_type_keys = sorted(list(file_type_defs.keys()))
+    file_type_colors, _ = _build_color_maps(file_type_defs, "file type")
+
+    return asset_type_keys, asset_type_colors, file_bg_colors, file_type_keys, file_type_colors
+
+def _build_color_maps(type_defs: dict, kind: str, darker_factor: int | None = None):
+    """
+    Builds {type_name: QColor} from the 'color' entries of a definitions dict in a single pass,
+    plus {type_name: QColor.darker(darker_factor)} when a factor is given (otherwise empty).
+    QColor does not raise on bad input, so invalid colors are detected with isValid() and skipped.
+    """
+    colors = {}
+    darker_colors = {}
+    for type_name, type_info in type_defs.items():
+        hex_color = type_info.get("color")
+        if not hex_color:
+            continue
+        color = QColor(hex_color)
+        if not color.isValid():
+            log.warning(f"Invalid hex color '{hex_color}' for {kind} '{type_name}' in config.")
+            continue
+        colors[type_name] = color
+        if darker_factor is not None:
+            darker_colors[type_name] = color.darker(darker_factor)
+    return colors, darker_colors
 
 class CustomRoles:
     MapTypeRole = Qt.UserRole + 1
@@ -35,58 +116,47 @@ class UnifiedViewModel(QAbstractItemModel):
         "Asset Type", "Item Type"
     ]
 
-    COL_NAME = 0
-    COL_TARGET_ASSET = 1
-    COL_SUPPLIER = 2
-    COL_ASSET_TYPE = 3
-    COL_ITEM_TYPE = 4
+    COL_NAME = _COL_NAME
+    COL_TARGET_ASSET = _COL_TARGET_ASSET
+    COL_SUPPLIER = _COL_SUPPLIER
+    COL_ASSET_TYPE = _COL_ASSET_TYPE
+    COL_ITEM_TYPE = _COL_ITEM_TYPE
     # COL_STATUS = 5 # Removed
     # COL_OUTPUT_PATH = 6 # Removed
 
     # --- Drag and Drop MIME Type ---
     MIME_TYPE = "application/x-filerule-index-list"
+    # In-process drags also carry a token resolving to the dragged FileRule objects
+    DRAG_TOKEN_MIME_TYPE = "application/x-filerule-drag-token"
+    # (token, [FileRule, ...]) of the most recent drag started from any model in this process
+    _drag_payload = None
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._source_rules = []
+        # input_path -> SourceRule (first rule per path, its row is the rule's cached _row)
+        self._source_by_path = {}
+        # Inverted index: target_asset_name_override -> {id(FileRule): FileRule}
+        self._override_index = defaultdict(dict)
         # self._display_mode removed
         self._asset_type_colors = {}
+        self._file_bg_colors = {}
         self._file_type_colors = {}
         self._asset_type_keys = []
         self._file_type_keys = []
         self._load_definitions()
+        self._data_dispatch = self._build_data_dispatch()
 
     def _load_definitions(self):
-        """Loads configuration and caches colors and type keys."""
+        """Loads configuration and caches colors and type keys (shared across model instances)."""
         try:
-            base_config = load_base_config()
-            asset_type_defs = base_config.get('ASSET_TYPE_DEFINITIONS', {})
-            file_type_defs = base_config.get('FILE_TYPE_DEFINITIONS', {})
-
-            # Cache Asset Type Definitions (Keys and Colors)
-            self._asset_type_keys = sorted(list(asset_type_defs.keys()))
-            for type_name, type_info in asset_type_defs.items():
-                hex_color = type_info.get("color")
-                if hex_color:
-                    try:
-                        self._asset_type_colors[type_name] = QColor(hex_color)
-                    except ValueError:
-                        log.warning(f"Invalid hex color '{hex_color}' for asset type '{type_name}' in config.")
-
-            # Cache File Type Definitions (Keys and Colors)
-            self._file_type_keys = sorted(list(file_type_defs.keys()))
-            for type_name, type_info in file_type_defs.items():
-                hex_color = type_info.get("color")
-                if hex_color:
-                    try:
-                        self._file_type_colors[type_name] = QColor(hex_color)
-                    except ValueError:
-                        log.warning(f"Invalid hex color '{hex_color}' for file type '{type_name}' in config.")
-
+            (self._asset_type_keys, self._asset_type_colors, self._file_bg_colors,
+             self._file_type_keys, self._file_type_colors) = _get_cached_definitions(_definitions_cache_key())
         except Exception as e:
             log.exception(f"Error loading or caching colors from configuration: {e}")
             # Ensure caches/lists are empty if loading fails
             self._asset_type_colors = {}
+            self._file_bg_colors = {}
             self._file_type_colors = {}
             self._asset_type_keys = []
             self._file_type_keys = []
@@ -97,18 +167,121 @@ class UnifiedViewModel(QAbstractItemModel):
         # self._load_and_cache_colors() # Uncomment if config can change and needs refresh
         self.beginResetModel()
         self._source_rules = source_rules_list if source_rules_list else []
-        # Ensure back-references for parent lookup are set on the NEW items
-        for source_rule in self._source_rules:
-            for asset_rule in source_rule.assets:
-                asset_rule.parent_source = source_rule
-                for file_rule in asset_rule.files:
-                    file_rule.parent_asset = asset_rule
+        self._source_by_path = {}
+        self._override_index = defaultdict(dict)
+        # Ensure back-references and cached rows for parent lookup are set on the NEW items
+        for row, source_rule in enumerate(self._source_rules):
+            self._attach_source_rule(source_rule, row)
         self.endResetModel()
 
+    def _attach_source_rule(self, source_rule: SourceRule, row: int):
+        """Sets the cached row, display name and parent back-references for a SourceRule and its whole subtree."""
+        source_rule._row = row
+        source_rule._name_cache = Path(source_rule.input_path).name if source_rule.input_path is not None else ""
+        # setdefault keeps the first rule for a path, like a front-to-back scan would
+        self._source_by_path.setdefault(source_rule.input_path, source_rule)
+        for asset_row, asset_rule in enumerate(source_rule.assets):
+            self._attach_asset_rule(asset_rule, source_rule, asset_row)
+
+    def _attach_asset_rule(self, asset_rule: AssetRule, source_rule: SourceRule, row: int):
+        """Sets the cached row and parent back-references for an AssetRule and its FileRules."""
+        asset_rule._row = row
+        asset_rule.parent_source = source_rule
+        self._refresh_effective_asset_type(asset_rule)
+        # Bulk path for loading large trees: the per-file work of _attach_file_rule is
+        # inlined here with local aliases, avoiding three method calls per FileRule.
+        basename = os.path.basename
+        override_index = self._override_index
+        for file_row, file_rule in enumerate(asset_rule.files):
+            file_rule._row = file_row
+            file_rule.parent_asset = asset_rule
+            file_path = file_rule.file_path
+            file_rule._name_cache = basename(file_path) if file_path is not None else ""
+            item_type_override = file_rule.item_type_override
+            file_rule._effective_item_type = item_type_override if item_type_override is not None else file_rule.item_type
+            target_override = file_rule.target_asset_name_override
+            if target_override is not None:
+                override_index[target_override][id(file_rule)] = file_rule
+
+    def _attach_file_rule(self, file_rule: FileRule, asset_rule: AssetRule, row: int):
+        """Sets the cached row, display name and parent back-reference for a FileRule and indexes its override."""
+        file_rule._row = row
+        file_rule.parent_asset = asset_rule
+        file_rule._name_cache = os.path.basename(file_rule.file_path) if file_rule.file_path is not None else ""
+        self._refresh_effective_item_type(file_rule)
+        self._index_file_override(file_rule)
+
+    @staticmethod
+    def _refresh_effective_asset_type(asset_rule: AssetRule):
+        """Recomputes the cached effective asset type (override if set, else predicted type)."""
+        asset_rule._effective_asset_type = asset_rule.asset_type_override if asset_rule.asset_type_override else asset_rule.asset_type
+
+    @staticmethod
+    def _refresh_effective_item_type(file_rule: FileRule):
+        """Recomputes the cached effective item type (override if not None, else classified type)."""
+        file_rule._effective_item_type = file_rule.item_type_override if file_rule.item_type_override is not None else file_rule.item_type
+
+    def _index_file_override(self, file_rule: FileRule):
+        """Registers a FileRule under its current target_asset_name_override in the override index."""
+        override = file_rule.target_asset_name_override
+        if override is not None:
+            self._override_index[override][id(file_rule)] = file_rule
+
+    def _unindex_file_override(self, file_rule: FileRule):
+        """Removes a FileRule from the override index bucket of its current target_asset_name_override."""
+        bucket = self._override_index.get(file_rule.target_asset_name_override)
+        if bucket is not None:
+            bucket.pop(id(file_rule), None)
+            if not bucket:
+                del self._override_index[file_rule.target_asset_name_override]
+
+    def _set_file_override(self, file_rule: FileRule, new_value):
+        """Sets a FileRule's target_asset_name_override, keeping the override index in step."""
+        self._unindex_file_override(file_rule)
+        file_rule.target_asset_name_override = new_value
+        self._index_file_override(file_rule)
+
+    @staticmethod
+    def _cached_row(children: list, item):
+        """Returns the item's cached _row if it still points at the item within `children`, else None."""
+        row = item._row
+        if row is not None and row < len(children) and children[row] is item:
+            return row
+        return None
+
+    @staticmethod
+    def _insert_child(children: list, row: int, item):
+        """Inserts a rule into a child list at `row` and renumbers the cached _row of the shifted suffix."""
+        children.insert(row, item)
+        for child_row in range(row, len(children)):
+            children[child_row]._row = child_row
+
+    @staticmethod
+    def _pop_child(children: list, row: int):
+        """Removes and returns the rule at `row` of a child list, renumbering the cached _row of the suffix."""
+        item = children.pop(row)
+        for child_row in range(row, len(children)):
+            children[child_row]._row = child_row
+        return item
+
+    def _reindex_assets(self, source_rule: SourceRule, start: int = 0):
+        """Renumbers the cached _row of a SourceRule's assets from `start` after an insert/remove."""
+        assets = source_rule.assets
+        for row in range(start, len(assets)):
+            assets[row]._row = row
+
+    def _reindex_files(self, asset_rule: AssetRule, start: int = 0):
+        """Renumbers the cached _row of an AssetRule's files from `start` after an insert/remove."""
+        files = asset_rule.files
+        for row in range(start, len(files)):
+            files[row]._row = row
+
     def clear_data(self):
         """Clears the model data."""
         self.beginResetModel()
         self._source_rules = []
+        self._source_by_path = {}
+        self._override_index = defaultdict(dict)
         self.endResetModel()
 
     def get_all_source_rules(self) -> list:
@@ -151,34 +324,20 @@ class UnifiedViewModel(QAbstractItemModel):
              # Parent is the invisible root
              return QModelIndex()
         elif isinstance(child_item, AssetRule):
-             # Parent is a SourceRule. Find its row in the _source_rules list.
-             parent_item = getattr(child_item, 'parent_source', None)
-             if parent_item and parent_item in self._source_rules:
-                 try:
-                     parent_row = self._source_rules.index(parent_item)
-                     return self.createIndex(parent_row, 0, parent_item)
-                 except ValueError:
-                      return QModelIndex() # Should not happen if parent_source is correct
+             # Parent is a SourceRule. Its row is cached on the rule itself.
+             parent_item = child_item.parent_source
+             if parent_item is not None:
+                 return self.createIndex(parent_item._row, 0, parent_item)
              else:
-                 return QModelIndex() # Parent SourceRule not found or reference missing
+                 return QModelIndex() # Parent SourceRule reference or cached row missing
 
         elif isinstance(child_item, FileRule):
-            # Parent is an AssetRule. Find its row within its parent SourceRule.
-            parent_item = getattr(child_item, 'parent_asset', None)
-            if parent_item:
-                 grandparent_item = getattr(parent_item, 'parent_source', None)
-                 if grandparent_item:
-                     try:
-                         parent_row = grandparent_item.assets.index(parent_item)
-                         # We need the index of the grandparent (SourceRule) to create the parent index
-                         grandparent_row = self._source_rules.index(grandparent_item)
-                         return self.createIndex(parent_row, 0, parent_item)
-                     except ValueError:
-                         return QModelIndex() # Parent AssetRule or Grandparent SourceRule not found in respective lists
-                 else:
-                      return QModelIndex() # Grandparent (SourceRule) reference missing
+            # Parent is an AssetRule. Its row within its SourceRule is cached on the rule itself.
+            parent_item = child_item.parent_asset
+            if parent_item is not None:
+                 return self.createIndex(parent_item._row, 0, parent_item)
             else:
-                 return QModelIndex() # Parent AssetRule reference missing
+                 return QModelIndex() # Parent AssetRule reference or cached row missing
 
         return QModelIndex() # Should not be reached
 
@@ -204,113 +363,99 @@ class UnifiedViewModel(QAbstractItemModel):
         if isinstance(parent_item, SourceRule):
             if row < len(parent_item.assets):
                 child_item = parent_item.assets[row]
-                if not hasattr(child_item, 'parent_source'):
+                if child_item.parent_source is None:
                      child_item.parent_source = parent_item
+                     child_item._row = row
         elif isinstance(parent_item, AssetRule):
             if row < len(parent_item.files):
                 child_item = parent_item.files[row]
-                if not hasattr(child_item, 'parent_asset'):
+                if child_item.parent_asset is None:
                     child_item.parent_asset = parent_item
+                    child_item._row = row
 
         if child_item:
             return self.createIndex(row, column, child_item)
         else:
             return QModelIndex()
 
+    def _build_data_dispatch(self) -> dict:
+        """
+        Builds the (item type, role, column) -> handler table used by data().
+        Roles that apply to every column (Background/Foreground) are expanded
+        across all columns so data() only ever needs a single lookup.
+        """
+        def source_supplier(item):
+            display_value = item.supplier_override if item.supplier_override is not None else item.supplier_identifier
+            return display_value if display_value is not None else ""
+
+        def asset_type_display(item):
+            return item._effective_asset_type or ""
+
+        def file_target_asset(item):
+            return item.target_asset_name_override if item.target_asset_name_override is not None else ""
+
+        def file_item_type_display(item):
+            return item._effective_item_type or ""
+
+        def asset_background(item):
+            # Use cached color for the cached effective asset type
+            asset_type = item._effective_asset_type
+            return self._asset_type_colors.get(asset_type) if asset_type else None
+
+        def file_background(item):
+            # Precomputed darkened parent background
+            parent_asset = item.parent_asset
+            if parent_asset is None:
+                return None # Should not happen if structure is correct, fallback to default
+            parent_asset_type = parent_asset._effective_asset_type
+            # No parent color means default background
+            return self._file_bg_colors.get(parent_asset_type) if parent_asset_type else None
+
+        def file_foreground(item):
+            # Use cached color for the cached effective item type
+            effective_item_type = item._effective_item_type
+            return self._file_type_colors.get(effective_item_type) if effective_item_type else None
+
+        display, edit = _DisplayRole, _EditRole
+        dispatch = {
+            # SourceRule: Display and Edit share values
+            (SourceRule, display, _COL_NAME): lambda item: item._name_cache,
+            (SourceRule, edit, _COL_NAME): lambda item: item._name_cache,
+            (SourceRule, display, _COL_SUPPLIER): source_supplier,
+            (SourceRule, edit, _COL_SUPPLIER): source_supplier,
+            # AssetRule
+            (AssetRule, display, _COL_NAME): lambda item: item.asset_name,
+            (AssetRule, display, _COL_ASSET_TYPE): asset_type_display,
+            (AssetRule, edit, _COL_NAME): lambda item: item.asset_name,
+            (AssetRule, edit, _COL_ASSET_TYPE): lambda item: item.asset_type_override,
+            # FileRule
+            (FileRule, display, _COL_NAME): lambda item: item._name_cache,
+            (FileRule, display, _COL_TARGET_ASSET): file_target_asset,
+            (FileRule, display, _COL_ITEM_TYPE): file_item_type_display,
+            (FileRule, edit, _COL_TARGET_ASSET): file_target_asset,
+            (FileRule, edit, _COL_ITEM_TYPE): lambda item: item.item_type_override,
+        }
+        # SourceRule and AssetRule have no ForegroundRole entry: the lookup misses and
+        # data() returns None (default text color) without any per-call type check
+        for column in range(len(self.Columns)):
+            dispatch[(SourceRule, _BackgroundRole, column)] = lambda item: self.SOURCE_RULE_COLOR
+            dispatch[(AssetRule, _BackgroundRole, column)] = asset_background
+            dispatch[(FileRule, _BackgroundRole, column)] = file_background
+            dispatch[(FileRule, _ForegroundRole, column)] = file_foreground
+        return dispatch
+
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
         """Returns the data stored under the given role for the item referred to by the index."""
         if not index.isValid():
             return None
 
         item = index.internalPointer()
-        column = index.column()
-
-        # --- Handle Background Role ---
-        if role == Qt.BackgroundRole:
-            if isinstance(item, SourceRule):
-                return self.SOURCE_RULE_COLOR
-            elif isinstance(item, AssetRule):
-                # Determine effective asset type
-                asset_type = item.asset_type_override if item.asset_type_override else item.asset_type
-                if asset_type:
-                    # Use cached color
-                    return self._asset_type_colors.get(asset_type)
-                else:
-                    return None # Fallback if no asset_type determined
-            elif isinstance(item, FileRule):
-                # --- New Logic: Darkened Parent Background ---
-                parent_asset = getattr(item, 'parent_asset', None)
-                if parent_asset:
-                    parent_asset_type = parent_asset.asset_type_override if parent_asset.asset_type_override else parent_asset.asset_type
-                    parent_bg_color = self._asset_type_colors.get(parent_asset_type) if parent_asset_type else None
-
-                    if parent_bg_color:
-                        # Darken the parent color by ~30% (factor 130)
-                        return parent_bg_color.darker(130)
-                    else:
-                        # Parent has no specific color, use default background
-                        return None
-                else:
-                    # Should not happen if structure is correct, but fallback to default
-                    return None
-                # --- End New Logic ---
-            else:
-                return None
-        # --- Handle Foreground Role (Text Color) ---
-        elif role == Qt.ForegroundRole:
-            if isinstance(item, FileRule):
-                # Determine effective item type
-                effective_item_type = item.item_type_override if item.item_type_override is not None else item.item_type
-                if effective_item_type:
-                    # Use cached color for text
-                    return self._file_type_colors.get(effective_item_type)
-            # For SourceRule and AssetRule, return None to use default text color (usually contrasts well)
-            return None
-
-        # --- Handle other roles (Display, Edit, etc.) ---
-        if isinstance(item, SourceRule):
-            if role == Qt.DisplayRole or role == Qt.EditRole:
-                if column == self.COL_NAME:
-                    return Path(item.input_path).name
-                elif column == self.COL_SUPPLIER:
-                    display_value = item.supplier_override if item.supplier_override is not None else item.supplier_identifier
-                    return display_value if display_value is not None else ""
-            return None # Other columns/roles are blank for SourceRule
-
-        # --- Logic for AssetRule and FileRule (previously detailed mode only) ---
-        elif isinstance(item, AssetRule):
-            if role == Qt.DisplayRole:
-                if column == self.COL_NAME: return item.asset_name
-                elif column == self.COL_ASSET_TYPE:
-                    display_value = item.asset_type_override if item.asset_type_override is not None else item.asset_type
-                    return display_value if display_value else ""
-            elif role == Qt.EditRole:
-                 if column == self.COL_NAME:
-                     return item.asset_name
-                 elif column == self.COL_ASSET_TYPE:
-                     return item.asset_type_override
-            return None
-
-        elif isinstance(item, FileRule):
-            if role == Qt.DisplayRole:
-                if column == self.COL_NAME: return Path(item.file_path).name
-                elif column == self.COL_TARGET_ASSET:
-                    return item.target_asset_name_override if item.target_asset_name_override is not None else ""
-                elif column == self.COL_ITEM_TYPE:
-                    override = item.item_type_override
-                    initial_type = item.item_type
-                    if override is not None: return override
-                    else: return initial_type if initial_type else ""
-            elif role == Qt.EditRole:
-                if column == self.COL_TARGET_ASSET: return item.target_asset_name_override if item.target_asset_name_override is not None else ""
-                elif column == self.COL_ITEM_TYPE: return item.item_type_override
-            return None
-
-        return None
+        handler = self._data_dispatch.get((type(item), role, index.column()))
+        return handler(item) if handler is not None else None
 
     def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
         """Sets the role data for the item at index to value."""
-        if not index.isValid() or role != Qt.EditRole:
+        if not index.isValid() or role != _EditRole:
             return False
 
         item = index.internalPointer()
@@ -321,9 +466,10 @@ class UnifiedViewModel(QAbstractItemModel):
 
         # --- Handle different item types ---
         if isinstance(item, SourceRule):
-            if column == self.COL_SUPPLIER:
+            if column == _COL_SUPPLIER:
                 # Get the new value, strip whitespace, treat empty as None
-                log.debug(f"setData COL_SUPPLIER: Index=({index.row()},{column}), Value='{value}', Type={type(value)}")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(f"setData COL_SUPPLIER: Index=({index.row()},{column}), Value='{value}', Type={type(value)}")
                 new_value = str(value).strip() if value is not None and str(value).strip() else None
 
                 # Get the original identifier (assuming it exists on SourceRule)
@@ -339,7 +485,10 @@ class UnifiedViewModel(QAbstractItemModel):
                     changed = True
 
         elif isinstance(item, AssetRule):
-            if column == self.COL_NAME:
+            if column == _COL_NAME:
+                # Fast path: the editor handed back the very same (already normalized) name object
+                if value is item.asset_name:
+                    return False
                 new_asset_name = str(value).strip() if value else None
                 if not new_asset_name:
                     log.warning("setData: Asset name cannot be empty.")
@@ -349,13 +498,12 @@ class UnifiedViewModel(QAbstractItemModel):
                     return False
 
                 # --- Validation: Check for duplicates within the same SourceRule ---
-                parent_source = getattr(item, 'parent_source', None)
-                if parent_source:
-                    for existing_asset in parent_source.assets:
-                        if existing_asset.asset_name == new_asset_name and existing_asset is not item:
-                            log.warning(f"setData: Duplicate asset name '{new_asset_name}' detected within the same source. Aborting rename.")
-                            # Optionally, provide user feedback here via a signal or message box
-                            return False
+                parent_source = item.parent_source
+                if parent_source is not None:
+                    if any(existing_asset.asset_name == new_asset_name and existing_asset is not item for existing_asset in parent_source.assets):
+                        log.warning(f"setData: Duplicate asset name '{new_asset_name}' detected within the same source. Aborting rename.")
+                        # Optionally, provide user feedback here via a signal or message box
+                        return False
                 else:
                     log.error("setData: Cannot validate asset name, parent SourceRule not found.")
                     # Decide how to handle this - proceed cautiously or abort? Aborting is safer.
@@ -371,105 +519,134 @@ class UnifiedViewModel(QAbstractItemModel):
 
                 # --- Update Child FileRule Target Asset Overrides ---
                 log.debug(f"setData: Updating FileRule target overrides from '{old_asset_name}' to '{new_asset_name}'")
-                updated_file_indices = []
-                for src_idx, source_rule in enumerate(self._source_rules):
-                    source_rule_index = self.createIndex(src_idx, 0, source_rule)
-                    for asset_idx, asset_rule in enumerate(source_rule.assets):
-                        asset_rule_index = self.createIndex(asset_idx, 0, asset_rule)
-                        for file_idx, file_rule in enumerate(asset_rule.files):
-                            if file_rule.target_asset_name_override == old_asset_name:
-                                log.debug(f"  Updating target for file: {Path(file_rule.file_path).name}")
-                                file_rule.target_asset_name_override = new_asset_name
-                                # Get the correct index for the file rule to emit dataChanged
-                                file_rule_parent_index = self.parent(self.createIndex(file_idx, 0, file_rule))
-                                file_rule_index = self.index(file_idx, self.COL_TARGET_ASSET, file_rule_parent_index)
-                                if file_rule_index.isValid():
-                                    updated_file_indices.append(file_rule_index)
-                                else:
-                                     log.warning(f"  Could not get valid index for updated file rule target: {Path(file_rule.file_path).name}")
-
-
-                # Emit dataChanged for all updated file rules *after* the loop
-                for file_index in updated_file_indices:
-                    self.dataChanged.emit(file_index, file_index, [Qt.DisplayRole, Qt.EditRole])
+                # Updated file rows grouped per parent AssetRule (keyed by id, rules are unhashable)
+                updated_rows_by_asset = {}
+                # The override index hands us exactly the FileRules targeting the old name
+                renamed_files = self._override_index.pop(old_asset_name, None)
+                if renamed_files:
+                    self._override_index[new_asset_name].update(renamed_files)
+                    debug_enabled = log.isEnabledFor(logging.DEBUG)
+                    for file_rule in renamed_files.values():
+                        if debug_enabled:
+                            log.debug(f"  Updating target for file: {os.path.basename(file_rule.file_path)}")
+                        file_rule.target_asset_name_override = new_asset_name
+                        asset_rule = file_rule.parent_asset
+                        updated_rows_by_asset.setdefault(id(asset_rule), (asset_rule, []))[1].append(file_rule._row)
+
+                # Emit dataChanged for all updated file rules *after* the loop, one per contiguous run
+                for asset_rule, file_rows in updated_rows_by_asset.values():
+                    self._emit_file_rows_changed(asset_rule, file_rows, _COL_TARGET_ASSET, _DISPLAY_EDIT_ROLES)
                 # --- End Child Update ---
 
-            elif column == self.COL_ASSET_TYPE:
+            elif column == _COL_ASSET_TYPE:
+                if value is item.asset_type_override:
+                    return False # Same object as the current override: nothing to do
                 # Delegate provides string value (e.g., "Surface", "Model") or None
                 new_value = str(value) if value is not None else None
                 if new_value == "": new_value = None
                 # Update asset_type_override
                 if item.asset_type_override != new_value:
                     item.asset_type_override = new_value
+                    self._refresh_effective_asset_type(item)
                     changed = True
 
         elif isinstance(item, FileRule):
-            if column == self.COL_TARGET_ASSET:
+            if column == _COL_TARGET_ASSET:
+                if value is item.target_asset_name_override:
+                    return False # Same object as the current override: nothing to do
                 # Ensure value is string or None
                 new_value = str(value).strip() if value is not None else None
                 if new_value == "": new_value = None
                 # Update target_asset_name_override
                 if item.target_asset_name_override != new_value:
                     old_value = item.target_asset_name_override
-                    item.target_asset_name_override = new_value
+                    self._set_file_override(item, new_value)
                     changed = True
                     # Emit signal that the override changed, let handler deal with restructuring
                     # Pass the FileRule item itself, the new value, and the index
                     self.targetAssetOverrideChanged.emit(item, new_value, index)
-            elif column == self.COL_ITEM_TYPE:
+            elif column == _COL_ITEM_TYPE:
+                 if value is item.item_type_override:
+                     return False # Same object as the current override: nothing to do
                   # Delegate provides string value (e.g., "MAP_COL") or None
                  new_value = str(value) if value is not None else None
                  if new_value == "": new_value = None
                  # Update item_type_override
                  if item.item_type_override != new_value:
-                     log.debug(f"setData COL_ITEM_TYPE: File='{Path(item.file_path).name}', Original Override='{item.item_type_override}', New Value='{new_value}'")
+                     debug_enabled = log.isEnabledFor(logging.DEBUG)
+                     if debug_enabled:
+                         log.debug(f"setData COL_ITEM_TYPE: File='{os.path.basename(item.file_path)}', Original Override='{item.item_type_override}', New Value='{new_value}'")
                      old_override = item.item_type_override
                      item.item_type_override = new_value
+                     self._refresh_effective_item_type(item)
                      changed = True
 
                      # standard_map_type is no longer stored on FileRule.
                      # Remove the logic that updated it here.
                      pass
 
-                     log.debug(f"setData COL_ITEM_TYPE: File='{Path(item.file_path).name}', Final Override='{item.item_type_override}'")
+                     if debug_enabled:
+                         log.debug(f"setData COL_ITEM_TYPE: File='{os.path.basename(item.file_path)}', Final Override='{item.item_type_override}'")
 
 
         if changed:
             # Emit dataChanged for the specific index and affected roles
-            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+            self.dataChanged.emit(index, index, _DISPLAY_EDIT_ROLES)
             return True
 
         return False
 
+    def _emit_file_rows_changed(self, asset_rule: AssetRule, file_rows, column: int, roles: list):
+        """
+        Emits dataChanged for the given FileRule rows of an AssetRule in one column,
+        coalescing contiguous rows into a single topLeft/bottomRight emission.
+        """
+        if not file_rows:
+            return
+        files = asset_rule.files
+        rows = sorted(file_rows)
+        run_start = previous_row = rows[0]
+        for row in rows[1:] + [None]:
+            if row is not None and row == previous_row + 1:
+                previous_row = row
+                continue
+            top_left = self.createIndex(run_start, column, files[run_start])
+            bottom_right = self.createIndex(previous_row, column, files[previous_row])
+            self.dataChanged.emit(top_left, bottom_right, roles)
+            if row is not None:
+                run_start = previous_row = row
+
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:
         """Returns the item flags for the given index."""
         if not index.isValid():
-             return Qt.NoItemFlags
+             return _NoItemFlags
 
         # Start with default flags for a valid item
-        default_flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        default_flags = _BASE_ITEM_FLAGS
 
         item = index.internalPointer()
         if not item:
-            return Qt.NoItemFlags
+            return _NoItemFlags
         column = index.column()
+        # Exact type checks, matching the data() dispatch table (no MRO walk per cell)
+        item_class = type(item)
 
         can_edit = False
-        if isinstance(item, SourceRule):
-            if column == self.COL_SUPPLIER: can_edit = True
-        elif isinstance(item, AssetRule):
-            if column == self.COL_NAME: can_edit = True
-            if column == self.COL_ASSET_TYPE: can_edit = True
+        if item_class is SourceRule:
+            if column == _COL_SUPPLIER: can_edit = True
+        elif item_class is AssetRule:
+            if column == _COL_NAME: can_edit = True
+            if column == _COL_ASSET_TYPE: can_edit = True
             # AssetRule items can accept drops
-            default_flags |= Qt.ItemIsDropEnabled
-        elif isinstance(item, FileRule):
-            if column == self.COL_TARGET_ASSET: can_edit = True
-            if column == self.COL_ITEM_TYPE: can_edit = True
+            default_flags |= _ItemIsDropEnabled
+        elif item_class is FileRule:
+            if column == _COL_TARGET_ASSET: can_edit = True
+            if column == _COL_ITEM_TYPE: can_edit = True
             # FileRule items can be dragged
-            default_flags |= Qt.ItemIsDragEnabled
+            default_flags |= _ItemIsDragEnabled
 
         if can_edit:
-            default_flags |= Qt.ItemIsEditable
+            default_flags |= _ItemIsEditable
 
         return default_flags
         # Removed erroneous else block
@@ -507,41 +684,33 @@ class UnifiedViewModel(QAbstractItemModel):
             return
 
         log.info(f"UnifiedViewModel: Updating rules for {len(new_source_rules)} source(s).")
+        # Per-source/per-asset debug lines are only formatted when they will be emitted
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
 
         for new_source_rule in new_source_rules:
             source_path = new_source_rule.input_path
-            existing_source_rule = None
-            existing_source_row = -1
 
-            # 1. Find existing SourceRule in the model
-            for i, rule in enumerate(self._source_rules):
-                if rule.input_path == source_path:
-                    existing_source_rule = rule
-                    existing_source_row = i
-                    break
+            # 1. Find existing SourceRule in the model (maintained input_path lookup)
+            existing_source_rule = self._source_by_path.get(source_path)
 
             if existing_source_rule is None:
                 # 2. Add New SourceRule if not found
-                log.debug(f"Adding new SourceRule for '{source_path}'")
-                # Ensure parent references are set within the new rule hierarchy
-                for asset_rule in new_source_rule.assets:
-                    asset_rule.parent_source = new_source_rule
-                    for file_rule in asset_rule.files:
-                        file_rule.parent_asset = asset_rule
-
+                if debug_enabled:
+                    log.debug(f"Adding new SourceRule for '{source_path}'")
                 # Add to model's internal list and emit signal
                 insert_row = len(self._source_rules)
+                # Ensure parent references and cached rows are set within the new rule hierarchy
+                self._attach_source_rule(new_source_rule, insert_row)
                 self.beginInsertRows(QModelIndex(), insert_row, insert_row)
                 self._source_rules.append(new_source_rule)
                 self.endInsertRows()
                 continue
 
             # 3. Merge Existing SourceRule
-            log.debug(f"Merging SourceRule for '{source_path}'")
-            existing_source_index = self.createIndex(existing_source_row, 0, existing_source_rule)
-            if not existing_source_index.isValid():
-                log.error(f"Could not create valid index for existing SourceRule: {source_path}. Skipping.")
-                continue
+            existing_source_row = existing_source_rule._row
+            if debug_enabled:
+                log.debug(f"Merging SourceRule for '{source_path}'")
+            # Indexes are only built where Qt needs them (dataChanged / begin*Rows), from the cached rows
 
             # Update non-override SourceRule fields (e.g., supplier identifier if needed)
             if existing_source_rule.supplier_identifier != new_source_rule.supplier_identifier:
@@ -563,109 +732,149 @@ class UnifiedViewModel(QAbstractItemModel):
             # --- Merge AssetRules ---
             existing_assets_dict = {asset.asset_name: asset for asset in existing_source_rule.assets}
             new_assets_dict = {asset.asset_name: asset for asset in new_source_rule.assets}
-            processed_asset_names = set()
+            # New AssetRules are appended together once the existing ones are merged
+            new_additions = []
 
             # Iterate through new assets to update existing or add new ones
             for asset_name, new_asset in new_assets_dict.items():
-                processed_asset_names.add(asset_name)
                 existing_asset = existing_assets_dict.get(asset_name)
 
                 if existing_asset:
                     # --- Update Existing AssetRule ---
-                    log.debug(f"  Merging AssetRule: {asset_name}")
-                    existing_asset_row = existing_source_rule.assets.index(existing_asset)
-                    existing_asset_index = self.createIndex(existing_asset_row, 0, existing_asset)
+                    if debug_enabled:
+                        log.debug(f"  Merging AssetRule: {asset_name}")
+                    existing_asset_row = existing_asset._row
 
                     # Update non-override fields (e.g., asset_type)
                     if existing_asset.asset_type != new_asset.asset_type and existing_asset.asset_type_override is None:
+                        old_color = self._asset_type_colors.get(existing_asset._effective_asset_type)
                         existing_asset.asset_type = new_asset.asset_type
+                        self._refresh_effective_asset_type(existing_asset)
+                        new_color = self._asset_type_colors.get(existing_asset._effective_asset_type)
+                        changed_roles = [Qt.DisplayRole, Qt.EditRole]
+                        # Only ask views to refetch backgrounds when the row color actually differs
+                        if old_color != new_color:
+                            changed_roles.append(Qt.BackgroundRole)
                         asset_type_col_index = self.createIndex(existing_asset_row, self.COL_ASSET_TYPE, existing_asset)
-                        self.dataChanged.emit(asset_type_col_index, asset_type_col_index, [Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole])
+                        self.dataChanged.emit(asset_type_col_index, asset_type_col_index, changed_roles)
+                        if old_color != new_color and existing_asset.files:
+                            # Child FileRule rows use a darkened parent color; repaint them in one emission
+                            last_file_row = len(existing_asset.files) - 1
+                            self.dataChanged.emit(
+                                self.createIndex(0, 0, existing_asset.files[0]),
+                                self.createIndex(last_file_row, len(self.Columns) - 1, existing_asset.files[last_file_row]),
+                                [Qt.BackgroundRole])
 
                     # --- Merge FileRules within the AssetRule ---
-                    self._merge_file_rules(existing_asset, new_asset, existing_asset_index)
+                    self._merge_file_rules(existing_asset, new_asset)
 
                 else:
-                    # --- Add New AssetRule ---
-                    log.debug(f"  Adding new AssetRule: {asset_name}")
-                    new_asset.parent_source = existing_source_rule
-                    # Ensure file parents are set
-                    for file_rule in new_asset.files:
-                        file_rule.parent_asset = new_asset
-
-                    insert_row = len(existing_source_rule.assets)
-                    self.beginInsertRows(existing_source_index, insert_row, insert_row)
-                    existing_source_rule.assets.append(new_asset)
-                    self.endInsertRows()
+                    # --- Add New AssetRule (deferred) ---
+                    if debug_enabled:
+                        log.debug(f"  Adding new AssetRule: {asset_name}")
+                    new_additions.append(new_asset)
+
+            if new_additions:
+                # One multi-row insertion for all new AssetRules of this source
+                first_row = len(existing_source_rule.assets)
+                for offset, new_asset in enumerate(new_additions):
+                    # Ensure parents, cached rows and names are set
+                    self._attach_asset_rule(new_asset, existing_source_rule, first_row + offset)
+                self.beginInsertRows(self._cached_index(existing_source_rule), first_row, first_row + len(new_additions) - 1)
+                existing_source_rule.assets.extend(new_additions)
+                self.endInsertRows()
 
             # --- Remove Old AssetRules ---
-            # Find assets in existing but not in new, and remove them in reverse order
-            assets_to_remove = []
-            for i, existing_asset in reversed(list(enumerate(existing_source_rule.assets))):
-                 if existing_asset.asset_name not in processed_asset_names:
-                     assets_to_remove.append((i, existing_asset.asset_name))
-
-            for row_index, asset_name_to_remove in assets_to_remove:
-                 log.debug(f"  Removing old AssetRule: {asset_name_to_remove}")
-                 self.beginRemoveRows(existing_source_index, row_index, row_index)
-                 existing_source_rule.assets.pop(row_index)
-                 self.endRemoveRows()
+            # Assets in existing but not in new, removed as contiguous row runs from the bottom up
+            asset_names_to_remove = existing_assets_dict.keys() - new_assets_dict.keys()
+            if asset_names_to_remove:
+                rows_to_remove = [existing_assets_dict[name]._row for name in asset_names_to_remove]
+                for first_row, last_row in self._descending_row_runs(rows_to_remove):
+                    self.beginRemoveRows(self._cached_index(existing_source_rule), first_row, last_row)
+                    for removed_asset in existing_source_rule.assets[first_row:last_row + 1]:
+                        if debug_enabled:
+                            log.debug(f"  Removing old AssetRule: {removed_asset.asset_name}")
+                        for file_rule in removed_asset.files:
+                            self._unindex_file_override(file_rule)
+                    del existing_source_rule.assets[first_row:last_row + 1]
+                    self._reindex_assets(existing_source_rule, first_row)
+                    self.endRemoveRows()
+
+
+    @staticmethod
+    def _descending_row_runs(rows) -> list:
+        """Groups row numbers into contiguous (first, last) runs, highest run first, for batched removals."""
+        runs = []
+        for row in sorted(rows, reverse=True):
+            if runs and runs[-1][0] == row + 1:
+                runs[-1][0] = row
+            else:
+                runs.append([row, row])
+        return [(first, last) for first, last in runs]
 
+    def _cached_index(self, item, column: int = 0) -> QModelIndex:
+        """Builds the QModelIndex of a rule that is attached to the model directly from its cached row."""
+        return self.createIndex(item._row, column, item)
 
-    def _merge_file_rules(self, existing_asset: AssetRule, new_asset: AssetRule, parent_asset_index: QModelIndex):
+    def _merge_file_rules(self, existing_asset: AssetRule, new_asset: AssetRule):
         """Helper method to merge FileRules for a given AssetRule."""
-        existing_files_dict = {file.file_path: file for file in existing_asset.files}
+        # file_path -> (row, FileRule); rows stay valid until the removal step since additions are appended
+        existing_files_dict = {file.file_path: (row, file) for row, file in enumerate(existing_asset.files)}
         new_files_dict = {file.file_path: file for file in new_asset.files}
-        processed_file_paths = set()
+        # New FileRules are appended together once the existing ones are merged
+        new_additions = []
+        # Per-file debug lines are only formatted when they will be emitted
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+        # Bound once for the per-file loop
+        refresh_effective_item_type = self._refresh_effective_item_type
+        create_index = self.createIndex
+        emit_data_changed = self.dataChanged.emit
 
         # Iterate through new files to update existing or add new ones
         for file_path, new_file in new_files_dict.items():
-            processed_file_paths.add(file_path)
-            existing_file = existing_files_dict.get(file_path)
+            existing_entry = existing_files_dict.get(file_path)
 
-            if existing_file:
+            if existing_entry:
                 # --- Update Existing FileRule ---
-                log.debug(f"    Merging FileRule: {Path(file_path).name}")
-                existing_file_row = existing_asset.files.index(existing_file)
-                existing_file_index = self.createIndex(existing_file_row, 0, existing_file)
-
-                # Update non-override fields (item_type, standard_map_type)
-                changed_roles = []
-                if existing_file.item_type != new_file.item_type and existing_file.item_type_override is None:
-                    existing_file.item_type = new_file.item_type
-                    changed_roles.extend([Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole])
-
-                # standard_map_type is no longer stored on FileRule.
-                # Remove the logic that updated it during merge.
-                pass
-
-
-                # Emit dataChanged only if something actually changed
-                if changed_roles:
-                    # Emit for all relevant columns potentially affected by type changes
-                    for col in [self.COL_ITEM_TYPE]:
-                        col_index = self.createIndex(existing_file_row, col, existing_file)
-                        self.dataChanged.emit(col_index, col_index, changed_roles)
+                existing_file_row, existing_file = existing_entry
+                if debug_enabled:
+                    log.debug(f"    Merging FileRule: {os.path.basename(file_path)}")
+                # Update non-override fields (item_type); standard_map_type is no longer stored on FileRule.
+                # Nothing else is merged, so an unchanged or overridden type needs no further work.
+                if existing_file.item_type == new_file.item_type or existing_file.item_type_override is not None:
+                    continue
+                existing_file.item_type = new_file.item_type
+                refresh_effective_item_type(existing_file)
+                # Only the item type column is affected by type changes
+                col_index = create_index(existing_file_row, _COL_ITEM_TYPE, existing_file)
+                emit_data_changed(col_index, col_index, _ITEM_TYPE_CHANGED_ROLES)
 
             else:
-                # --- Add New FileRule ---
-                log.debug(f"    Adding new FileRule: {Path(file_path).name}")
-                new_file.parent_asset = existing_asset
-                insert_row = len(existing_asset.files)
-                self.beginInsertRows(parent_asset_index, insert_row, insert_row)
-                existing_asset.files.append(new_file)
-                self.endInsertRows()
+                # --- Add New FileRule (deferred) ---
+                if debug_enabled:
+                    log.debug(f"    Adding new FileRule: {os.path.basename(file_path)}")
+                new_additions.append(new_file)
+
+        if new_additions:
+            # One multi-row insertion for all new FileRules of this asset
+            first_row = len(existing_asset.files)
+            for offset, new_file in enumerate(new_additions):
+                self._attach_file_rule(new_file, existing_asset, first_row + offset)
+            self.beginInsertRows(self._cached_index(existing_asset), first_row, first_row + len(new_additions) - 1)
+            existing_asset.files.extend(new_additions)
+            self.endInsertRows()
 
         # --- Remove Old FileRules ---
-        files_to_remove = []
-        for i, existing_file in reversed(list(enumerate(existing_asset.files))):
-             if existing_file.file_path not in processed_file_paths:
-                 files_to_remove.append((i, Path(existing_file.file_path).name))
-
-        for row_index, file_name_to_remove in files_to_remove:
-             log.debug(f"    Removing old FileRule: {file_name_to_remove}")
-             self.beginRemoveRows(parent_asset_index, row_index, row_index)
-             existing_asset.files.pop(row_index)
+        # Files in existing but not in new, removed as contiguous row runs from the bottom up
+        rows_to_remove = [existing_files_dict[file_path][0] for file_path in existing_files_dict.keys() - new_files_dict.keys()]
+        for first_row, last_row in self._descending_row_runs(rows_to_remove):
+             self.beginRemoveRows(self._cached_index(existing_asset), first_row, last_row)
+             for removed_file in existing_asset.files[first_row:last_row + 1]:
+                 if debug_enabled:
+                     log.debug(f"    Removing old FileRule: {os.path.basename(removed_file.file_path)}")
+                 self._unindex_file_override(removed_file)
+             del existing_asset.files[first_row:last_row + 1]
+             self._reindex_files(existing_asset, first_row)
              self.endRemoveRows()
 
 
@@ -684,9 +893,9 @@ class UnifiedViewModel(QAbstractItemModel):
             log.error("moveFileRule: Invalid item types for source or target.")
             return False
 
-        old_parent_asset = getattr(file_item, 'parent_asset', None)
-        if not old_parent_asset:
-            log.error(f"moveFileRule: Source file '{Path(file_item.file_path).name}' has no parent asset.")
+        old_parent_asset = file_item.parent_asset
+        if old_parent_asset is None:
+            log.error(f"moveFileRule: Source file '{os.path.basename(file_item.file_path)}' has no parent asset.")
             return False
 
         if old_parent_asset == target_parent_asset:
@@ -694,30 +903,95 @@ class UnifiedViewModel(QAbstractItemModel):
             return True
 
         # Get old parent index
-        source_rule = getattr(old_parent_asset, 'parent_source', None)
-        if not source_rule:
+        source_rule = old_parent_asset.parent_source
+        if source_rule is None:
              log.error(f"moveFileRule: Could not find SourceRule parent for old asset '{old_parent_asset.asset_name}'.")
              return False
 
-        try:
-            old_parent_row = source_rule.assets.index(old_parent_asset)
-            old_parent_index = self.createIndex(old_parent_row, 0, old_parent_asset)
-            source_row = old_parent_asset.files.index(file_item)
-        except ValueError:
+        old_parent_row = self._cached_row(source_rule.assets, old_parent_asset)
+        source_row = self._cached_row(old_parent_asset.files, file_item)
+        if old_parent_row is None or source_row is None:
             log.error("moveFileRule: Could not find old parent or source file within their respective lists.")
             return False
+        old_parent_index = self.createIndex(old_parent_row, 0, old_parent_asset)
 
         target_row = len(target_parent_asset.files)
 
-        log.debug(f"Moving file '{Path(file_item.file_path).name}' from '{old_parent_asset.asset_name}' (row {source_row}) to '{target_parent_asset.asset_name}' (row {target_row})")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Moving file '{os.path.basename(file_item.file_path)}' from '{old_parent_asset.asset_name}' (row {source_row}) to '{target_parent_asset.asset_name}' (row {target_row})")
         self.beginMoveRows(old_parent_index, source_row, source_row, target_parent_asset_index, target_row)
         # Restructure internal data
-        old_parent_asset.files.pop(source_row)
-        target_parent_asset.files.append(file_item)
+        self._pop_child(old_parent_asset.files, source_row)
+        self._insert_child(target_parent_asset.files, target_row, file_item)
         file_item.parent_asset = target_parent_asset
         self.endMoveRows()
         return True
 
+    def moveFileRulesBatch(self, source_file_indices: List[QModelIndex], target_parent_asset_index: QModelIndex) -> List[FileRule]:
+        """
+        Moves several FileRules to the same AssetRule parent. Sources are grouped by their
+        old parent and each contiguous run of rows is moved with a single beginMoveRows.
+
+        Returns:
+            The FileRules that are now under the target (moved, or already there), in source order.
+        """
+        if not target_parent_asset_index.isValid():
+            log.error("moveFileRulesBatch: Invalid target index provided.")
+            return []
+        target_parent_asset = target_parent_asset_index.internalPointer()
+        if not isinstance(target_parent_asset, AssetRule):
+            log.error("moveFileRulesBatch: Target item is not an AssetRule.")
+            return []
+
+        # Group the source rows per old parent AssetRule (keyed by id, rules are unhashable)
+        rows_by_parent = {}
+        already_in_target = []
+        cached_row = self._cached_row
+        for source_file_index in source_file_indices:
+            file_item = source_file_index.internalPointer() if source_file_index.isValid() else None
+            if not isinstance(file_item, FileRule):
+                log.error("moveFileRulesBatch: Invalid source index provided. Skipping item.")
+                continue
+            old_parent_asset = file_item.parent_asset
+            source_rule = old_parent_asset.parent_source if old_parent_asset is not None else None
+            if source_rule is None or cached_row(source_rule.assets, old_parent_asset) is None:
+                log.error(f"moveFileRulesBatch: Could not find parent asset of '{os.path.basename(file_item.file_path)}'. Skipping item.")
+                continue
+            source_row = cached_row(old_parent_asset.files, file_item)
+            if source_row is None:
+                log.error(f"moveFileRulesBatch: Could not find '{os.path.basename(file_item.file_path)}' within its parent's list. Skipping item.")
+                continue
+            if old_parent_asset is target_parent_asset:
+                already_in_target.append(file_item)
+                continue
+            rows_by_parent.setdefault(id(old_parent_asset), (old_parent_asset, set()))[1].add(source_row)
+
+        moved_files = list(already_in_target)
+        target_files = target_parent_asset.files
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+        for old_parent_asset, rows in rows_by_parent.values():
+            old_parent_index = self._cached_index(old_parent_asset)
+            # Walk runs top-down; each removed run shifts the rows of the later runs up
+            removed_count = 0
+            for first_row, last_row in reversed(self._descending_row_runs(rows)):
+                first_row -= removed_count
+                last_row -= removed_count
+                target_row = len(target_files)
+                if debug_enabled:
+                    log.debug(f"Moving files {first_row}-{last_row} from '{old_parent_asset.asset_name}' to '{target_parent_asset.asset_name}' (row {target_row})")
+                self.beginMoveRows(old_parent_index, first_row, last_row, target_parent_asset_index, target_row)
+                run = old_parent_asset.files[first_row:last_row + 1]
+                del old_parent_asset.files[first_row:last_row + 1]
+                self._reindex_files(old_parent_asset, first_row)
+                for offset, file_item in enumerate(run):
+                    file_item.parent_asset = target_parent_asset
+                    file_item._row = target_row + offset
+                target_files.extend(run)
+                self.endMoveRows()
+                removed_count += len(run)
+                moved_files.extend(run)
+        return moved_files
+
     def createAssetRule(self, source_rule: SourceRule, new_asset_name: str, copy_from_asset: AssetRule = None) -> QModelIndex:
         """Creates a new AssetRule under the given SourceRule and returns its index."""
         if not isinstance(source_rule, SourceRule) or not new_asset_name:
@@ -727,16 +1001,15 @@ class UnifiedViewModel(QAbstractItemModel):
         # Check if asset already exists under this source
         for asset in source_rule.assets:
             if asset.asset_name == new_asset_name:
-                log.warning(f"createAssetRule: Asset '{new_asset_name}' already exists under '{Path(source_rule.input_path).name}'.")
+                log.warning(f"createAssetRule: Asset '{new_asset_name}' already exists under '{os.path.basename(source_rule.input_path)}'.")
                 # Return existing index? Or fail? Let's return existing for now.
-                try:
-                    existing_row = source_rule.assets.index(asset)
-                    return self.createIndex(existing_row, 0, asset)
-                except ValueError:
+                existing_row = self._cached_row(source_rule.assets, asset)
+                if existing_row is None:
                      log.error("createAssetRule: Found existing asset but failed to get its index.")
                      return QModelIndex()
+                return self.createIndex(existing_row, 0, asset)
 
-        log.debug(f"Creating new AssetRule '{new_asset_name}' under '{Path(source_rule.input_path).name}'")
+        log.debug(f"Creating new AssetRule '{new_asset_name}' under '{os.path.basename(source_rule.input_path)}'")
         new_asset_rule = AssetRule(asset_name=new_asset_name)
         new_asset_rule.parent_source = source_rule
 
@@ -744,21 +1017,21 @@ class UnifiedViewModel(QAbstractItemModel):
         if isinstance(copy_from_asset, AssetRule):
             new_asset_rule.asset_type = copy_from_asset.asset_type
             new_asset_rule.asset_type_override = copy_from_asset.asset_type_override
+        self._refresh_effective_asset_type(new_asset_rule)
 
         # Find parent SourceRule index
-        try:
-            grandparent_row = self._source_rules.index(source_rule)
-            grandparent_index = self.createIndex(grandparent_row, 0, source_rule)
-        except ValueError:
-            log.error(f"createAssetRule: Could not find SourceRule '{Path(source_rule.input_path).name}' in the model's root list.")
+        grandparent_row = self._cached_row(self._source_rules, source_rule)
+        if grandparent_row is None:
+            log.error(f"createAssetRule: Could not find SourceRule '{os.path.basename(source_rule.input_path)}' in the model's root list.")
             return QModelIndex()
+        grandparent_index = self.createIndex(grandparent_row, 0, source_rule)
 
         # Determine insertion row for the new parent (e.g., append)
         new_parent_row = len(source_rule.assets)
 
         # Emit signals for inserting the new parent row
         self.beginInsertRows(grandparent_index, new_parent_row, new_parent_row)
-        source_rule.assets.insert(new_parent_row, new_asset_rule)
+        self._insert_child(source_rule.assets, new_parent_row, new_asset_rule)
         self.endInsertRows()
 
         # Return index for the newly created asset
@@ -775,19 +1048,24 @@ class UnifiedViewModel(QAbstractItemModel):
             log.warning(f"removeAssetRule: Asset '{asset_rule_to_remove.asset_name}' is not empty. Removal aborted.")
             return False
 
-        source_rule = getattr(asset_rule_to_remove, 'parent_source', None)
-        if not source_rule:
+        source_rule = asset_rule_to_remove.parent_source
+        if source_rule is None:
             log.error(f"removeAssetRule: Could not find parent SourceRule for asset '{asset_rule_to_remove.asset_name}'.")
             return False
 
         # Find parent SourceRule index and the row of the asset to remove
-        try:
-            grandparent_row = self._source_rules.index(source_rule)
-            grandparent_index = self.createIndex(grandparent_row, 0, source_rule)
-            asset_row_for_removal = source_rule.assets.index(asset_rule_to_remove)
-        except ValueError:
+        grandparent_row = self._cached_row(self._source_rules, source_rule)
+        asset_row_for_removal = self._cached_row(source_rule.assets, asset_rule_to_remove)
+        if grandparent_row is None or asset_row_for_removal is None:
             log.error(f"removeAssetRule: Could not find parent SourceRule or the AssetRule within its parent's list.")
             return False
+        grandparent_index = self.createIndex(grandparent_row, 0, source_rule)
+
+        log.debug(f"Removing empty AssetRule '{asset_rule_to_remove.asset_name}' at row {asset_row_for_removal} under '{os.path.basename(source_rule.input_path)}'")
+        self.beginRemoveRows(grandparent_index, asset_row_for_removal, asset_row_for_removal)
+        self._pop_child(source_rule.assets, asset_row_for_removal)
+        self.endRemoveRows()
+        return True
 
     def get_asset_type_keys(self) -> List[str]:
         """Returns the cached list of asset type keys."""
@@ -800,7 +1078,8 @@ class UnifiedViewModel(QAbstractItemModel):
     def findIndexForItem(self, target_item_object) -> QModelIndex | None:
         """
         Finds the QModelIndex for a given item object (SourceRule, AssetRule, or FileRule)
-        by traversing the model's internal tree structure.
+        from its cached row and parent back-references, in O(depth). The tree is only
+        scanned if the cached rows no longer match the model's lists.
 
         Args:
             target_item_object: The specific SourceRule, AssetRule, or FileRule object to find.
@@ -811,74 +1090,80 @@ class UnifiedViewModel(QAbstractItemModel):
         if target_item_object is None:
             return None
 
-        for sr_row, source_rule in enumerate(self._source_rules):
-            if source_rule is target_item_object:
-                return self.createIndex(sr_row, 0, source_rule)
+        cached_row = self._cached_row
+        sources = self._source_rules
+        is_file = isinstance(target_item_object, FileRule)
+        is_asset = not is_file and isinstance(target_item_object, AssetRule)
+
+        # Walk up the parent back-references, validating each cached row against its parent's list
+        if is_file:
+            asset_rule = target_item_object.parent_asset
+            source_rule = asset_rule.parent_source if asset_rule is not None else None
+            if (source_rule is not None
+                    and cached_row(sources, source_rule) is not None
+                    and cached_row(source_rule.assets, asset_rule) is not None):
+                fr_row = cached_row(asset_rule.files, target_item_object)
+                if fr_row is not None:
+                    return self.createIndex(fr_row, 0, target_item_object)
+        elif is_asset:
+            source_rule = target_item_object.parent_source
+            if source_rule is not None and cached_row(sources, source_rule) is not None:
+                ar_row = cached_row(source_rule.assets, target_item_object)
+                if ar_row is not None:
+                    return self.createIndex(ar_row, 0, target_item_object)
+        elif isinstance(target_item_object, SourceRule):
+            sr_row = cached_row(sources, target_item_object)
+            if sr_row is not None:
+                return self.createIndex(sr_row, 0, target_item_object)
+        else:
+            log.debug(f"findIndexForItem: Unsupported item type {type(target_item_object).__name__}.")
+            return None
 
-            parent_source_rule_index = self.createIndex(sr_row, 0, source_rule)
-            if not parent_source_rule_index.isValid():
-                log.error(f"findIndexForItem: Could not create valid index for SourceRule: {source_rule.input_path}")
+        # Cached rows missed (lists edited outside the model): fall back to a scan that only descends
+        # as deep as the item's level, repairing the cached rows/back-references along the found path
+        # so parent() stays consistent
+        for sr_row, source_rule in enumerate(sources):
+            if not (is_file or is_asset):
+                if source_rule is target_item_object:
+                    source_rule._row = sr_row
+                    return self.createIndex(sr_row, 0, source_rule)
                 continue
-
-
             for ar_row, asset_rule in enumerate(source_rule.assets):
-                if asset_rule is target_item_object:
-                    return self.index(ar_row, 0, parent_source_rule_index)
-
-                parent_asset_rule_index = self.index(ar_row, 0, parent_source_rule_index)
-                if not parent_asset_rule_index.isValid():
-                    log.error(f"findIndexForItem: Could not create valid index for AssetRule: {asset_rule.asset_name}")
+                if not is_file:
+                    if asset_rule is target_item_object:
+                        source_rule._row = sr_row
+                        asset_rule._row, asset_rule.parent_source = ar_row, source_rule
+                        return self.createIndex(ar_row, 0, asset_rule)
                     continue
-
                 for fr_row, file_rule in enumerate(asset_rule.files):
                     if file_rule is target_item_object:
-                        return self.index(fr_row, 0, parent_asset_rule_index)
-        
+                        source_rule._row = sr_row
+                        asset_rule._row, asset_rule.parent_source = ar_row, source_rule
+                        file_rule._row, file_rule.parent_asset = fr_row, asset_rule
+                        return self.createIndex(fr_row, 0, file_rule)
+
         log.debug(f"findIndexForItem: Item {target_item_object!r} not found in the model.")
         return None
 
-    # --- removeAssetRule continued (log.debug was separated by the insert) ---
-    # This log line belongs to the removeAssetRule method defined earlier.
-    # It's being re-indented here to its correct place if it was part of that method's flow.
-    # However, looking at the original structure, the `return True` for removeAssetRule
-    # was at line 802, and the log.debug was at 798. This indicates the log.debug
-    # was likely the *start* of the problematic section in the previous attempt,
-    # and the `return True` was the end of `removeAssetRule`.
-    # The `log.debug` at original line 798 should be part of `removeAssetRule`'s positive path.
-    # The `return True` at original line 802 should be the final return of `removeAssetRule`.
-
-    # Correcting the end of removeAssetRule:
-        log.debug(f"Removing empty AssetRule '{asset_rule_to_remove.asset_name}' at row {asset_row_for_removal} under '{Path(source_rule.input_path).name}'")
-        self.beginRemoveRows(grandparent_index, asset_row_for_removal, asset_row_for_removal)
-        source_rule.assets.pop(asset_row_for_removal)
-        self.endRemoveRows()
-        return True
-
     def update_status(self, source_path: str, status_text: str):
         """
         Finds the SourceRule node for the given source_path and updates its status.
         Emits dataChanged for the corresponding row.
         """
         log.debug(f"Attempting to update status for source '{source_path}' to '{status_text}'")
-        found_row = -1
-        found_rule = None
-        for i, rule in enumerate(self._source_rules):
-            if rule.input_path == source_path:
-                found_row = i
-                found_rule = rule
-                break
+        found_rule = self._source_by_path.get(source_path)
+        found_row = found_rule._row if found_rule is not None else -1
 
         if found_rule is not None and found_row != -1:
             try:
-                # Attempt to set a status attribute (e.g., _status_message)
-                # Note: This attribute isn't formally defined in SourceRule structure yet.
-                setattr(found_rule, '_status_message', status_text)
+                # Set the status attribute (a non-field slot declared on SourceRule)
+                found_rule._status_message = status_text
                 log.info(f"Updated status for SourceRule '{source_path}' (row {found_row}) to '{status_text}'")
 
                 # Emit dataChanged for the entire row to potentially trigger updates
                 # (e.g., delegates, background color based on status if implemented later)
                 start_index = self.createIndex(found_row, 0, found_rule)
-                end_index = self.createIndex(found_row, self.columnCount() - 1, found_rule)
+                end_index = self.createIndex(found_row, len(self.Columns) - 1, found_rule)
                 self.dataChanged.emit(start_index, end_index, [Qt.DisplayRole])
 
             except Exception as e:
@@ -886,8 +1171,8 @@ class UnifiedViewModel(QAbstractItemModel):
         else:
             log.warning(f"Could not find SourceRule with path '{source_path}' to update status.")
 
-    # --- Placeholder for node finding method (Original Request - Replaced by direct list search above) ---
-    # Kept for reference, but the logic above directly searches self._source_rules
+    # --- Placeholder for node finding method (Original Request - Replaced by the input_path lookup above) ---
+    # Kept for reference, update_status resolves rules through self._source_by_path
 
     # --- Drag and Drop Methods ---
 
@@ -902,42 +1187,52 @@ class UnifiedViewModel(QAbstractItemModel):
     def mimeData(self, indexes: list[QModelIndex]) -> QMimeData:
         """Encodes information about the dragged FileRule items."""
         mime_data = QMimeData()
-        encoded_data = QByteArray()
-        stream = QDataStream(encoded_data, QIODevice.OpenModeFlag.WriteOnly)
 
         dragged_file_info = []
+        dragged_file_rules = []
         for index in indexes:
             if not index.isValid() or index.column() != 0:
                 continue
             item = index.internalPointer()
             if isinstance(item, FileRule):
-                parent_index = self.parent(index)
-                if parent_index.isValid():
-                    # Store: source_row, source_parent_row, source_grandparent_row
-                    # This allows reconstructing the index later
-                    grandparent_index = self.parent(parent_index)
-                    # Ensure grandparent_index is valid before accessing its row
-                    if grandparent_index.isValid():
-                        dragged_file_info.append((index.row(), parent_index.row(), grandparent_index.row()))
-                    else:
-                        # Handle case where grandparent is the root (shouldn't happen for FileRule, but safety)
-                        # Or if parent() failed unexpectedly
-                        log.warning(f"mimeData: Could not get valid grandparent index for FileRule at row {index.row()}, parent row {parent_index.row()}")
-
+                # Store: source_row, source_parent_row, source_grandparent_row (from the cached rows)
+                # This allows reconstructing the item later when the drag token is unavailable
+                parent_asset = item.parent_asset
+                source_rule = parent_asset.parent_source if parent_asset is not None else None
+                if source_rule is not None:
+                    dragged_file_info.append((item._row, parent_asset._row, source_rule._row))
+                    dragged_file_rules.append(item)
                 else:
-                     log.warning(f"mimeData: Could not get parent index for FileRule at row {index.row()}")
+                     log.warning(f"mimeData: Could not resolve parent asset/source for FileRule at row {index.row()}")
+
+        # Write the number of items first, then each (row, parent row, grandparent row) tuple.
+        # Packed as unsigned 32-bit ints in one call: rows >= 128 survive (int8 wrapped them).
+        flat_rows = [row for info in dragged_file_info for row in info]
+        encoded_data = struct.pack(f"!I{len(flat_rows)}I", len(dragged_file_info), *flat_rows)
 
-        # Write the number of items first, then each tuple
-        stream.writeInt8(len(dragged_file_info))
-        for info in dragged_file_info:
-            stream.writeInt8(info[0])
-            stream.writeInt8(info[1])
-            stream.writeInt8(info[2])
+        mime_data.setData(self.MIME_TYPE, QByteArray(encoded_data))
 
-        mime_data.setData(self.MIME_TYPE, encoded_data)
+        # Register the objects themselves so an in-process drop can skip decoding the stream
+        token = uuid.uuid4().hex
+        UnifiedViewModel._drag_payload = (token, dragged_file_rules)
+        mime_data.setData(self.DRAG_TOKEN_MIME_TYPE, QByteArray(token.encode("ascii")))
         log.debug(f"mimeData: Encoded {len(dragged_file_info)} FileRule indices.")
         return mime_data
 
+    def _take_drag_payload(self, data: QMimeData):
+        """
+        Returns the FileRule objects registered by mimeData() for this drag, or None when the
+        drag token is missing or unknown (e.g. data from another process). Consumes the payload.
+        """
+        payload = UnifiedViewModel._drag_payload
+        if payload is None or not data.hasFormat(self.DRAG_TOKEN_MIME_TYPE):
+            return None
+        token = bytes(data.data(self.DRAG_TOKEN_MIME_TYPE)).decode("ascii", errors="replace")
+        if token != payload[0]:
+            return None
+        UnifiedViewModel._drag_payload = None
+        return payload[1]
+
     def canDropMimeData(self, data: QMimeData, action: Qt.DropAction, row: int, column: int, parent: QModelIndex) -> bool:
         """Checks if the data can be dropped at the specified location."""
         if action != Qt.MoveAction or not data.hasFormat(self.MIME_TYPE):
@@ -967,131 +1262,102 @@ class UnifiedViewModel(QAbstractItemModel):
              log.error("dropMimeData: Target item is not an AssetRule.")
              return False
 
-        encoded_data = data.data(self.MIME_TYPE)
-        stream = QDataStream(encoded_data, QIODevice.OpenModeFlag.ReadOnly)
-
-        num_items = stream.readInt8()
-        source_indices_info = []
-        for _ in range(num_items):
-            source_row = stream.readInt8()
-            source_parent_row = stream.readInt8()
-            source_grandparent_row = stream.readInt8()
-            source_indices_info.append((source_row, source_parent_row, source_grandparent_row))
-
-        log.debug(f"dropMimeData: Decoded {len(source_indices_info)} source indices. Target Asset: '{target_asset_item.asset_name}'")
+        # Keep track of original parents that might become empty (keyed by id, rules are unhashable)
+        original_parents = {}
+        source_indices_to_process = []
 
-        if not source_indices_info:
-            log.warning("dropMimeData: No valid source index information decoded.")
+        dragged_file_rules = self._take_drag_payload(data)
+        if dragged_file_rules is not None:
+            log.debug(f"dropMimeData: Resolved {len(dragged_file_rules)} dragged FileRules from drag token. Target Asset: '{target_asset_item.asset_name}'")
+        else:
+            encoded_data = bytes(data.data(self.MIME_TYPE))
+            try:
+                (num_items,) = struct.unpack_from("!I", encoded_data)
+                rows = struct.unpack_from(f"!{3 * num_items}I", encoded_data, 4)
+            except struct.error as e:
+                log.error(f"dropMimeData: Could not decode dragged FileRule indices: {e}")
+                return False
+            source_indices_info = list(zip(rows[0::3], rows[1::3], rows[2::3]))
+
+            log.debug(f"dropMimeData: Decoded {len(source_indices_info)} source indices. Target Asset: '{target_asset_item.asset_name}'")
+
+            if not source_indices_info:
+                log.warning("dropMimeData: No valid source index information decoded.")
+                return False
+
+            # Resolve every encoded row triple to its FileRule object before anything moves,
+            # so moving one item can never shift the rows of the items still to be resolved
+            dragged_file_rules = []
+            for src_row, src_parent_row, src_grandparent_row in source_indices_info:
+                try:
+                    file_rule = self._source_rules[src_grandparent_row].assets[src_parent_row].files[src_row]
+                except IndexError:
+                    log.error(f"dropMimeData: No FileRule at row {src_row} of asset row {src_parent_row} in source row {src_grandparent_row}. Skipping item.")
+                    continue
+                dragged_file_rules.append(file_rule)
+
+        # Build source indices straight from the dragged objects' cached rows
+        cached_row = self._cached_row
+        create_index = self.createIndex
+        for file_rule in dragged_file_rules:
+            parent_asset = file_rule.parent_asset
+            if parent_asset is None or cached_row(parent_asset.files, file_rule) is None:
+                log.error(f"dropMimeData: Dragged file '{os.path.basename(file_rule.file_path)}' is no longer in the model. Skipping item.")
+                continue
+            original_parents[id(parent_asset)] = parent_asset
+            source_indices_to_process.append(create_index(file_rule._row, 0, file_rule))
+        if not source_indices_to_process:
+            log.warning("dropMimeData: No valid dragged FileRules resolved.")
             return False
 
-        # Keep track of original parents that might become empty
-        original_parents = set()
-        moved_files_new_indices = {}
 
-        # --- BEGIN FIX: Reconstruct all source indices BEFORE the move loop ---
-        source_indices_to_process = []
-        log.debug("Reconstructing initial source indices...")
-        for src_row, src_parent_row, src_grandparent_row in source_indices_info:
-            grandparent_index = self.index(src_grandparent_row, 0, QModelIndex())
-            if not grandparent_index.isValid():
-                log.error(f"dropMimeData: Failed initial reconstruction of grandparent index (row {src_grandparent_row}). Skipping item.")
-                continue
-            old_parent_index = self.index(src_parent_row, 0, grandparent_index)
-            if not old_parent_index.isValid():
-                log.error(f"dropMimeData: Failed initial reconstruction of old parent index (row {src_parent_row}). Skipping item.")
-                continue
-            source_file_index = self.index(src_row, 0, old_parent_index)
-            if not source_file_index.isValid():
-                # Log the specific parent it failed under for better debugging
-                parent_name = getattr(old_parent_index.internalPointer(), 'asset_name', 'Unknown Parent')
-                log.error(f"dropMimeData: Failed initial reconstruction of source file index (original row {src_row}) under parent '{parent_name}'. Skipping item.")
-                continue
 
-            # Check if the reconstructed index actually points to a FileRule
-            item_check = source_file_index.internalPointer()
-            if isinstance(item_check, FileRule):
-                 source_indices_to_process.append(source_file_index)
-                 log.debug(f"  Successfully reconstructed index for file: {Path(item_check.file_path).name}")
-            else:
-                 log.warning(f"dropMimeData: Initial reconstructed index (row {src_row}) does not point to a FileRule. Skipping.")
-
-        log.debug(f"Successfully reconstructed {len(source_indices_to_process)} valid source indices.")
-        # --- END FIX ---
-
-
-        # Process moves using the pre-calculated valid indices
-        for source_file_index in source_indices_to_process:
-            # Get the file item (already validated during reconstruction)
-            file_item = source_file_index.internalPointer()
-
-            # Track original parent for cleanup (using the valid index)
-            old_parent_index = self.parent(source_file_index)
-            if old_parent_index.isValid():
-                 old_parent_asset = old_parent_index.internalPointer()
-                 if isinstance(old_parent_asset, AssetRule):
-                      # Need grandparent row for the tuple key
-                      grandparent_index = self.parent(old_parent_index)
-                      if grandparent_index.isValid():
-                           original_parents.add((grandparent_index.row(), old_parent_asset.asset_name))
-                      else:
-                           log.warning(f"Could not get grandparent index for original parent '{old_parent_asset.asset_name}' during cleanup tracking.")
-                 else:
-                      log.warning(f"Parent of file '{Path(file_item.file_path).name}' is not an AssetRule.")
-            else:
-                 log.warning(f"Could not get valid parent index for file '{Path(file_item.file_path).name}' during cleanup tracking.")
-
-
-            # Perform the move using the model's method and the valid source_file_index
-            if self.moveFileRule(source_file_index, parent):
-                # --- Update Target Asset Override After Successful Move ---
-                # The file_item's parent_asset reference should now be updated by moveFileRule
-                new_parent_asset = getattr(file_item, 'parent_asset', None)
-                if new_parent_asset == target_asset_item:
-                    if file_item.target_asset_name_override != target_asset_item.asset_name:
-                        log.debug(f"  Updating target override for '{Path(file_item.file_path).name}' to '{target_asset_item.asset_name}'")
-                        file_item.target_asset_name_override = target_asset_item.asset_name
-                        # Need the *new* index of the moved file to emit dataChanged
-                        try:
-                            new_row = target_asset_item.files.index(file_item)
-                            new_file_index_col0 = self.index(new_row, 0, parent)
-                            new_file_index_target_col = self.index(new_row, self.COL_TARGET_ASSET, parent)
-                            if new_file_index_target_col.isValid():
-                                 moved_files_new_indices[file_item.file_path] = new_file_index_target_col
-                            else:
-                                log.warning(f"  Could not get valid *new* index for target column of moved file: {Path(file_item.file_path).name}")
-                        except ValueError:
-                             log.error(f"  Could not find moved file '{Path(file_item.file_path).name}' in target parent's list after move.")
+        # Perform all moves in one batch: one beginMoveRows per contiguous run of source rows
+        moved_files = self.moveFileRulesBatch(source_indices_to_process, parent)
+        if len(moved_files) != len(source_indices_to_process):
+            log.error(f"dropMimeData: {len(source_indices_to_process) - len(moved_files)} file(s) could not be moved.")
 
-                else:
-                     log.error(f"  Move reported success, but file's parent reference ('{getattr(new_parent_asset, 'asset_name', 'None')}') doesn't match target ('{target_asset_item.asset_name}'). Override not updated.")
-            else:
-                log.error(f"dropMimeData: moveFileRule failed for file '{Path(file_item.file_path).name}'.")
-                # If one move fails, should we stop? For now, continue processing others.
-                continue
+        # --- Update Target Asset Override After Successful Moves ---
+        # Moved files carry their new row in _row (appended at the end of the target's list)
+        updated_rows = []
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+        set_file_override = self._set_file_override
+        target_name = target_asset_item.asset_name
+        for file_item in moved_files:
+            if file_item.target_asset_name_override != target_name:
+                if debug_enabled:
+                    log.debug(f"  Updating target override for '{os.path.basename(file_item.file_path)}' to '{target_name}'")
+                set_file_override(file_item, target_name)
+                updated_rows.append(file_item._row)
 
         # --- Emit dataChanged for Target Asset column AFTER all moves ---
-        for source_path, new_index in moved_files_new_indices.items():
-             self.dataChanged.emit(new_index, new_index, [Qt.DisplayRole, Qt.EditRole])
+        # One emission spanning every updated row: moved files are appended contiguously, and
+        # refreshing the few unchanged rows in between is cheaper than one signal per run.
+        # (layoutChanged is not used: the moves already emitted rowsMoved, and a layout change
+        # must not enclose beginMoveRows/endMoveRows.)
+        if updated_rows:
+            target_files = target_asset_item.files
+            first_row, last_row = min(updated_rows), max(updated_rows)
+            self.dataChanged.emit(self.createIndex(first_row, _COL_TARGET_ASSET, target_files[first_row]),
+                                  self.createIndex(last_row, _COL_TARGET_ASSET, target_files[last_row]),
+                                  _DISPLAY_EDIT_ROLES)
 
         # --- Cleanup: Remove any original parent AssetRules that are now empty ---
-        log.debug(f"dropMimeData: Checking original parents for cleanup: {list(original_parents)}")
-        for gp_row, asset_name in list(original_parents):
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"dropMimeData: Checking original parents for cleanup: {[asset.asset_name for asset in original_parents.values()]}")
+        for asset_rule_to_check in original_parents.values():
             try:
-                if 0 <= gp_row < len(self._source_rules):
-                    source_rule = self._source_rules[gp_row]
-                    # Find the asset rule within the correct source rule
-                    asset_rule_to_check = next((asset for asset in source_rule.assets if asset.asset_name == asset_name), None)
-
-                    if asset_rule_to_check and not asset_rule_to_check.files and asset_rule_to_check != target_asset_item:
-                        log.info(f"dropMimeData: Attempting cleanup of now empty original parent: '{asset_rule_to_check.asset_name}'")
-                        if not self.removeAssetRule(asset_rule_to_check):
-                            log.warning(f"dropMimeData: Failed to remove empty original parent '{asset_rule_to_check.asset_name}'.")
-                    elif not asset_rule_to_check:
-                         log.warning(f"dropMimeData: Cleanup check failed. Could not find original parent asset '{asset_name}' in source rule at row {gp_row}.")
-                else:
-                    log.warning(f"dropMimeData: Cleanup check failed. Invalid grandparent row index {gp_row} found in original_parents set.")
+                if asset_rule_to_check is target_asset_item or asset_rule_to_check.files:
+                    continue
+                source_rule = asset_rule_to_check.parent_source
+                if source_rule is None or self._cached_row(source_rule.assets, asset_rule_to_check) is None:
+                    log.warning(f"dropMimeData: Cleanup check failed. Original parent asset '{asset_rule_to_check.asset_name}' is no longer in the model.")
+                    continue
+                log.info(f"dropMimeData: Attempting cleanup of now empty original parent: '{asset_rule_to_check.asset_name}'")
+                if not self.removeAssetRule(asset_rule_to_check):
+                    log.warning(f"dropMimeData: Failed to remove empty original parent '{asset_rule_to_check.asset_name}'.")
             except Exception as e:
-                log.exception(f"dropMimeData: Error during cleanup check for parent '{asset_name}' (gp_row {gp_row}): {e}")
+                log.exception(f"dropMimeData: Error during cleanup check for parent '{asset_rule_to_check.asset_name}': {e}")
 
 
         return True
\ No newline at end of file
@@ -1,60 +1,50 @@
 import argparse
+import collections
+import functools
+import multiprocessing
 import sys
 import time
 import os
+import stat
 import json
 import logging
 from pathlib import Path
 import re # Added for checking incrementing token
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import subprocess
 import shutil
 import tempfile
+import queue
+import threading
+import atexit
 import zipfile
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, Tuple, Optional
 
 # --- Utility Imports ---
-from utils.hash_utils import calculate_sha256
+from utils.hash_utils import calculate_sha256, calculate_sha256_prefix
+from utils.hash_cache import HASH_CACHE_FILENAME, Sha5Cache
+from utils.result_cache import RESULT_CACHE_FILENAME, ResultCache, result_fingerprint
 from utils.path_utils import get_next_incrementing_value
 from utils import app_setup_utils # Import the new utility module
 
 # --- Qt Imports for Application Structure ---
-from PySide6.QtCore import QObject, Slot, QThreadPool, QRunnable, Signal
+from PySide6.QtCore import QObject, Slot, QThreadPool, QRunnable, Signal, QTimer
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication, QDialog # Import QDialog for the setup dialog
+# QtWidgets and the GUI modules are imported where windows are created, so engine worker
+# processes (which re-import this module under the spawn start method) never load them
 
 # --- Backend Imports ---
 # Add current directory to sys.path for direct execution
 import sys
 import os
 sys.path.append(os.path.dirname(__file__))
-print(f"DEBUG: sys.path after append: {sys.path}")
 
 try:
-    print("DEBUG: Attempting to import Configuration...")
     from configuration import Configuration, ConfigurationError, get_available_preset_names
-    print("DEBUG: Successfully imported Configuration.")
-
-    print("DEBUG: Attempting to import ProcessingEngine...")
-    from processing_engine import ProcessingEngine
-    print("DEBUG: Successfully imported ProcessingEngine.")
-
-    print("DEBUG: Attempting to import SourceRule...")
+    from processing_engine import ProcessingEngine, init_engine_worker, process_in_worker, warm_up_worker
     from rule_structure import SourceRule
-    print("DEBUG: Successfully imported SourceRule.")
-
-    print("DEBUG: Attempting to import MainWindow...")
-    from gui.main_window import MainWindow
-    print("DEBUG: Successfully imported MainWindow.")
-
-    print("DEBUG: Attempting to import FirstTimeSetupDialog...")
-    from gui.first_time_setup_dialog import FirstTimeSetupDialog # Import the setup dialog
-    print("DEBUG: Successfully imported FirstTimeSetupDialog.")
-
-    print("DEBUG: Attempting to import prepare_processing_workspace...")
-    from utils.workspace_utils import prepare_processing_workspace
-    print("DEBUG: Successfully imported prepare_processing_workspace.")
-
+    from utils.workspace_utils import prepare_processing_workspace, prepare_and_hash, retire_workspace, purge_retired_workspaces, use_ram_workspace_root
 except ImportError as e:
     script_dir = Path(__file__).parent.resolve()
     print(f"ERROR: Cannot import Configuration or rule_structure classes.")
@@ -71,6 +61,25 @@ except ImportError as e:
     sys.exit(1)
 
 # --- Setup Logging ---
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp for all records within the same second.
+    Only valid for date formats without sub-second fields, which strftime cannot produce anyway.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (whole second, datefmt, formatted string), replaced as one tuple so threads never see a mix
+        self._cached_time = (None, None, "")
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, cached_datefmt, cached_str = self._cached_time
+        if second == cached_second and datefmt == cached_datefmt:
+            return cached_str
+        formatted = super().formatTime(record, datefmt)
+        self._cached_time = (second, datefmt, formatted)
+        return formatted
+
 # Keep setup_logging as is, it's called by main() or potentially monitor.py
 def setup_logging(verbose: bool):
     """Configures logging for the application."""
@@ -82,12 +91,17 @@ def setup_logging(verbose: bool):
     for handler in logging.root.handlers[:]:
         logging.root.removeHandler(handler)
 
+    # No handler in the application formats thread or process fields, so records skip collecting them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(CachedTimeFormatter(log_format, datefmt=date_format))
     logging.basicConfig(
         level=log_level,
-        format=log_format,
-        datefmt=date_format,
         handlers=[
-            logging.StreamHandler(sys.stdout)
+            stream_handler
         ]
     )
     log = logging.getLogger(__name__)
@@ -96,6 +110,12 @@ def setup_logging(verbose: bool):
 log = logging.getLogger(__name__)
 
 
+def _init_engine_worker(verbose: bool, config_obj: Configuration):
+    """Engine process pool initializer: configures logging and builds the worker's engine."""
+    setup_logging(verbose)
+    init_engine_worker(config_obj)
+
+
 # --- Argument Parser Setup ---
 # Keep setup_arg_parser as is, it's only used when running main.py directly
 def setup_arg_parser():
@@ -172,136 +192,480 @@ def setup_arg_parser():
     return parser
 
 
+# --- Background Workspace Cleanup ---
+# Temporary workspaces queued for removal, drained by a single daemon thread.
+# _PURGE_GRAVEYARD stands for any number of workspaces already renamed into the graveyard.
+_PURGE_GRAVEYARD = object()
+_cleanup_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_cleanup_thread: Optional[threading.Thread] = None
+_cleanup_thread_lock = threading.Lock()
+
+def _remove_workspace(workspace_path: Path):
+    """Deletes one temporary workspace, logging instead of raising on failure."""
+    try:
+        log.info(f"Cleaning up temporary workspace: {workspace_path}")
+        shutil.rmtree(workspace_path)
+    except FileNotFoundError:
+        pass # Already gone
+    except OSError as cleanup_error:
+        log.error(f"Cleanup Thread: Failed to cleanup temporary workspace {workspace_path}: {cleanup_error}")
+
+def _process_cleanup_batch(first_item):
+    """Handles one queued item plus everything queued behind it, purging the graveyard once."""
+    purge = False
+    item = first_item
+    while True:
+        if item is _PURGE_GRAVEYARD:
+            purge = True
+        else:
+            _remove_workspace(item)
+        try:
+            item = _cleanup_queue.get_nowait()
+        except queue.Empty:
+            break
+    if purge:
+        purge_retired_workspaces()
+
+def _cleanup_worker():
+    while True:
+        _process_cleanup_batch(_cleanup_queue.get())
+
+def _drain_cleanup_queue():
+    """Removes workspaces still queued at interpreter exit, since the daemon thread is not joined."""
+    try:
+        first_item = _cleanup_queue.get_nowait()
+    except queue.Empty:
+        return
+    _process_cleanup_batch(first_item)
+
+def schedule_workspace_cleanup(workspace_path: Path):
+    """
+    Retires a temporary workspace into the graveyard and queues its removal on the
+    background cleanup thread, which deletes retired workspaces in bulk.
+    """
+    global _cleanup_thread
+    if _cleanup_thread is None:
+        with _cleanup_thread_lock:
+            if _cleanup_thread is None:
+                _cleanup_thread = threading.Thread(target=_cleanup_worker, name="WorkspaceCleanup", daemon=True)
+                _cleanup_thread.start()
+                atexit.register(_drain_cleanup_queue)
+    if retire_workspace(workspace_path) is not None:
+        log.debug("Retired temporary workspace: %s", workspace_path)
+        _cleanup_queue.put(_PURGE_GRAVEYARD)
+    else:
+        _cleanup_queue.put(workspace_path)
+
+
+class SharedWorkspace:
+    """
+    A workspace prepared once for several tasks whose rules have the same input. The first
+    task to call prepare() extracts it while the others wait for its result (or exception);
+    it is queued for cleanup when the last of its tasks releases it.
+    """
+
+    def __init__(self, input_path: str, users: int):
+        self.input_path = input_path
+        self._users = users
+        self._lock = threading.Lock()
+        self._prepared: Optional[Future] = None
+
+    def prepare(self) -> Path:
+        with self._lock:
+            prepared = self._prepared
+            is_owner = prepared is None
+            if is_owner:
+                prepared = self._prepared = Future()
+        if is_owner:
+            try:
+                prepared.set_result(prepare_processing_workspace(self.input_path))
+            except BaseException as e:
+                prepared.set_exception(e)
+        return prepared.result()
+
+    def release(self):
+        """Called once by every task sharing the workspace, whether or not it got to use it."""
+        with self._lock:
+            self._users -= 1
+            is_last = self._users == 0
+        prepared = self._prepared
+        if is_last and prepared is not None and prepared.done() and prepared.exception() is None:
+            schedule_workspace_cleanup(prepared.result())
+
+
 # --- Worker Runnable for Thread Pool ---
+# Path patterns are resolved case-insensitively, so [sha5] and [SHA5] both reference the hash
+_SHA5_TOKEN_RE = re.compile(r"\[sha5\]", re.IGNORECASE)
+# Patterns containing this need an incrementing value (see utils.path_utils.get_next_incrementing_value)
+_INCREMENT_TOKEN_RE = re.compile(r"\[IncrementingValue\]|#+")
+
+def patterns_use_sha5(config_obj) -> bool:
+    """Returns True if the output directory or filename pattern contains the [SHA5] token."""
+    for pattern_name in ('output_directory_pattern', 'output_filename_pattern'):
+        pattern = getattr(config_obj, pattern_name, None)
+        if isinstance(pattern, str) and _SHA5_TOKEN_RE.search(pattern):
+            return True
+    return False
+
+def uses_full_content_hash(config_obj) -> bool:
+    """Returns True if the SHA5 token must come from the whole archive rather than its prefix and size."""
+    return bool(getattr(config_obj, 'require_full_content_hash', False))
+
+def sha5_cache_key(input_path, stat_result: Optional[os.stat_result] = None) -> Optional[Tuple[str, int, int]]:
+    """
+    Returns the (path, size, mtime_ns) key identifying one version of an input
+    archive, or None if the path is not a regular file. An already fetched
+    stat_result for the path can be passed to skip the stat call.
+    """
+    if stat_result is None:
+        try:
+            stat_result = os.stat(input_path)
+        except OSError:
+            return None
+    if not stat.S_ISREG(stat_result.st_mode):
+        return None
+    return (os.fspath(input_path), stat_result.st_size, stat_result.st_mtime_ns)
+
+def calculate_sha5(archive_path: str, full_content_hash: bool = False,
+                   sha5_cache: Optional[Sha5Cache] = None,
+                   archive_stat: Optional[os.stat_result] = None) -> Optional[str]:
+    """
+    Returns the first five hex digits of the input archive's SHA-256, or None for
+    directories and on errors, which are logged rather than raised. Unless
+    full_content_hash is set, only the archive's first MiB and size are hashed.
+    The result is stored in sha5_cache when one is given. An already fetched
+    stat result for the path can be passed to skip the stat call.
+    """
+    sha5_value = None
+    try:
+        # One stat answers both the file/directory question and the cache key
+        if archive_stat is None:
+            archive_stat = os.stat(archive_path)
+        if stat.S_ISREG(archive_stat.st_mode):
+            if full_content_hash:
+                log.debug("Calculating SHA256 for file: %s", archive_path)
+                full_sha = calculate_sha256(archive_path)
+            else:
+                log.debug("Calculating prefix SHA256 for file: %s", archive_path)
+                full_sha = calculate_sha256_prefix(archive_path)
+            if full_sha:
+                sha5_value = full_sha[:5]
+                log.info(f"Calculated SHA5 for {archive_path}: {sha5_value}")
+                if sha5_cache is not None:
+                    sha5_cache[sha5_cache_key(archive_path, archive_stat)] = sha5_value
+            else:
+                log.warning(f"SHA256 calculation returned None for {archive_path}")
+        elif stat.S_ISDIR(archive_stat.st_mode):
+            log.debug("Input path %s is a directory, skipping SHA5 calculation.", archive_path)
+        else:
+            log.warning(f"Input path {archive_path} is not a valid file or directory for SHA5 calculation.")
+    except FileNotFoundError:
+        log.error(f"SHA5 calculation failed: File not found at {archive_path}")
+    except Exception as e:
+        log.exception(f"Error calculating SHA5 for {archive_path}: {e}")
+    return sha5_value
+
 class TaskSignals(QObject):
     finished = Signal(str, str, object) # rule_input_path, status, result/error
 
 class ProcessingTask(QRunnable):
     """Wraps a call to processing_engine.process for execution in a thread pool."""
 
-    def __init__(self, engine: ProcessingEngine, rule: SourceRule, workspace_path: Path, output_base_path: Path):
+    def __init__(self, engine: ProcessingEngine, rule: SourceRule, workspace_path: Path, output_base_path: Path,
+                 sha5_value: Optional[str] = None, sha5_cache: Optional[Sha5Cache] = None,
+                 process_pool: Optional[ProcessPoolExecutor] = None, incrementing_value: Optional[str] = None,
+                 results_queue: Optional["queue.SimpleQueue[Tuple[str, str, object]]"] = None,
+                 sha5_future: Optional[Future] = None, engine_slots: Optional[threading.Semaphore] = None,
+                 shared_workspace: Optional[SharedWorkspace] = None,
+                 replace_broken_pool: Optional[Callable[[ProcessPoolExecutor], ProcessPoolExecutor]] = None):
         super().__init__()
         self.engine = engine
         self.rule = rule
+        # Input path as a plain string, reused for stat calls, log lines and the finished signal
+        self._input_str = os.fspath(rule.input_path)
         self.workspace_path = workspace_path
         self.output_base_path = output_base_path
-        self.signals = TaskSignals()
+        # Pre-computed SHA5 for the input archive; when set, run() skips hashing entirely
+        self.sha5_value = sha5_value
+        # Shared (path, size, mtime_ns) -> SHA5 cache owned by the App, filled in after hashing (see utils.hash_cache)
+        self.sha5_cache = sha5_cache
+        # SHA5 already being calculated by the App's batch pre-pass; when set, run() waits for it instead of hashing
+        self.sha5_future = sha5_future
+        # When set, engine.process runs in this pool's worker processes instead of on this thread
+        self.process_pool = process_pool
+        # Called with process_pool once it is broken (a worker died); returns the pool to use instead
+        self.replace_broken_pool = replace_broken_pool
+        # Bounds the jobs submitted to process_pool but not finished yet, and so the prepared workspaces waiting for it
+        self.engine_slots = engine_slots
+        # Workspace shared with other tasks of the batch that have the same input; prepared once, released by each
+        self.shared_workspace = shared_workspace
+        # Incrementing value allocated by the App for this task; when set, the output directory is not scanned
+        self.incrementing_value = incrementing_value
+        # When set, the (input_path, status, result) outcome is queued here instead of emitted as signals.finished
+        self.results_queue = results_queue
+        # Only tasks without a results queue report through signals; the App's batches never allocate one per task
+        self.signals = TaskSignals() if results_queue is None else None
+
+    def _calculate_sha5(self) -> Optional[str]:
+        """Returns the SHA5 for the input archive (see calculate_sha5), or None."""
+        if self.sha5_value:
+            log.debug("Using pre-computed SHA5 for %s: %s", self._input_str, self.sha5_value)
+            return self.sha5_value
+        # Reading a multi-GB archive is wasted when no output path can contain the hash
+        if not patterns_use_sha5(self.engine.config_obj):
+            log.debug("No [SHA5] token in the output patterns. Skipping SHA5 calculation for %s.", self._input_str)
+            return None
+        return calculate_sha5(self._input_str, uses_full_content_hash(self.engine.config_obj), self.sha5_cache)
+
+    def _prepare_and_hash_workspace(self, hash_executor: ThreadPoolExecutor) -> Tuple[Path, Optional[str]]:
+        """Prepares the workspace of a ZIP input while hashing the same mapped archive on hash_executor."""
+        prepared_workspace_path, full_sha = prepare_and_hash(self._input_str, hash_executor)
+        if full_sha is None:
+            # The archive could not be memory mapped; hash it with a separate read
+            return prepared_workspace_path, self._calculate_sha5()
+        sha5_value = full_sha[:5]
+        log.info(f"Calculated SHA5 for {self._input_str}: {sha5_value}")
+        if self.sha5_cache is not None:
+            cache_key = sha5_cache_key(self._input_str)
+            if cache_key:
+                self.sha5_cache[cache_key] = sha5_value
+        return prepared_workspace_path, sha5_value
+
+    def _calculate_incrementing_value(self) -> Optional[str]:
+        """Returns the next incrementing value for the output directory, or None if the pattern has no such token."""
+        if self.incrementing_value is not None:
+            log.debug("Using pre-allocated incrementing value for %s: %s", self._input_str, self.incrementing_value)
+            return self.incrementing_value
+        config = self.engine.config_obj
+        output_dir = self.output_base_path # This is already a Path object from App.on_processing_requested
+        next_increment_str = None
+        try:
+            # output_dir should already be a Path object
+            pattern = getattr(config, 'output_directory_pattern', None)
+            if pattern:
+                # Only call get_next_incrementing_value if the pattern contains an incrementing token
+                if _INCREMENT_TOKEN_RE.search(pattern):
+                    log.debug("Incrementing token found in pattern '%s'. Calculating next value for dir: %s", pattern, output_dir)
+                    next_increment_str = get_next_incrementing_value(output_dir, pattern)
+                    log.info(f"Calculated next incrementing value for {output_dir}: {next_increment_str}")
+                else:
+                    log.debug("No incrementing token found in pattern '%s'. Skipping increment calculation.", pattern)
+                    next_increment_str = None # Or a default like "00" if downstream expects a string, but None is cleaner if handled.
+            else:
+                log.warning(f"Cannot calculate incrementing value: 'output_directory_pattern' not found in configuration for preset {config.preset_name}")
+        except Exception as e:
+            log.exception(f"Error calculating next incrementing value for {output_dir}: {e}")
+        return next_increment_str
 
     @Slot() # Decorator required for QRunnable's run method
     def run(self):
         """Prepares input files and executes the engine's process method."""
-        log.info(f"Worker Thread: Starting processing for rule: {self.rule.input_path}")
-        log.debug(f"DEBUG: Rule passed to ProcessingTask.run: {self.rule}")
+        log.info(f"Worker Thread: Starting processing for rule: {self._input_str}")
+        # Checked once: the rule repr and the workspace listing below are costly to build even when dropped
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            log.debug("Rule passed to ProcessingTask.run: %s", self.rule)
         status = "failed"
         result_or_error = None
         prepared_workspace_path = None # Initialize path for prepared content outside try
+        handed_off = False
 
         try:
-            # --- 1. Prepare Input Workspace using Utility Function ---
-            # The utility function creates the temp dir, prepares it, and returns its path.
-            # It raises exceptions on failure (FileNotFoundError, ValueError, zipfile.BadZipFile, OSError).
-            prepared_workspace_path = prepare_processing_workspace(self.rule.input_path)
-            log.info(f"Workspace prepared successfully at: {prepared_workspace_path}")
-
-            # --- DEBUG: List files in prepared workspace ---
-            try:
-                log.debug(f"Listing contents of prepared workspace: {prepared_workspace_path}")
-                for item in prepared_workspace_path.rglob('*'):
-                     log.debug(f"  Found item: {item.relative_to(prepared_workspace_path)}")
-            except Exception as list_err:
-                log.error(f"Error listing prepared workspace contents: {list_err}")
-            # --- END DEBUG ---
-            # --- 2. Execute Processing Engine ---
-            log.info(f"Calling ProcessingEngine.process with rule for input: {self.rule.input_path}, prepared workspace: {prepared_workspace_path}, output: {self.output_base_path}")
-            log.debug(f"  Rule Details: {self.rule}")
-
-            # --- Calculate SHA5 and Incrementing Value ---
-            config = self.engine.config_obj
-            archive_path = self.rule.input_path
-            output_dir = self.output_base_path # This is already a Path object from App.on_processing_requested
-
-            sha5_value = None
-            try:
-                archive_path_obj = Path(archive_path)
-                if archive_path_obj.is_file():
-                    log.debug(f"Calculating SHA256 for file: {archive_path_obj}")
-                    full_sha = calculate_sha256(archive_path_obj)
-                    if full_sha:
-                        sha5_value = full_sha[:5]
-                        log.info(f"Calculated SHA5 for {archive_path}: {sha5_value}")
-                    else:
-                        log.warning(f"SHA256 calculation returned None for {archive_path}")
-                elif archive_path_obj.is_dir():
-                    log.debug(f"Input path {archive_path} is a directory, skipping SHA5 calculation.")
+            # Hashing the archive and scanning the output directory do not depend on the
+            # workspace, so they run on helper threads while this thread extracts the input.
+            # Both helpers log and swallow their own errors, leaving preparation errors as the
+            # only ones that can surface as failed_preparation.
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="ProcessingTaskHelper") as helper_pool:
+                # A ZIP that needs a full content hash is hashed and extracted from one memory map, so it
+                # is read from disk once; anything else is hashed (if at all) by the App's batch pre-pass
+                # or by its own helper call.
+                fuse_hash = (not self.sha5_value and self.sha5_future is None and self.shared_workspace is None
+                             and self._input_str.lower().endswith('.zip')
+                             and patterns_use_sha5(self.engine.config_obj)
+                             and uses_full_content_hash(self.engine.config_obj))
+                if self.sha5_future is not None:
+                    sha5_future = self.sha5_future
                 else:
-                    log.warning(f"Input path {archive_path} is not a valid file or directory for SHA5 calculation.")
-            except FileNotFoundError:
-                log.error(f"SHA5 calculation failed: File not found at {archive_path}")
-            except Exception as e:
-                log.exception(f"Error calculating SHA5 for {archive_path}: {e}")
-
-            next_increment_str = None
-            try:
-                # output_dir should already be a Path object
-                pattern = getattr(config, 'output_directory_pattern', None)
-                if pattern:
-                    # Only call get_next_incrementing_value if the pattern contains an incrementing token
-                    if re.search(r"\[IncrementingValue\]|#+", pattern):
-                        log.debug(f"Incrementing token found in pattern '{pattern}'. Calculating next value for dir: {output_dir}")
-                        next_increment_str = get_next_incrementing_value(output_dir, pattern)
-                        log.info(f"Calculated next incrementing value for {output_dir}: {next_increment_str}")
-                    else:
-                        log.debug(f"No incrementing token found in pattern '{pattern}'. Skipping increment calculation.")
-                        next_increment_str = None # Or a default like "00" if downstream expects a string, but None is cleaner if handled.
+                    sha5_future = None if fuse_hash else helper_pool.submit(self._calculate_sha5)
+                increment_future = helper_pool.submit(self._calculate_incrementing_value)
+
+                # --- 1. Prepare Input Workspace using Utility Function ---
+                # The utility function creates the temp dir, prepares it, and returns its path.
+                # It raises exceptions on failure (FileNotFoundError, ValueError, zipfile.BadZipFile, OSError).
+                if self.shared_workspace is not None:
+                    prepared_workspace_path = self.shared_workspace.prepare()
+                elif fuse_hash:
+                    prepared_workspace_path, sha5_value = self._prepare_and_hash_workspace(helper_pool)
                 else:
-                    log.warning(f"Cannot calculate incrementing value: 'output_directory_pattern' not found in configuration for preset {config.preset_name}")
-            except Exception as e:
-                log.exception(f"Error calculating next incrementing value for {output_dir}: {e}")
-            # --- End Calculation ---
+                    prepared_workspace_path = prepare_processing_workspace(self._input_str)
+                log.info(f"Workspace prepared successfully at: {prepared_workspace_path}")
+
+                # --- DEBUG: List files in prepared workspace ---
+                if debug_enabled:
+                    try:
+                        log.debug("Listing contents of prepared workspace: %s", prepared_workspace_path)
+                        workspace_str = os.fspath(prepared_workspace_path)
+                        for dir_path, dir_names, file_names in os.walk(workspace_str):
+                            relative_dir = os.path.relpath(dir_path, workspace_str)
+                            for name in dir_names + file_names:
+                                log.debug("  Found item: %s", name if relative_dir == os.curdir else os.path.join(relative_dir, name))
+                    except Exception as list_err:
+                        log.error(f"Error listing prepared workspace contents: {list_err}")
+                # --- END DEBUG ---
+
+                # --- Collect SHA5 and Incrementing Value ---
+                if sha5_future is not None:
+                    sha5_value = sha5_future.result()
+                next_increment_str = increment_future.result()
+
+            # --- 2. Execute Processing Engine ---
+            log.info(f"Calling ProcessingEngine.process with rule for input: {self._input_str}, prepared workspace: {prepared_workspace_path}, output: {self.output_base_path}")
+            if debug_enabled:
+                log.debug("  Rule Details: %s", self.rule.verbose_repr())
 
             log.info(f"Calling engine.process with sha5='{sha5_value}', incrementing_value='{next_increment_str}'")
-            result_or_error = self.engine.process(
-                self.rule,
-                workspace_path=prepared_workspace_path,
-                output_base_path=self.output_base_path,
-                incrementing_value=next_increment_str,
-                sha5_value=sha5_value
-            )
+            if self.process_pool is not None and self.rule.assets:
+                # Image work holds the GIL between OpenCV calls, so it runs in a worker process.
+                # This thread hands the job off and returns, so the pool slot can prepare the next
+                # workspace meanwhile; the future's callback reports the outcome and cleans up.
+                if self.engine_slots is not None:
+                    self.engine_slots.acquire()
+                try:
+                    engine_future = self._submit_engine_job(prepared_workspace_path, next_increment_str, sha5_value)
+                except BaseException:
+                    if self.engine_slots is not None:
+                        self.engine_slots.release()
+                    raise
+                engine_future.add_done_callback(functools.partial(self._on_engine_finished, prepared_workspace_path))
+                handed_off = True
+                return
+            else:
+                result_or_error = self.engine.process(
+                    self.rule,
+                    workspace_path=prepared_workspace_path,
+                    output_base_path=self.output_base_path,
+                    incrementing_value=next_increment_str,
+                    sha5_value=sha5_value
+                )
             status = "processed" # Assume success if no exception
-            log.info(f"Worker Thread: Finished processing for rule: {self.rule.input_path}, Status: {status}")
+            log.info(f"Worker Thread: Finished processing for rule: {self._input_str}, Status: {status}")
             # Signal emission moved to finally block
 
         except (FileNotFoundError, ValueError, zipfile.BadZipFile, OSError) as prep_error:
-            log.exception(f"Worker Thread: Error preparing workspace for rule {self.rule.input_path}: {prep_error}")
+            log.exception(f"Worker Thread: Error preparing workspace for rule {self._input_str}: {prep_error}")
             status = "failed_preparation"
             result_or_error = str(prep_error)
             # Signal emission moved to finally block
         except Exception as proc_error:
-            log.exception(f"Worker Thread: Error during engine processing for rule {self.rule.input_path}: {proc_error}")
+            log.exception(f"Worker Thread: Error during engine processing for rule {self._input_str}: {proc_error}")
             status = "failed_processing"
             result_or_error = str(proc_error)
             # Signal emission moved to finally block
         finally:
-            # --- Emit finished signal regardless of success or failure ---
+            # A job handed to the process pool is reported and cleaned up by _on_engine_finished
+            if not handed_off:
+                self._report_result(status, result_or_error)
+                # --- 3. Cleanup Workspace ---
+                self._release_workspace(prepared_workspace_path)
+
+    def _submit_engine_job(self, prepared_workspace_path: Path, next_increment_str: Optional[str],
+                           sha5_value: Optional[str]) -> Future:
+        """Submits the engine run to the process pool, retrying once on a replacement pool if it is broken."""
+        submit = functools.partial(
+            process_in_worker,
+            self.rule,
+            workspace_path=prepared_workspace_path,
+            output_base_path=self.output_base_path,
+            incrementing_value=next_increment_str,
+            sha5_value=sha5_value
+        )
+        try:
+            return self.process_pool.submit(submit)
+        except BrokenProcessPool:
+            if self.replace_broken_pool is None:
+                raise
+            log.warning(f"Engine process pool is broken; retrying {self._input_str} on a new pool.")
+            self.process_pool = self.replace_broken_pool(self.process_pool)
+            return self.process_pool.submit(submit)
+
+    def _on_engine_finished(self, prepared_workspace_path: Path, engine_future):
+        """Done callback of a process pool job: reports its outcome and queues the workspace for cleanup."""
+        if self.engine_slots is not None:
+            self.engine_slots.release()
+        try:
+            result_or_error = engine_future.result()
+            status = "processed"
+            log.info(f"Worker Thread: Finished processing for rule: {self._input_str}, Status: {status}")
+        except Exception as proc_error:
+            log.error(f"Worker Thread: Error during engine processing for rule {self._input_str}: {proc_error}", exc_info=proc_error)
+            status = "failed_processing"
+            result_or_error = str(proc_error)
+            if isinstance(proc_error, BrokenProcessPool) and self.replace_broken_pool is not None:
+                # Only this task fails; later submissions go to a fresh pool
+                self.replace_broken_pool(self.process_pool)
+        # Report before retiring the workspace, so the outcome never waits on file system work
+        self._report_result(status, result_or_error)
+        self._release_workspace(prepared_workspace_path)
+
+    def _release_workspace(self, prepared_workspace_path: Optional[Path]):
+        """Gives up this task's workspace; removal happens on the cleanup thread, so the caller never waits on the deletes."""
+        if self.shared_workspace is not None:
+            self.shared_workspace.release()
+        elif prepared_workspace_path:
+            schedule_workspace_cleanup(prepared_workspace_path)
+
+    def _report_result(self, status: str, result_or_error):
+        """Reports completion regardless of success or failure."""
+        if self.results_queue is not None:
+            # Collected by the App's result timer, which handles a whole window of completions at once
+            self.results_queue.put((self._input_str, status, result_or_error))
+            log.debug("Worker Thread: Queued result for %s with status %s", self._input_str, status)
+        else:
             try:
-                 self.signals.finished.emit(str(self.rule.input_path), status, result_or_error)
-                 log.debug(f"Worker Thread: Emitted finished signal for {self.rule.input_path} with status {status}")
+                 self.signals.finished.emit(self._input_str, status, result_or_error)
+                 log.debug("Worker Thread: Emitted finished signal for %s with status %s", self._input_str, status)
             except Exception as sig_err:
-                 log.error(f"Worker Thread: Error emitting finished signal for {self.rule.input_path}: {sig_err}")
-
-            # --- 3. Cleanup Workspace ---
-            # Use the path returned by the utility function for cleanup
-            if prepared_workspace_path and prepared_workspace_path.exists():
-                try:
-                    log.info(f"Cleaning up temporary workspace: {prepared_workspace_path}")
-                    shutil.rmtree(prepared_workspace_path)
-                except OSError as cleanup_error:
-                    log.error(f"Worker Thread: Failed to cleanup temporary workspace {prepared_workspace_path}: {cleanup_error}")
+                 log.error(f"Worker Thread: Error emitting finished signal for {self._input_str}: {sig_err}")
 
 
+# --- Cached Startup Lookups ---
+# App startup (possibly twice around first-time setup) reads the same settings files and preset
+# directories; results are cached and keyed on modification times so edits are still picked up.
+def _mtime_ns(path: Path) -> int:
+    """Returns the modification time of a path in nanoseconds, or -1 if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+@functools.lru_cache(maxsize=8)
+def _load_settings_cached(settings_path: str, mtime_ns: int):
+    """Parses a user settings JSON file. mtime_ns is only part of the cache key."""
+    with open(settings_path, "r", encoding="utf-8") as settings_file:
+        return json.load(settings_file)
+
+@functools.lru_cache(maxsize=8)
+def _preset_lookup_cached(user_config_dir: Optional[Path], base_dir_app_bundled: Path,
+                          user_presets_mtime_ns: int, bundled_presets_mtime_ns: int) -> Tuple[Tuple[str, ...], Dict[str, str]]:
+    """
+    Returns the available preset names and a lowercase-name -> name lookup. The preset
+    directory mtimes are only part of the cache key; they change when presets are added or removed.
+    """
+    available_presets = tuple(get_available_preset_names(user_config_dir, base_dir_app_bundled))
+    return available_presets, {name.lower(): name for name in available_presets}
+
+def _get_preset_lookup(user_config_dir: Optional[Path], base_dir_app_bundled: Path) -> Tuple[Tuple[str, ...], Dict[str, str]]:
+    user_presets_mtime_ns = _mtime_ns(user_config_dir / Configuration.USER_PRESETS_SUBDIR_NAME) if user_config_dir else -1
+    bundled_presets_mtime_ns = _mtime_ns(base_dir_app_bundled / Configuration.PRESETS_DIR_APP_BUNDLED_NAME)
+    return _preset_lookup_cached(user_config_dir, base_dir_app_bundled, user_presets_mtime_ns, bundled_presets_mtime_ns)
 
 
 # --- Main Application Class (Integrates GUI and Engine) ---
+# How often queued task results are collected on the main thread
+TASK_RESULTS_INTERVAL_MS = 50
+# Task statuses counted under their own name; every other status counts as failed
+_COUNTED_TASK_STATUSES = frozenset(("processed", "skipped"))
+
 class App(QObject):
     # Signal emitted when all queued processing tasks are complete
     all_tasks_finished = Signal(int, int, int) # processed_count, skipped_count, failed_count (Placeholder counts for now)
@@ -322,12 +686,44 @@ class App(QObject):
         self.main_window = None
         self.thread_pool = QThreadPool()
         self._active_tasks_count = 0
-        self._task_results = {"processed": 0, "skipped": 0, "failed": 0}
-        log.info(f"Maximum threads for pool: {self.thread_pool.maxThreadCount()}")
+        self._task_results = collections.Counter()
+        self._total_tasks_count = 0
+        # Tasks of the current batch, kept referenced until the batch completes
+        self._scheduled_tasks = []
+        # SHA5 per archive version, so archives re-queued in later batches or sessions are not
+        # hashed again; persisted in the user config directory once the configuration is loaded
+        self._sha5_cache = Sha5Cache()
+        # Jobs that completed before, so an unchanged rule is not processed again; persisted like the SHA5 cache
+        self._result_cache = ResultCache()
+        # Input path -> job fingerprint for the current batch, recorded in _result_cache on success
+        self._result_fingerprints = {}
+        # Outcomes queued by worker threads, drained on the main thread by a timer instead of one
+        # queued signal per task, so progress updates happen at most once per interval
+        self._task_results_queue = queue.SimpleQueue()
+        self._task_results_timer = QTimer(self)
+        self._task_results_timer.setInterval(TASK_RESULTS_INTERVAL_MS)
+        self._task_results_timer.timeout.connect(self._drain_task_results)
+        # Worker processes for engine.process, created on the first request and resized to the requested worker count
+        self._process_pool = None
+        self._process_pool_workers = 0
+        # Tasks replace a broken pool from their own threads
+        self._process_pool_lock = threading.Lock()
+        # Threads for the per-batch SHA5 pre-pass; hashlib releases the GIL, so hashes run in parallel
+        self._hash_executor = None
 
         self.active_preset_name = None
 
         self._load_config(self.user_config_path, self._preset_override)
+        # Qt defaults to one thread per core; use the configured worker count, which the
+        # engine process pool also defaults to, so both dispatch paths agree
+        if self.config_obj:
+            self.thread_pool.setMaxThreadCount(self.config_obj.max_workers)
+            self._sha5_cache = Sha5Cache(
+                self.user_config_path / HASH_CACHE_FILENAME if self.user_config_path else None,
+                variant="full" if uses_full_content_hash(self.config_obj) else "prefix",
+            )
+            self._result_cache = ResultCache(self.user_config_path / RESULT_CACHE_FILENAME if self.user_config_path else None)
+        log.info(f"Maximum threads for pool: {self.thread_pool.maxThreadCount()}")
         self._init_engine()
         self._init_gui()
 
@@ -355,11 +751,14 @@ class App(QObject):
         )
 
         for settings_path in possible_paths:
-            if not settings_path.is_file():
+            try:
+                settings_stat = os.stat(settings_path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(settings_stat.st_mode):
                 continue
             try:
-                with open(settings_path, "r", encoding="utf-8") as settings_file:
-                    settings_data = json.load(settings_file)
+                settings_data = _load_settings_cached(os.fspath(settings_path), settings_stat.st_mtime_ns)
             except json.JSONDecodeError as exc:
                 log.warning(f"Could not parse user settings JSON at '{settings_path}': {exc}")
                 continue
@@ -386,8 +785,7 @@ class App(QObject):
     def _determine_initial_preset(self, user_config_dir: Path | None, preset_override: str | None) -> str:
         """Determines which preset should be used when loading configuration."""
         base_dir_app_bundled = self._determine_app_base_dir()
-        available_presets = get_available_preset_names(user_config_dir, base_dir_app_bundled)
-        available_lookup = {name.lower(): name for name in available_presets}
+        available_presets, available_lookup = _get_preset_lookup(user_config_dir, base_dir_app_bundled)
 
         def resolve_candidate(candidate: str | None) -> str | None:
             if not candidate:
@@ -430,6 +828,8 @@ class App(QObject):
                 preset_to_use,
                 actual_user_config_dir if actual_user_config_dir else "<bundled defaults>",
             )
+            if self.config_obj.use_ram_workspace:
+                use_ram_workspace_root()
         except ConfigurationError as e:
             log.error(f"Fatal: Failed to load base configuration using user config path '{user_config_path}': {e}")
             # In a real app, show this error to the user before exiting
@@ -452,9 +852,114 @@ class App(QObject):
             log.error("Fatal: Cannot initialize ProcessingEngine without configuration.")
             sys.exit(1)
 
+    def _get_process_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        """Returns the engine process pool, recreating it if the requested worker count changed."""
+        with self._process_pool_lock:
+            if self._process_pool is None or self._process_pool_workers != max_workers:
+                self._start_process_pool(max_workers)
+            return self._process_pool
+
+    def _replace_broken_process_pool(self, broken_pool: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """
+        Replaces the engine process pool after a worker died (e.g. killed for memory or a native
+        crash), which leaves the whole pool unusable. Safe to call from several task threads for
+        the same broken pool; only the first call starts a new one. Returns the current pool.
+        """
+        with self._process_pool_lock:
+            if self._process_pool is broken_pool:
+                log.error("Engine process pool is broken (a worker process died). Starting a new pool.")
+                self._start_process_pool(self._process_pool_workers)
+            return self._process_pool
+
+    def _start_process_pool(self, max_workers: int):
+        """Shuts down the current engine process pool, if any, and starts a new one. Call with _process_pool_lock held."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False)
+        # Spawn rather than fork: forking a process that already runs Qt threads is unsafe
+        self._process_pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_engine_worker,
+            initargs=(log.isEnabledFor(logging.DEBUG), self.config_obj),
+        )
+        self._process_pool_workers = max_workers
+        # Workers are spawned on demand; one warm-up job per worker starts them all now
+        for _ in range(max_workers):
+            self._process_pool.submit(warm_up_worker)
+        log.info(f"Started engine process pool with {max_workers} worker(s).")
+
+    def _get_hash_executor(self) -> ThreadPoolExecutor:
+        """Returns the executor for the SHA5 pre-pass, creating it on first use."""
+        if self._hash_executor is None:
+            self._hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="Sha5PrePass")
+        return self._hash_executor
+
+    def _start_sha5_prepass(self, source_rules: list) -> Dict[str, Future]:
+        """
+        Starts calculating the SHA5 of every input in the batch that is not cached yet, so
+        archives are hashed in parallel up front instead of when their task gets a thread.
+        Returns input path -> Future; cached values come back as already completed futures.
+        Uncached ZIPs that need a full content hash are left to their task, which hashes
+        them while extracting from the same memory map.
+        """
+        if not patterns_use_sha5(self.config_obj):
+            return {}
+        full_content_hash = uses_full_content_hash(self.config_obj)
+        hash_executor = None
+        sha5_futures = {}
+        for rule in source_rules:
+            input_str = os.fspath(rule.input_path)
+            if input_str in sha5_futures:
+                continue
+            # One stat per input serves the cache lookup and, through calculate_sha5, the hash
+            try:
+                input_stat = os.stat(input_str)
+            except OSError:
+                continue # Missing input; its task reports the preparation error
+            cache_key = sha5_cache_key(input_str, input_stat)
+            if cache_key is None:
+                continue # Directory
+            # Archives hashed in an earlier batch or session and unchanged since keep their SHA5
+            cached_sha5 = self._sha5_cache.get(cache_key)
+            if cached_sha5 is not None:
+                sha5_futures[input_str] = cached_future = Future()
+                cached_future.set_result(cached_sha5)
+                continue
+            if full_content_hash and input_str.lower().endswith('.zip'):
+                continue
+            if hash_executor is None:
+                hash_executor = self._get_hash_executor()
+            sha5_futures[input_str] = hash_executor.submit(
+                calculate_sha5, input_str, full_content_hash, self._sha5_cache, input_stat
+            )
+        if sha5_futures:
+            log.debug("SHA5 pre-pass covers %s input(s).", len(sha5_futures))
+        return sha5_futures
+
+    @staticmethod
+    def _shared_workspaces(source_rules: list) -> Dict[int, SharedWorkspace]:
+        """
+        Groups rules whose input paths resolve to the same file or folder, so each such input
+        is extracted once per batch. Returns id(rule) -> SharedWorkspace for grouped rules only.
+        """
+        rules_by_input = collections.defaultdict(list)
+        for rule in source_rules:
+            input_str = os.fspath(rule.input_path)
+            rules_by_input[os.path.normcase(os.path.realpath(input_str))].append(rule)
+        shared_workspaces = {}
+        for rules in rules_by_input.values():
+            if len(rules) < 2:
+                continue
+            shared_workspace = SharedWorkspace(os.fspath(rules[0].input_path), len(rules))
+            log.info(f"{len(rules)} rules share the input {shared_workspace.input_path}; preparing its workspace once.")
+            for rule in rules:
+                shared_workspaces[id(rule)] = shared_workspace
+        return shared_workspaces
+
     def _init_gui(self):
         """Initializes the MainWindow and connects signals."""
         if self.processing_engine:
+            from gui.main_window import MainWindow
             self.main_window = MainWindow() # MainWindow now part of the App
             # Connect the signal from the GUI to the App's slot using QueuedConnection
             # Connect the signal from the MainWindow (which is triggered by the panel) to the App's slot
@@ -476,10 +981,10 @@ class App(QObject):
         log.debug("DEBUG: App.on_processing_requested slot entered.")
         """Handles the processing request from the GUI."""
         log.info(f"Received processing request for {len(source_rules)} rule sets.")
-        log.info(f"DEBUG: Rules received by on_processing_requested: {source_rules}")
+        log.debug("Rules received by on_processing_requested: %s", source_rules)
         log.info(f"VERIFY: App.on_processing_requested received {len(source_rules)} rules.")
         for i, rule in enumerate(source_rules):
-            log.debug(f"  VERIFY Rule {i}: Input='{rule.input_path}', Assets={len(rule.assets)}")
+            log.debug("  VERIFY Rule %s: Input='%s', Assets=%s", i, rule.input_path, len(rule.assets))
         if not self.processing_engine:
             log.error("Processing engine not available. Cannot process request.")
             self.main_window.statusBar().showMessage("Error: Processing Engine not ready.", 5000)
@@ -489,19 +994,133 @@ class App(QObject):
             self.main_window.statusBar().showMessage("No rules to process.", 3000)
             return
 
+        output_dir_str = processing_settings.get("output_dir") if processing_settings else None
+        if not output_dir_str:
+            log.error("Processing requested without an output directory.")
+            self.main_window.statusBar().showMessage("Error: No output directory specified.", 5000)
+            self.all_tasks_finished.emit(0, 0, len(source_rules))
+            return
+        output_base_path = Path(output_dir_str)
+        default_workers = self.config_obj.max_workers if self.config_obj else 1
+        try:
+            max_workers = max(1, int(processing_settings.get("workers") or default_workers))
+        except (TypeError, ValueError):
+            max_workers = default_workers
+        # One task thread per engine worker process
+        self.thread_pool.setMaxThreadCount(max_workers)
+        process_pool = self._get_process_pool(max_workers)
+        # Task threads hand jobs to the process pool without waiting; at most one extra prepared
+        # workspace per worker queues up behind the running jobs
+        engine_slots = threading.Semaphore(2 * max_workers)
+
         # Reset task counter and results for this batch
         self._active_tasks_count = len(source_rules)
-        self._task_results = {"processed": 0, "skipped": 0, "failed": 0}
-        log.debug(f"Initialized active task count to: {self._active_tasks_count}")
+        self._total_tasks_count = self._active_tasks_count
+        self._task_results = collections.Counter()
+        self._scheduled_tasks = []
+        log.debug("Initialized active task count to: %s", self._active_tasks_count)
 
         # Update GUI progress bar/status via MainPanelWidget
-        total_tasks = self.main_window.main_panel_widget.progress_bar.maximum()
-        completed_tasks = total_tasks - self._active_tasks_count
-        self.main_window.main_panel_widget.update_progress_bar(completed_tasks, total_tasks) # Use MainPanelWidget's method
+        self.main_window.main_panel_widget.update_progress_bar(0, self._total_tasks_count)
+
+        # Rules whose job already completed with this input, rule and configuration are reported
+        # as skipped without being extracted or processed again, unless overwriting
+        if processing_settings.get("overwrite"):
+            self._result_fingerprints = {}
+            rules_to_run = source_rules
+        else:
+            rules_to_run = self._skip_completed_rules(source_rules, output_base_path)
+
+        # Scan the output directory once per batch and give each task its own value, so tasks
+        # running concurrently do not all claim the same next number.
+        first_increment_str = self._next_incrementing_value(output_base_path)
+        increment_width = len(first_increment_str) if first_increment_str else 0
+        first_increment = int(first_increment_str) if first_increment_str else 0
+
+        sha5_futures = self._start_sha5_prepass(rules_to_run)
+        shared_workspaces = self._shared_workspaces(rules_to_run)
+        for task_index, rule in enumerate(rules_to_run):
+            incrementing_value = f"{first_increment + task_index:0{increment_width}d}" if first_increment_str else None
+            sha5_future = sha5_futures.get(os.fspath(rule.input_path))
+            task = ProcessingTask(
+                self.processing_engine,
+                rule,
+                workspace_path=Path(rule.input_path),
+                output_base_path=output_base_path,
+                sha5_cache=self._sha5_cache,
+                process_pool=process_pool,
+                replace_broken_pool=self._replace_broken_process_pool,
+                incrementing_value=incrementing_value,
+                results_queue=self._task_results_queue,
+                sha5_future=sha5_future,
+                engine_slots=engine_slots,
+                shared_workspace=shared_workspaces.get(id(rule)),
+            )
+            self._scheduled_tasks.append(task)
+            self.thread_pool.start(task)
+        self._task_results_timer.start()
+        log.info(f"Scheduled {len(self._scheduled_tasks)} processing tasks.")
+
+    def _skip_completed_rules(self, source_rules: list, output_base_path: Path) -> list:
+        """
+        Queues a "skipped" result for every rule whose job completed before and whose metadata
+        files still exist, and returns the rules that need processing. Fingerprints of the
+        returned rules are kept in _result_fingerprints so successful results can be recorded.
+        Directory inputs are always processed, since their mtime does not reflect nested changes.
+        """
+        settings_fingerprint = self.config_obj.settings_fingerprint
+        fingerprints = {}
+        rules_to_run = []
+        for rule in source_rules:
+            input_str = os.fspath(rule.input_path)
+            input_key = sha5_cache_key(input_str)
+            if input_key is None:
+                rules_to_run.append(rule)
+                continue
+            fingerprint = result_fingerprint(rule, input_key, output_base_path, settings_fingerprint)
+            if self._result_cache.completed_outputs(fingerprint):
+                log.info(f"Skipping {input_str}: already processed with the same input, rules and settings.")
+                self._task_results_queue.put((input_str, "skipped", "Unchanged since the last run"))
+                continue
+            # Several rules for the same input string cannot be told apart in the results
+            fingerprints[input_str] = None if input_str in fingerprints else fingerprint
+            rules_to_run.append(rule)
+        self._result_fingerprints = fingerprints
+        return rules_to_run
+
+    def _next_incrementing_value(self, output_base_path: Path) -> Optional[str]:
+        """Returns the next free incrementing value in the output directory, or None if the pattern has no such token."""
+        pattern = getattr(self.processing_engine.config_obj, 'output_directory_pattern', None)
+        if not pattern or not _INCREMENT_TOKEN_RE.search(pattern):
+            return None
+        try:
+            next_increment_str = get_next_incrementing_value(output_base_path, pattern)
+            if next_increment_str.isdigit():
+                return next_increment_str
+            log.warning(f"Ignoring non-numeric incrementing value '{next_increment_str}' for {output_base_path}.")
+        except Exception as e:
+            log.exception(f"Error calculating next incrementing value for {output_base_path}: {e}")
+        return None
 
-        # Update status for the specific file in the GUI (if needed)
+    @Slot()
+    def _drain_task_results(self):
+        """Records every task outcome queued since the last tick and reports when the batch is done."""
+        if self._task_results_queue.empty():
+            return
+        while True:
+            try:
+                rule_input_path, status, result_or_error = self._task_results_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._record_task_result(rule_input_path, status, result_or_error)
+
+        # Update GUI progress bar/status via MainPanelWidget, once for all results of this tick
+        completed_tasks = self._total_tasks_count - self._active_tasks_count
+        self.main_window.main_panel_widget.update_progress_bar(completed_tasks, self._total_tasks_count)
 
         if self._active_tasks_count == 0:
+            self._task_results_timer.stop()
+            self._scheduled_tasks = []
             log.info("All processing tasks finished.")
             # Emit the signal with the final counts
             self.all_tasks_finished.emit(
@@ -512,6 +1131,23 @@ class App(QObject):
         elif self._active_tasks_count < 0:
              log.error("Error: Active task count went below zero!") # Should not happen
 
+    def _record_task_result(self, rule_input_path: str, status: str, result_or_error: object):
+        """Counts the outcome of one ProcessingTask and shows it in the GUI."""
+        # Only ever called from _drain_task_results on the main thread, so no locking is needed
+        counted_status = status if status in _COUNTED_TASK_STATUSES else "failed"
+        self._task_results[counted_status] += 1
+        self._active_tasks_count -= 1
+        log.debug("Task for %s finished with status %s. Remaining: %s", rule_input_path, status, self._active_tasks_count)
+
+        # Remember jobs whose assets all processed, so an unchanged rerun can skip them
+        fingerprint = self._result_fingerprints.pop(rule_input_path, None)
+        if fingerprint and status == "processed" and isinstance(result_or_error, dict) and not result_or_error.get("failed"):
+            self._result_cache.record(fingerprint, result_or_error.get("metadata_files", []))
+
+        # Update status for the specific file in the GUI
+        message = result_or_error if isinstance(result_or_error, str) else ""
+        self.main_window.update_file_status(rule_input_path, counted_status, message)
+
     def run(self):
         """Shows the main window."""
         if self.main_window:
@@ -538,8 +1174,10 @@ if __name__ == "__main__":
         log.info("No required CLI arguments detected, starting GUI mode.")
         # --- Run the GUI Application ---
         try:
+            from PySide6.QtWidgets import QApplication, QDialog # QDialog for the setup dialog result
+            from gui.first_time_setup_dialog import FirstTimeSetupDialog
             user_config_path = app_setup_utils.read_saved_user_config_path()
-            log.debug(f"Read saved user config path: {user_config_path}")
+            log.debug("Read saved user config path: %s", user_config_path)
 
             first_run_needed = False
             if user_config_path is None or not user_config_path.strip():
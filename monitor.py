@@ -1,17 +1,26 @@
 
+import copy
+import functools
 import os
 import sys
 import time
 import logging
+import queue
 import re
+import threading
 import shutil
+import signal
 import tempfile
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
-from watchdog.observers.polling import PollingObserver as Observer # Use polling for better compatibility
-from watchdog.events import FileSystemEventHandler, FileCreatedEvent
-
-from utils.hash_utils import calculate_sha256
+import multiprocessing
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+from watchdog.observers import Observer # Native events (inotify / FSEvents / ReadDirectoryChangesW)
+from watchdog.observers.polling import PollingObserver # Only for network mounts, which deliver no native events
+from watchdog.events import PatternMatchingEventHandler, FileCreatedEvent, FileMovedEvent
+
+from utils.hash_utils import calculate_sha256, calculate_sha256_prefix
 from utils.path_utils import get_next_incrementing_value
 
 from configuration import load_config, ConfigurationError
@@ -40,9 +49,11 @@ ERROR_DIR = Path(os.environ.get('ERROR_DIR', '/data/error'))
 LOG_LEVEL_STR = os.environ.get('LOG_LEVEL', 'INFO').upper()
 POLL_INTERVAL = int(os.environ.get('POLL_INTERVAL', '5'))
 PROCESS_DELAY = int(os.environ.get('PROCESS_DELAY', '2'))
-# Default workers for monitor - can be overridden if needed via env var
-DEFAULT_WORKERS = max(1, os.cpu_count() // 2 if os.cpu_count() else 1)
-NUM_WORKERS = int(os.environ.get('NUM_WORKERS', str(DEFAULT_WORKERS)))
+# Worker counts - can be overridden via env vars. Preparation (hashing, prediction, extraction)
+# mostly waits on disk and archive tools, so its pool is larger than the engine's.
+CPU_COUNT = os.cpu_count() or 1
+NUM_WORKERS_IO = int(os.environ.get('NUM_WORKERS_IO', str(CPU_COUNT * 2)))
+NUM_WORKERS = int(os.environ.get('NUM_WORKERS', str(CPU_COUNT))) # Engine worker processes
 
 # Configure logging (ensure logger is available before potential import errors)
 log_level = getattr(logging, LOG_LEVEL_STR, logging.INFO)
@@ -58,15 +69,49 @@ log.info(f"Processed Files Directory: {PROCESSED_DIR}")
 log.info(f"Error Files Directory: {ERROR_DIR}")
 log.info(f"Polling Interval: {POLL_INTERVAL}s")
 log.info(f"Processing Delay: {PROCESS_DELAY}s")
-log.info(f"Max Workers: {NUM_WORKERS}")
+log.info(f"Preparation Workers: {NUM_WORKERS_IO}")
+log.info(f"Engine Workers: {NUM_WORKERS}")
 
 
 SUPPORTED_SUFFIXES = ['.zip', '.rar', '.7z']
-
-class ZipHandler(FileSystemEventHandler):
-    """Handles file system events for new ZIP files."""
+# Move reason for archives whose processing was cut short by shutdown; they stay in the input directory
+INTERRUPTED_REASON = "interrupted"
+# Set by ZipHandler.shutdown, so failures caused by stopping the pools are not blamed on archives
+_shutdown_requested = threading.Event()
+_INCREMENT_TOKEN_RE = re.compile(r"\[IncrementingValue\]|#+")
+# File system types whose changes made by other hosts never reach the native watch APIs
+NETWORK_FS_TYPES = {'nfs', 'nfs4', 'cifs', 'smb', 'smb2', 'smbfs', 'smb3', 'afs', 'ncpfs', 'fuse.sshfs', '9p'}
+
+def _is_network_fs(path: Path) -> bool:
+    """
+    Returns True if path lies on a network file system according to /proc/mounts
+    (the longest mount point containing it wins). Returns False where /proc/mounts
+    is unavailable, e.g. outside Linux.
+    """
+    try:
+        with open('/proc/mounts', 'r') as mounts:
+            mount_entries = [line.split()[1:3] for line in mounts if len(line.split()) >= 3]
+    except OSError:
+        return False
+    resolved = str(path.resolve())
+    best_mount, best_fs_type = '', ''
+    for mount_point, fs_type in mount_entries:
+        mount_point = mount_point.replace('\\040', ' ') # /proc/mounts escapes spaces
+        contains = resolved == mount_point or resolved.startswith(mount_point.rstrip('/') + '/')
+        if contains and len(mount_point) > len(best_mount):
+            best_mount, best_fs_type = mount_point, fs_type
+    return best_fs_type.lower() in NETWORK_FS_TYPES
+
+class ZipHandler(PatternMatchingEventHandler):
+    """Handles file system events for new archives (see SUPPORTED_SUFFIXES)."""
 
     def __init__(self, input_dir: Path, output_dir: Path, processed_dir: Path, error_dir: Path):
+        # Events for directories and other file types are dropped in dispatch(), before any handler runs
+        super().__init__(
+            patterns=[f"*{suffix}" for suffix in SUPPORTED_SUFFIXES],
+            ignore_directories=True,
+            case_sensitive=False,
+        )
         self.input_dir = input_dir.resolve()
         self.output_dir = output_dir.resolve()
         self.processed_dir = processed_dir.resolve()
@@ -75,43 +120,121 @@ class ZipHandler(FileSystemEventHandler):
         self.processed_dir.mkdir(parents=True, exist_ok=True)
         self.error_dir.mkdir(parents=True, exist_ok=True)
 
-        self.executor = ThreadPoolExecutor(max_workers=NUM_WORKERS)
-        log.info(f"Handler initialized, target directories ensured. ThreadPoolExecutor started with {NUM_WORKERS} workers.")
+        # Archives are prepared on io_pool and processed on cpu_pool. engine_slots bounds the
+        # prepared workspaces waiting for an engine worker, so preparation cannot run far ahead.
+        self.io_pool = ThreadPoolExecutor(max_workers=NUM_WORKERS_IO, thread_name_prefix="ArchivePrep")
+        # Engine runs hold the GIL between numpy/OpenCV calls, so they get worker processes
+        self.cpu_pool = ProcessPoolExecutor(
+            max_workers=NUM_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_engine_worker,
+        )
+        self.engine_slots = threading.BoundedSemaphore(NUM_WORKERS * 2)
+        # Moves archives and removes workspaces after engine runs, off the process pool's manager thread
+        self.finish_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ArchiveFinish")
+        log.info(f"Handler initialized, target directories ensured. Started {NUM_WORKERS_IO} preparation and {NUM_WORKERS} engine workers.")
+
+        # Detected archives waiting to finish writing, as (deadline, path, last sampled size or -1).
+        # The observer thread only enqueues; the dispatcher thread waits and submits.
+        self._pending = queue.PriorityQueue()
+        self._pending_paths = set() # Paths in _pending, so repeated events do not queue an archive twice
+        self._pending_lock = threading.Lock()
+        self._stop_dispatch = threading.Event()
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="ArchiveDispatcher", daemon=True)
+        self._dispatcher.start()
 
     def on_created(self, event: FileCreatedEvent):
-        """Called when a file or directory is created. Submits task to executor."""
-        if event.is_directory:
-            return
-
+        """Called when an archive is created. Submits task to executor."""
         src_path = Path(event.src_path)
         log.debug(f"File creation event detected: {src_path}")
-
-        if src_path.suffix.lower() not in SUPPORTED_SUFFIXES:
-            log.debug(f"Ignoring file with unsupported extension: {src_path.name}")
-            return
-
+        self._queue_archive(src_path)
+
+    def on_moved(self, event: FileMovedEvent):
+        """
+        Called when a file is renamed. Archives are often written under a temporary name
+        and renamed once complete, so a rename to an archive name counts as its arrival.
+        """
+        dest_path = Path(event.dest_path)
+        if dest_path.suffix.lower() not in SUPPORTED_SUFFIXES or dest_path.parent.resolve() != self.input_dir:
+            return # Renamed away from an archive name, or out of the input directory
+        log.debug(f"File move event detected: {event.src_path} -> {dest_path}")
+        self._queue_archive(dest_path)
+
+    def _queue_archive(self, src_path: Path):
+        """Schedules the archive for processing once PROCESS_DELAY has passed; returns immediately."""
+        path_str = str(src_path)
+        with self._pending_lock:
+            if path_str in self._pending_paths:
+                log.debug(f"Archive already waiting to be queued: {src_path.name}")
+                return
+            self._pending_paths.add(path_str)
         log.info(f"Detected new archive: {src_path.name}. Waiting {PROCESS_DELAY}s before queueing...")
-        time.sleep(PROCESS_DELAY) # Wait for file write to complete
-
-        # Re-check if file still exists (might have been temporary or moved quickly)
-        if not src_path.exists():
-            log.warning(f"File disappeared after delay: {src_path.name}")
-            return
-
-        log.info(f"Queueing processing task for: {src_path.name}")
-        self.executor.submit(
-            _process_archive_task,
-            archive_path=src_path,
-            output_dir=self.output_dir,
-            processed_dir=self.processed_dir,
-            error_dir=self.error_dir
-        )
+        self._pending.put((time.monotonic() + PROCESS_DELAY, path_str, -1))
+
+    def _dispatch_loop(self):
+        """
+        Runs on the dispatcher thread. Once an archive's deadline has passed, its size is sampled;
+        it is submitted to the preparation pool when two samples POLL_INTERVAL/2 apart agree, so files
+        still being written are not picked up.
+        """
+        while not self._stop_dispatch.is_set():
+            try:
+                deadline, path_str, last_size = self._pending.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                # Not due yet; put it back and look again shortly (an earlier arrival may come in meanwhile)
+                self._pending.put((deadline, path_str, last_size))
+                self._stop_dispatch.wait(min(0.5, remaining))
+                continue
+
+            src_path = Path(path_str)
+            try:
+                size = src_path.stat().st_size
+            except OSError:
+                # Might have been temporary or moved quickly
+                log.warning(f"File disappeared after delay: {src_path.name}")
+                self._discard_pending(path_str)
+                continue
+            if size != last_size:
+                log.debug(f"Archive {src_path.name} is {size} bytes; checking again in {POLL_INTERVAL / 2}s.")
+                self._pending.put((time.monotonic() + POLL_INTERVAL / 2, path_str, size))
+                continue
+
+            self._discard_pending(path_str)
+            log.info(f"Queueing processing task for: {src_path.name}")
+            self.io_pool.submit(
+                _process_archive_task,
+                archive_path=src_path,
+                output_dir=self.output_dir,
+                processed_dir=self.processed_dir,
+                error_dir=self.error_dir,
+                cpu_pool=self.cpu_pool,
+                finish_pool=self.finish_pool,
+                engine_slots=self.engine_slots
+            )
+
+    def _discard_pending(self, path_str: str):
+        with self._pending_lock:
+            self._pending_paths.discard(path_str)
 
     def shutdown(self):
-        """Shuts down the thread pool executor."""
-        log.info("Shutting down thread pool executor...")
-        self.executor.shutdown(wait=True)
-        log.info("Executor shut down.")
+        """
+        Stops the dispatcher and shuts down the pools, letting running and queued archives
+        finish. Archives not queued yet, or that cannot be processed because shutdown is
+        underway, are left in place.
+        """
+        _shutdown_requested.set()
+        self._stop_dispatch.set()
+        self._dispatcher.join()
+        log.info("Shutting down preparation and engine pools...")
+        # Preparation tasks submit to the engine pool, so it is shut down after them
+        self.io_pool.shutdown(wait=True)
+        self.cpu_pool.shutdown(wait=True)
+        # Engine done callbacks submit here until cpu_pool has finished
+        self.finish_pool.shutdown(wait=True)
+        log.info("Pools shut down.")
 
     # move_file remains largely the same, but called from _process_archive_task now
     # We make it static or move it outside the class if _process_archive_task is outside
@@ -138,47 +261,121 @@ class ZipHandler(FileSystemEventHandler):
             log.exception(f"Failed to move file {src.name} to {dest_dir}: {e}")
 
 
-def _process_archive_task(archive_path: Path, output_dir: Path, processed_dir: Path, error_dir: Path):
+def _cfg_get(config, key: str, default=None):
+    """Reads a setting from the configuration, which load_config may return as an object or a dict."""
+    if isinstance(config, dict):
+        return config.get(key, default)
+    return getattr(config, key, default)
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached():
+    """
+    Loads the application configuration once per monitor process and shares it between
+    tasks; restart the monitor to pick up configuration changes. Failures are not cached.
+    """
+    config = load_config() # Might need path argument depending on implementation
+    if not config:
+        raise ConfigurationError("Failed to load application configuration.")
+    return config
+
+@functools.lru_cache(maxsize=256)
+def _predict_source_rule_cached(archive_path_str: str, size: int, mtime_ns: int, content_sha: str) -> SourceRule:
+    """
+    Memoizes generate_source_rule_from_archive per archive version, so an archive dropped
+    again unchanged skips prediction. The digest usually covers only the first MiB, while a
+    ZIP lists its members at the end, so the key is (path, size, mtime_ns) like Sha5Cache's,
+    plus the digest. Callers must copy the returned rule before modifying it. Failed
+    predictions raise and are not cached.
+    """
+    return generate_source_rule_from_archive(Path(archive_path_str), _load_config_cached())
+
+# (output_dir, pattern) -> (output_dir mtime_ns at the last scan, next value to hand out, digits)
+_increment_state = {}
+_increment_lock = threading.Lock()
+
+def _get_next_incrementing_value(output_dir: Path, pattern: str) -> str:
+    """
+    get_next_incrementing_value, for tasks that may run before earlier tasks have created their
+    output directories. When the token is in the pattern's first segment, numbered directories
+    are direct children of output_dir, so its scan is reused while output_dir's modification time
+    is unchanged, and every value handed out advances the next one, like the App allocating
+    first + task_index for a batch. Nested patterns are scanned on every call.
     """
-    Task executed by the ThreadPoolExecutor to process a single archive file.
+    first_segment = re.split(r"[\\/]", pattern, maxsplit=1)[0]
+    if not _INCREMENT_TOKEN_RE.search(first_segment):
+        return get_next_incrementing_value(output_dir, pattern)
+    try:
+        output_dir_mtime_ns = os.stat(output_dir).st_mtime_ns
+    except OSError:
+        return get_next_incrementing_value(output_dir, pattern)
+    state_key = (str(output_dir), pattern)
+    with _increment_lock:
+        state = _increment_state.get(state_key)
+        if state is not None and state[0] == output_dir_mtime_ns:
+            next_value, num_digits = state[1], state[2]
+        else:
+            next_value_str = get_next_incrementing_value(output_dir, pattern)
+            if not next_value_str.isdigit():
+                return next_value_str
+            num_digits = len(next_value_str)
+            next_value = int(next_value_str)
+            if state is not None:
+                # Values handed out earlier may not have their directories yet
+                next_value = max(next_value, state[1])
+        _increment_state[state_key] = (output_dir_mtime_ns, next_value + 1, num_digits)
+    return f"{next_value:0{num_digits}d}"
+
+def _failure_reason(archive_path: Path, error: Exception) -> str:
+    """Logs a task failure and returns the move reason recorded for it."""
+    if isinstance(error, FileNotFoundError):
+        log.error(f"[Task:{archive_path.name}] Prerequisite file not found: {error}")
+        return "file_not_found"
+    if isinstance(error, (ConfigurationError, PredictionError, WorkspaceError, ProcessingError)):
+        log.error(f"[Task:{archive_path.name}] Processing failed: {error}", exc_info=error)
+        return f"{type(error).__name__.lower()}" # e.g., "predictionerror"
+    log.error(f"[Task:{archive_path.name}] An unexpected error occurred during processing: {error}", exc_info=error)
+    return "unexpected_exception"
+
+def _process_archive_task(archive_path: Path, output_dir: Path, processed_dir: Path, error_dir: Path,
+                          cpu_pool: ProcessPoolExecutor, finish_pool: ThreadPoolExecutor,
+                          engine_slots: Optional[threading.Semaphore] = None):
+    """
+    Preparation phase for a single archive file, executed by the handler's preparation pool:
+    loads the configuration, hashes the archive, predicts its rule and extracts its workspace.
+    The engine run (_run_engine) is then submitted to cpu_pool; when it completes,
+    _on_engine_finished has finish_pool move the archive and remove the workspace. engine_slots, when
+    given, is held from before extraction until the engine run finishes.
     """
     log.info(f"[Task:{archive_path.name}] Starting processing.")
     temp_workspace_path: Optional[Path] = None
     config = None
     source_rule = None
     move_reason = "unknown_error" # Default reason if early exit
+    slot_acquired = False
+    handed_off = False # Set once the engine phase owns finishing the task
 
     try:
         log.debug(f"[Task:{archive_path.name}] Loading configuration...")
         # Assuming load_config() loads the main app config (e.g., app_settings.json)
         # and potentially merges preset defaults or paths. Adjust if needed.
-        config = load_config() # Might need path argument depending on implementation
-        if not config:
-            raise ConfigurationError("Failed to load application configuration.")
+        config = _load_config_cached()
         log.debug(f"[Task:{archive_path.name}] Configuration loaded.")
 
-        log.debug(f"[Task:{archive_path.name}] Generating source rule prediction...")
-        # This function now handles preset extraction and validation internally
-        source_rule = generate_source_rule_from_archive(archive_path, config)
-        log.info(f"[Task:{archive_path.name}] SourceRule generated successfully.")
-
-        log.debug(f"[Task:{archive_path.name}] Preparing processing workspace...")
-        # This utility should handle extraction and return the temp dir path
-        temp_workspace_path = prepare_processing_workspace(archive_path)
-        log.info(f"[Task:{archive_path.name}] Workspace prepared at: {temp_workspace_path}")
-
-        log.debug(f"[Task:{archive_path.name}] Initializing Processing Engine...")
-        engine = ProcessingEngine(config=config, output_base_dir=output_dir)
-        log.info(f"[Task:{archive_path.name}] Running Processing Engine...")
-
-
+        # The digest gives the [SHA5] token and identifies the archive version for the prediction cache
+        content_sha = None
         sha5_value = None
         try:
             if archive_path.is_file():
-                log.debug(f"[Task:{archive_path.name}] Calculating SHA256 for file: {archive_path}")
-                full_sha = calculate_sha256(archive_path)
-                if full_sha:
-                    sha5_value = full_sha[:5]
+                # Same derivation as the GUI app: the first MiB and size identify the archive
+                # unless the configuration asks for the whole content to be hashed
+                if _cfg_get(config, 'require_full_content_hash', False):
+                    log.debug(f"[Task:{archive_path.name}] Calculating SHA256 for file: {archive_path}")
+                    content_sha = calculate_sha256(archive_path)
+                else:
+                    log.debug(f"[Task:{archive_path.name}] Calculating prefix SHA256 for file: {archive_path}")
+                    content_sha = calculate_sha256_prefix(archive_path)
+                if content_sha:
+                    sha5_value = content_sha[:5]
                     log.info(f"[Task:{archive_path.name}] Calculated SHA5: {sha5_value}")
                 else:
                     log.warning(f"[Task:{archive_path.name}] SHA256 calculation returned None for {archive_path}")
@@ -190,66 +387,151 @@ def _process_archive_task(archive_path: Path, output_dir: Path, processed_dir: P
         except Exception as e:
             log.exception(f"[Task:{archive_path.name}] Error calculating SHA5 for {archive_path}: {e}")
 
+        log.debug(f"[Task:{archive_path.name}] Generating source rule prediction...")
+        # This function now handles preset extraction and validation internally
+        if content_sha:
+            # Copied, since the engine may adjust the rule and the cached one is shared
+            archive_stat = archive_path.stat()
+            source_rule = copy.deepcopy(_predict_source_rule_cached(
+                str(archive_path), archive_stat.st_size, archive_stat.st_mtime_ns, content_sha
+            ))
+        else:
+            source_rule = generate_source_rule_from_archive(archive_path, config)
+        log.info(f"[Task:{archive_path.name}] SourceRule generated successfully.")
+
+        if engine_slots is not None:
+            engine_slots.acquire()
+            slot_acquired = True
+        log.debug(f"[Task:{archive_path.name}] Preparing processing workspace...")
+        # This utility should handle extraction and return the temp dir path
+        temp_workspace_path = prepare_processing_workspace(archive_path)
+        log.info(f"[Task:{archive_path.name}] Workspace prepared at: {temp_workspace_path}")
+
         next_increment_str = None
         try:
-            # Assuming config object has 'output_directory_pattern' attribute/key
-            pattern = getattr(config, 'output_directory_pattern', None) # Use getattr for safety
-            if pattern:
-                if re.search(r"\[IncrementingValue\]|#+", pattern):
-                    log.debug(f"[Task:{archive_path.name}] Incrementing token found in pattern '{pattern}'. Calculating next value for dir: {output_dir}")
-                    next_increment_str = get_next_incrementing_value(output_dir, pattern)
-                    log.info(f"[Task:{archive_path.name}] Calculated next incrementing value: {next_increment_str}")
-                else:
-                    log.debug(f"[Task:{archive_path.name}] No incrementing token found in pattern '{pattern}'. Skipping increment calculation.")
-                    next_increment_str = None
+            pattern = _cfg_get(config, 'output_directory_pattern')
+            if not pattern:
+                log.warning(f"[Task:{archive_path.name}] Cannot calculate incrementing value: 'output_directory_pattern' not found in configuration.")
+            elif _INCREMENT_TOKEN_RE.search(pattern):
+                next_increment_str = _get_next_incrementing_value(output_dir, pattern)
+                log.info(f"[Task:{archive_path.name}] Calculated next incrementing value: {next_increment_str}")
             else:
-                # Check if config is a dict as fallback (depends on load_config implementation)
-                if isinstance(config, dict):
-                    pattern = config.get('output_directory_pattern')
-                    if pattern:
-                        if re.search(r"\[IncrementingValue\]|#+", pattern):
-                            log.debug(f"[Task:{archive_path.name}] Incrementing token found in pattern '{pattern}' (from dict). Calculating next value for dir: {output_dir}")
-                            next_increment_str = get_next_incrementing_value(output_dir, pattern)
-                            log.info(f"[Task:{archive_path.name}] Calculated next incrementing value (from dict): {next_increment_str}")
-                        else:
-                            log.debug(f"[Task:{archive_path.name}] No incrementing token found in pattern '{pattern}' (from dict). Skipping increment calculation.")
-                            next_increment_str = None
-                    else:
-                        log.warning(f"[Task:{archive_path.name}] Cannot calculate incrementing value: 'output_directory_pattern' not found in configuration dictionary.")
-                else:
-                    log.warning(f"[Task:{archive_path.name}] Cannot calculate incrementing value: 'output_directory_pattern' not found in configuration object.")
+                log.debug(f"[Task:{archive_path.name}] No incrementing token found in pattern '{pattern}'. Skipping increment calculation.")
         except Exception as e:
             log.exception(f"[Task:{archive_path.name}] Error calculating next incrementing value for {output_dir}: {e}")
 
-        # The engine uses the source_rule to guide processing on the workspace files
-        log.info(f"[Task:{archive_path.name}] Calling engine.run with sha5='{sha5_value}', incrementing_value='{next_increment_str}'")
-        engine.run(
-            workspace_path=temp_workspace_path,
-            source_rule=source_rule,
-            incrementing_value=next_increment_str,
-            sha5_value=sha5_value
-        )
+        log.info(f"[Task:{archive_path.name}] Queueing for the Processing Engine with sha5='{sha5_value}', incrementing_value='{next_increment_str}'")
+        try:
+            engine_future = cpu_pool.submit(
+                _run_engine, temp_workspace_path, source_rule, next_increment_str, sha5_value, output_dir
+            )
+        except (BrokenProcessPool, RuntimeError) as e:
+            if not _shutdown_requested.is_set():
+                raise
+            log.warning(f"[Task:{archive_path.name}] Engine pool unavailable during shutdown ({e}). Leaving the archive in place.")
+            move_reason = INTERRUPTED_REASON
+            return
+        handed_off = True
+        engine_future.add_done_callback(functools.partial(
+            _on_engine_finished, archive_path, temp_workspace_path, processed_dir, error_dir,
+            engine_slots if slot_acquired else None, finish_pool
+        ))
+
+    except Exception as e:
+        move_reason = _failure_reason(archive_path, e)
+
+    finally:
+        if not handed_off:
+            if slot_acquired:
+                engine_slots.release()
+            _finish_archive_task(archive_path, temp_workspace_path, move_reason, processed_dir, error_dir)
+
+
+def _init_engine_worker():
+    """
+    Initializer of the engine worker processes. A terminal Ctrl+C signals the whole process
+    group; the workers ignore it so running jobs finish while the main process shuts down.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _run_engine(workspace_path: Path, source_rule: SourceRule, incrementing_value: Optional[str],
+                sha5_value: Optional[str], output_dir: Path):
+    """
+    Runs the Processing Engine on a prepared workspace. Executed in an engine worker process,
+    so it is a top-level function taking picklable arguments; each worker loads the
+    configuration once. Exceptions reach the caller through the returned future.
+    """
+    engine = ProcessingEngine(config=_load_config_cached(), output_base_dir=output_dir)
+    # The engine uses the source_rule to guide processing on the workspace files
+    engine.run(
+        workspace_path=workspace_path,
+        source_rule=source_rule,
+        incrementing_value=incrementing_value,
+        sha5_value=sha5_value
+    )
+
+
+def _on_engine_finished(archive_path: Path, temp_workspace_path: Path, processed_dir: Path, error_dir: Path,
+                        engine_slot: Optional[threading.Semaphore], finish_pool: ThreadPoolExecutor,
+                        engine_future: Future):
+    """
+    Done callback of an engine run. It runs on the process pool's manager thread, which also
+    collects results and feeds the workers, so it only releases the engine slot and hands the
+    file work to finish_pool.
+    """
+    if engine_slot is not None:
+        engine_slot.release()
+    try:
+        finish_pool.submit(_complete_engine_task, archive_path, temp_workspace_path, processed_dir, error_dir, engine_future)
+    except RuntimeError:
+        # finish_pool already shut down; finish here rather than leave the archive in the input directory
+        _complete_engine_task(archive_path, temp_workspace_path, processed_dir, error_dir, engine_future)
+
+
+def _complete_engine_task(archive_path: Path, temp_workspace_path: Path, processed_dir: Path, error_dir: Path,
+                          engine_future: Future):
+    """Records how an engine run ended, then moves the archive and removes the workspace."""
+    move_reason = "unknown_error"
+    try:
+        engine_future.result()
         log.info(f"[Task:{archive_path.name}] Processing Engine finished successfully.")
         move_reason = "processed"
 
         # If engine.run completes without exception, assume success for now.
         # More granular results could be returned by engine.run if needed.
-        # Moving is handled outside the main try block based on move_reason
 
         # TODO: Add call to utils.blender_utils.run_blender_script if needed later
 
-
-    except FileNotFoundError as e:
-        log.error(f"[Task:{archive_path.name}] Prerequisite file not found: {e}")
-        move_reason = "file_not_found"
-    except (ConfigurationError, PredictionError, WorkspaceError, ProcessingError) as e:
-        log.error(f"[Task:{archive_path.name}] Processing failed: {e}", exc_info=True)
-        move_reason = f"{type(e).__name__.lower()}" # e.g., "predictionerror"
+    except BrokenProcessPool as e:
+        if _shutdown_requested.is_set():
+            log.warning(f"[Task:{archive_path.name}] Engine worker stopped during shutdown ({e}). Leaving the archive in place.")
+            move_reason = INTERRUPTED_REASON
+        else:
+            move_reason = _failure_reason(archive_path, e)
+    except CancelledError:
+        log.warning(f"[Task:{archive_path.name}] Engine run was cancelled. Leaving the archive in place.")
+        move_reason = INTERRUPTED_REASON
     except Exception as e:
-        log.exception(f"[Task:{archive_path.name}] An unexpected error occurred during processing: {e}")
-        move_reason = "unexpected_exception"
+        move_reason = _failure_reason(archive_path, e)
+    except BaseException as e:
+        # e.g. KeyboardInterrupt or SystemExit raised in the worker; not a fault of the archive
+        log.warning(f"[Task:{archive_path.name}] Engine run interrupted ({type(e).__name__}). Leaving the archive in place.")
+        move_reason = INTERRUPTED_REASON
 
     finally:
+        _finish_archive_task(archive_path, temp_workspace_path, move_reason, processed_dir, error_dir)
+
+
+def _finish_archive_task(archive_path: Path, temp_workspace_path: Optional[Path], move_reason: str,
+                         processed_dir: Path, error_dir: Path):
+    """
+    Moves the original archive based on the outcome and removes its temporary workspace.
+    Archives whose processing was interrupted stay in the input directory.
+    """
+    if move_reason == INTERRUPTED_REASON:
+        log.info(f"[Task:{archive_path.name}] Processing interrupted; archive left in the input directory.")
+    else:
         log.debug(f"[Task:{archive_path.name}] Moving original archive based on outcome: {move_reason}")
         dest_dir = processed_dir if move_reason == "processed" else error_dir
         try:
@@ -257,17 +539,17 @@ def _process_archive_task(archive_path: Path, output_dir: Path, processed_dir: P
         except Exception as move_err:
             log.exception(f"[Task:{archive_path.name}] CRITICAL: Failed to move archive file {archive_path} after processing: {move_err}")
 
-        if temp_workspace_path and temp_workspace_path.exists():
-            log.debug(f"[Task:{archive_path.name}] Cleaning up workspace: {temp_workspace_path}")
-            try:
-                shutil.rmtree(temp_workspace_path)
-                log.info(f"[Task:{archive_path.name}] Workspace cleaned up successfully.")
-            except OSError as e:
-                log.error(f"[Task:{archive_path.name}] Error removing temporary workspace {temp_workspace_path}: {e}", exc_info=True)
-        elif temp_workspace_path:
-             log.warning(f"[Task:{archive_path.name}] Temporary workspace path recorded but not found for cleanup: {temp_workspace_path}")
+    if temp_workspace_path and temp_workspace_path.exists():
+        log.debug(f"[Task:{archive_path.name}] Cleaning up workspace: {temp_workspace_path}")
+        try:
+            shutil.rmtree(temp_workspace_path)
+            log.info(f"[Task:{archive_path.name}] Workspace cleaned up successfully.")
+        except OSError as e:
+            log.error(f"[Task:{archive_path.name}] Error removing temporary workspace {temp_workspace_path}: {e}", exc_info=True)
+    elif temp_workspace_path:
+         log.warning(f"[Task:{archive_path.name}] Temporary workspace path recorded but not found for cleanup: {temp_workspace_path}")
 
-        log.info(f"[Task:{archive_path.name}] Processing task finished with status: {move_reason}")
+    log.info(f"[Task:{archive_path.name}] Processing task finished with status: {move_reason}")
 
 
 if __name__ == "__main__":
@@ -277,7 +559,11 @@ if __name__ == "__main__":
         sys.exit(1)
 
     event_handler = ZipHandler(INPUT_DIR, OUTPUT_DIR, PROCESSED_DIR, ERROR_DIR)
-    observer = Observer()
+    if _is_network_fs(INPUT_DIR):
+        log.info(f"Input directory is on a network file system. Polling every {POLL_INTERVAL}s.")
+        observer = PollingObserver(timeout=POLL_INTERVAL)
+    else:
+        observer = Observer()
     observer.schedule(event_handler, str(INPUT_DIR), recursive=False) # Don't watch subdirectories
 
     log.info("Starting file system monitor...")
@@ -110,6 +110,7 @@ class PipelineOrchestrator:
             "processed": [],
             "skipped": [],
             "failed": [],
+            "metadata_files": [], # Metadata file of each processed asset, for callers that track outputs
         }
         engine_temp_dir_path: Optional[Path] = None
 
@@ -487,6 +488,8 @@ class PipelineOrchestrator:
                 # Update overall status list
                 if final_asset_status == "Processed":
                     overall_status["processed"].append(asset_name)
+                    if context.asset_metadata.get('metadata_file_path'):
+                        overall_status["metadata_files"].append(context.asset_metadata['metadata_file_path'])
                 elif final_asset_status == "Skipped":
                     overall_status["skipped"].append(f"{asset_name} {fail_reason}")
                 else: # Failed or Unknown
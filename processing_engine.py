@@ -219,3 +219,56 @@ class ProcessingEngine:
                 log.error(f"Failed to remove engine temporary workspace {self.temp_dir}: {e}", exc_info=True)
         self.loaded_data_cache = {} # Clear cache after cleanup
 
+
+def warm_up_worker() -> None:
+    """
+    No-op job submitted to each engine worker process when the pool starts. Unpickling it
+    imports this module (and OpenCV/NumPy) in the worker, and the call initializes OpenCV,
+    so process spawn and imports overlap workspace preparation instead of the first task.
+    """
+    if cv2 is not None and np is not None:
+        cv2.resize(np.zeros((4, 4, 3), dtype=np.uint8), (2, 2), interpolation=cv2.INTER_AREA)
+
+
+# Engine of the current worker process, built once by init_engine_worker
+_worker_engine: Optional[ProcessingEngine] = None
+
+
+def init_engine_worker(config_obj: Configuration) -> None:
+    """
+    Process pool initializer: builds the ProcessingEngine that process_in_worker uses
+    for every job in this worker, so the configuration is pickled and the pipeline
+    stages are set up once per worker rather than once per job. Reusing the engine is
+    safe because a worker runs one job at a time and process() resets its per-run state.
+    """
+    global _worker_engine
+    _worker_engine = ProcessingEngine(config_obj)
+
+
+def process_in_worker(
+    source_rule: SourceRule,
+    workspace_path: Path,
+    output_base_path: Path,
+    overwrite: bool = False,
+    incrementing_value: Optional[str] = None,
+    sha5_value: Optional[str] = None
+) -> Dict[str, List[str]]:
+    """
+    Runs ProcessingEngine.process for one SourceRule inside a worker process.
+
+    Module-level so it can be submitted to a ProcessPoolExecutor whose initializer
+    called init_engine_worker.
+
+    Returns:
+        The status dictionary returned by ProcessingEngine.process.
+    """
+    if _worker_engine is None:
+        raise ProcessingEngineError("process_in_worker requires the worker to be initialized with init_engine_worker.")
+    return _worker_engine.process(
+        source_rule,
+        workspace_path=workspace_path,
+        output_base_path=output_base_path,
+        overwrite=overwrite,
+        incrementing_value=incrementing_value,
+        sha5_value=sha5_value
+    )
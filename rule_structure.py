@@ -2,8 +2,21 @@ import dataclasses
 import json
 from typing import List, Dict, Any, Tuple, Optional
 import numpy as np # Added for ProcessingItem
-@dataclasses.dataclass
-class FileRule:
+
+# Slots for the per-object state the GUI model caches on the rules. They are not dataclass
+# fields, so they stay out of __init__, __eq__, repr and to_json (asdict would recurse
+# through the parent back-references).
+class _FileRuleModelState:
+    __slots__ = ('parent_asset', '_row', '_name_cache', '_effective_item_type')
+
+class _AssetRuleModelState:
+    __slots__ = ('parent_source', '_row', '_effective_asset_type')
+
+class _SourceRuleModelState:
+    __slots__ = ('_row', '_name_cache', '_status_message')
+
+@dataclasses.dataclass(slots=True)
+class FileRule(_FileRuleModelState):
     file_path: str = None
     item_type: str = None # Base type determined by classification (e.g., MAP_COL, EXTRA)
     item_type_override: str = None # Renamed from map_type_override
@@ -13,6 +26,11 @@ class FileRule:
     output_format_override: str = None
     processing_items: List['ProcessingItem'] = dataclasses.field(default_factory=list) # Added field
 
+    def __post_init__(self):
+        # Back-reference to the owning AssetRule and row within parent_asset.files, maintained by the GUI model
+        self.parent_asset = None
+        self._row = None
+
     def to_json(self) -> str:
         # Need to handle ProcessingItem serialization if it contains non-serializable types like np.ndarray
         # For now, assume asdict handles it or it's handled before calling to_json for persistence.
@@ -24,14 +42,19 @@ class FileRule:
         data = json.loads(json_string)
         return cls(**data)
 
-@dataclasses.dataclass
-class AssetRule:
+@dataclasses.dataclass(slots=True)
+class AssetRule(_AssetRuleModelState):
     asset_name: str = None
     asset_type: str = None # Predicted type
     asset_type_override: str = None
     common_metadata: Dict[str, Any] = dataclasses.field(default_factory=dict)
     files: List[FileRule] = dataclasses.field(default_factory=list)
 
+    def __post_init__(self):
+        # Back-reference to the owning SourceRule and row within parent_source.assets, maintained by the GUI model
+        self.parent_source = None
+        self._row = None
+
     def to_json(self) -> str:
         return json.dumps(dataclasses.asdict(self), indent=4)
 
@@ -42,8 +65,8 @@ class AssetRule:
         data['files'] = [FileRule.from_json(json.dumps(file_data)) for file_data in data.get('files', [])]
         return cls(**data)
 
-@dataclasses.dataclass
-class SourceRule:
+@dataclasses.dataclass(slots=True)
+class SourceRule(_SourceRuleModelState):
     supplier_identifier: str = None # Predicted/Original identifier
     supplier_override: str = None
     high_level_sorting_parameters: Dict[str, Any] = dataclasses.field(default_factory=dict)
@@ -51,6 +74,21 @@ class SourceRule:
     input_path: str = None
     preset_name: str = None
 
+    def __post_init__(self):
+        # Row within the GUI model's root list, maintained by the model
+        self._row = None
+
+    def __repr__(self) -> str:
+        # Summarizes the assets instead of listing them; rules are logged per task and batch
+        return (f"SourceRule(input_path={self.input_path!r}, supplier_identifier={self.supplier_identifier!r}, "
+                f"supplier_override={self.supplier_override!r}, preset_name={self.preset_name!r}, "
+                f"assets=<{len(self.assets)} assets>)")
+
+    def verbose_repr(self) -> str:
+        """Returns the full field-by-field representation, including every asset and file rule."""
+        fields = ", ".join(f"{field.name}={getattr(self, field.name)!r}" for field in dataclasses.fields(self))
+        return f"SourceRule({fields})"
+
     def to_json(self) -> str:
         return json.dumps(dataclasses.asdict(self), indent=4)
 
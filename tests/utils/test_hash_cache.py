@@ -0,0 +1,42 @@
+from utils.hash_cache import Sha5Cache
+
+
+def test_sha5_cache_persists_between_instances(tmp_path):
+    db_path = tmp_path / "hash_cache.sqlite"
+    cache = Sha5Cache(db_path)
+    cache[("/in/a.zip", 10, 111)] = "abcde"
+    cache.close()
+
+    reopened = Sha5Cache(db_path)
+    assert reopened.get(("/in/a.zip", 10, 111)) == "abcde"
+    assert ("/in/a.zip", 10, 111) in reopened
+    reopened.close()
+
+
+def test_sha5_cache_misses_when_archive_changed(tmp_path):
+    db_path = tmp_path / "hash_cache.sqlite"
+    cache = Sha5Cache(db_path)
+    cache[("/in/a.zip", 10, 111)] = "abcde"
+    cache.close()
+
+    reopened = Sha5Cache(db_path)
+    assert reopened.get(("/in/a.zip", 10, 222)) is None
+    assert reopened.get(("/in/a.zip", 11, 111)) is None
+    reopened[("/in/a.zip", 10, 222)] = "fghij"
+    reopened.close()
+
+    assert Sha5Cache(db_path).get(("/in/a.zip", 10, 222)) == "fghij"
+
+
+def test_sha5_cache_keeps_variants_apart(tmp_path):
+    db_path = tmp_path / "hash_cache.sqlite"
+    Sha5Cache(db_path, variant="prefix")[("/in/a.zip", 10, 111)] = "abcde"
+
+    assert Sha5Cache(db_path, variant="full").get(("/in/a.zip", 10, 111)) is None
+
+
+def test_sha5_cache_without_database():
+    cache = Sha5Cache()
+    assert cache.get(None) is None
+    cache[("/in/a.zip", 10, 111)] = "abcde"
+    assert cache.get(("/in/a.zip", 10, 111)) == "abcde"
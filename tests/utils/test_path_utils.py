@@ -1,6 +1,6 @@
 import pytest
 from pathlib import Path
-from utils.path_utils import sanitize_filename, generate_path_from_pattern
+from utils.path_utils import sanitize_filename, generate_path_from_pattern, get_next_incrementing_value
 
 # Tests for sanitize_filename
 def test_sanitize_filename_valid():
@@ -249,4 +249,24 @@ def test_generate_path_with_dots_in_placeholders():
         sha5_value=None
     )
     expected = Path("output/My.Asset.V1/Diffuse.Main/texture.png")
-    assert Path(result) == expected
\ No newline at end of file
+    assert Path(result) == expected
+
+
+# Tests for get_next_incrementing_value
+def test_get_next_incrementing_value_empty_directory(tmp_path):
+    assert get_next_incrementing_value(tmp_path, "[supplier]_[assetname]_##") == "00"
+
+def test_get_next_incrementing_value_uses_highest_existing(tmp_path):
+    for name in ("Sup_Rock_03", "Sup_Wood_11", "Sup_Tile_7", "unrelated"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "Sup_File_20").touch() # Files are not output directories
+    assert get_next_incrementing_value(tmp_path, "[supplier]_[assetname]_##") == "12"
+
+def test_get_next_incrementing_value_nested_pattern(tmp_path):
+    (tmp_path / "SupA" / "Rock_004").mkdir(parents=True)
+    (tmp_path / "SupB" / "Wood_009").mkdir(parents=True)
+    assert get_next_incrementing_value(tmp_path, "[supplier]/[assetname]_[IncrementingValue]") == "00"
+    assert get_next_incrementing_value(tmp_path, "[supplier]/[assetname]_###") == "010"
+
+def test_get_next_incrementing_value_missing_base_path(tmp_path):
+    assert get_next_incrementing_value(tmp_path / "missing", "####") == "0000"
@@ -0,0 +1,37 @@
+from rule_structure import SourceRule, AssetRule
+from utils.result_cache import ResultCache, result_fingerprint
+
+
+def test_result_fingerprint_changes_with_rule_and_input():
+    rule = SourceRule(input_path="/in/a.zip", assets=[AssetRule(asset_name="A")])
+    key = ("/in/a.zip", 10, 111)
+    fingerprint = result_fingerprint(rule, key, "/out", "settings")
+
+    assert fingerprint == result_fingerprint(rule, key, "/out", "settings")
+    assert fingerprint != result_fingerprint(rule, ("/in/a.zip", 10, 222), "/out", "settings")
+    assert fingerprint != result_fingerprint(rule, key, "/other", "settings")
+    assert fingerprint != result_fingerprint(rule, key, "/out", "other settings")
+    rule.assets[0].asset_type_override = "Decal"
+    assert fingerprint != result_fingerprint(rule, key, "/out", "settings")
+
+
+def test_result_cache_requires_existing_metadata_files(tmp_path):
+    metadata_file = tmp_path / "A_metadata.json"
+    metadata_file.write_text("{}")
+    db_path = tmp_path / "result_cache.sqlite"
+
+    cache = ResultCache(db_path)
+    cache.record("job", [str(metadata_file)])
+    cache.close()
+
+    reopened = ResultCache(db_path)
+    assert reopened.completed_outputs("job") == [str(metadata_file)]
+    assert reopened.completed_outputs("other job") is None
+    metadata_file.unlink()
+    assert reopened.completed_outputs("job") is None
+
+
+def test_result_cache_ignores_jobs_without_outputs(tmp_path):
+    cache = ResultCache()
+    cache.record("job", [])
+    assert cache.completed_outputs("job") is None
@@ -0,0 +1,28 @@
+import os
+import sys
+
+import pytest
+
+from utils import workspace_utils
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX ownership and permission checks")
+
+
+def test_private_workspace_root_is_per_user_and_private(tmp_path):
+    root = workspace_utils._private_workspace_root(tmp_path)
+
+    assert root == tmp_path / f"afw2_wsp-{os.getuid()}"
+    assert os.stat(root).st_mode & 0o077 == 0
+    assert workspace_utils._private_workspace_root(tmp_path) == root
+
+
+def test_private_workspace_root_rejects_foreign_or_open_directory(tmp_path):
+    shared_root = tmp_path / f"afw2_wsp-{os.getuid()}"
+    shared_root.mkdir()
+    os.chmod(shared_root, 0o777)
+
+    root = workspace_utils._private_workspace_root(tmp_path)
+
+    assert root != shared_root
+    assert root.parent == tmp_path
+    assert workspace_utils._is_private_dir(root)
@@ -0,0 +1,101 @@
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Created inside the user config directory
+HASH_CACHE_FILENAME = "hash_cache.sqlite"
+
+Sha5CacheKey = Tuple[str, int, int]  # (path, size, mtime_ns)
+
+class Sha5Cache:
+    """
+    Caches SHA5 values per archive version, keyed by (path, size, mtime_ns), in memory
+    and, when a database path is given, in SQLite so unchanged archives are not hashed
+    again in later sessions. Supports the dict operations the task code uses
+    (get, in, item assignment) and is safe to share between threads.
+
+    One row is kept per path and variant; a lookup whose size or mtime differs from the
+    stored row misses, and the next assignment replaces the stale row.
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None, variant: str = "prefix"):
+        """
+        Args:
+            db_path: SQLite database file, or None to cache in memory only.
+            variant: How the stored values were derived (e.g. "prefix" or "full"), so
+                     values from a different hashing mode are never returned.
+        """
+        self._variant = variant
+        self._memory: Dict[Sha5CacheKey, str] = {}
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            self._connection = self._open(os.fspath(db_path))
+
+    @staticmethod
+    def _open(db_path: str) -> Optional[sqlite3.Connection]:
+        try:
+            connection = sqlite3.connect(db_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS sha5_cache ("
+                "path TEXT NOT NULL, variant TEXT NOT NULL, size INTEGER NOT NULL, "
+                "mtime_ns INTEGER NOT NULL, sha5 TEXT NOT NULL, PRIMARY KEY (path, variant))"
+            )
+            connection.commit()
+            return connection
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open SHA5 cache database {db_path}: {e}. Caching in memory only.")
+            return None
+
+    def get(self, key: Optional[Sha5CacheKey], default: Optional[str] = None) -> Optional[str]:
+        """Returns the SHA5 stored for this archive version, or default."""
+        if key is None:
+            return default
+        with self._lock:
+            sha5_value = self._memory.get(key)
+            if sha5_value is not None or self._connection is None:
+                return default if sha5_value is None else sha5_value
+            try:
+                row = self._connection.execute(
+                    "SELECT size, mtime_ns, sha5 FROM sha5_cache WHERE path = ? AND variant = ?",
+                    (key[0], self._variant),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"SHA5 cache lookup failed for {key[0]}: {e}")
+                return default
+            if row is None or (row[0], row[1]) != (key[1], key[2]):
+                return default # Never hashed, or the archive changed since
+            self._memory[key] = row[2]
+            return row[2]
+
+    def __contains__(self, key: Optional[Sha5CacheKey]) -> bool:
+        return self.get(key) is not None
+
+    def __setitem__(self, key: Optional[Sha5CacheKey], sha5_value: str):
+        if key is None:
+            return
+        with self._lock:
+            self._memory[key] = sha5_value
+            if self._connection is None:
+                return
+            try:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO sha5_cache (path, variant, size, mtime_ns, sha5) VALUES (?, ?, ?, ?, ?)",
+                    (key[0], self._variant, key[1], key[2], sha5_value),
+                )
+                self._connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not store SHA5 for {key[0]} in the cache: {e}")
+
+    def close(self):
+        """Closes the database connection; the in-memory entries remain usable."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -1,10 +1,73 @@
 import hashlib
 import logging
+import mmap
+import os
+import shutil
+import struct
+import subprocess
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+_HASH_BUFFER_SIZE = 1 << 20  # Read in 1 MiB chunks
+_MMAP_MIN_SIZE = 1 << 20  # Files at least this large are hashed straight from a memory map
+_PREFIX_HASH_SIZE = 1 << 20  # Bytes read by calculate_sha256_prefix
+
+def _find_native_sha256_command() -> Optional[list]:
+    """
+    Returns the command of a native SHA-256 tool to hash large files with when this
+    interpreter's hashlib is not backed by OpenSSL (its builtin fallback has no SHA-NI
+    support and is several times slower), or None when hashlib should be used.
+    """
+    if "openssl" in getattr(hashlib.sha256, "__name__", ""):
+        return None
+    sha256sum = shutil.which("sha256sum")
+    if sha256sum:
+        return [sha256sum, "--binary"]
+    openssl = shutil.which("openssl")
+    if openssl:
+        return [openssl, "dgst", "-sha256", "-r"]
+    return None
+
+_NATIVE_SHA256_COMMAND = _find_native_sha256_command()
+
+def _sha256_native(file_path: Path) -> Optional[str]:
+    """
+    Hashes a file with the native tool found by _find_native_sha256_command. Both tools
+    print the digest as the first field. Returns None if the tool fails, leaving the
+    caller to hash the file itself.
+    """
+    try:
+        completed = subprocess.run(
+            _NATIVE_SHA256_COMMAND + [os.fspath(file_path)],
+            capture_output=True, text=True, check=True,
+        )
+        # sha256sum prefixes the line with a backslash when it escapes the file name
+        digest = completed.stdout.split(maxsplit=1)[0].lstrip("\\").lower()
+    except (OSError, subprocess.CalledProcessError, IndexError) as e:
+        logger.warning(f"Native SHA-256 tool failed for {file_path}, hashing in Python instead: {e}")
+        return None
+    return digest if len(digest) == 64 else None
+
+def _sha256_mapped(f) -> Optional[str]:
+    """
+    Hashes an open file through a read-only memory map, so pages go from the page cache
+    straight into the digest without a copy into Python bytes. Returns None if the file
+    cannot be mapped (e.g. address space exhausted), leaving the caller to read it instead.
+    """
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, OverflowError):
+        return None
+    with mapped:
+        if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            try:
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            except OSError:
+                pass # Only a read-ahead hint
+        return hashlib.sha256(mapped).hexdigest()
+
 def calculate_sha256(file_path: Path) -> Optional[str]:
     """
     Calculates the SHA-256 hash of a file.
@@ -26,20 +89,65 @@ def calculate_sha256(file_path: Path) -> Optional[str]:
         logger.error(f"File not found or is not a regular file: {file_path}")
         return None
 
+    # hashlib's sha256 is OpenSSL's, which already dispatches to SHA-NI where the CPU has it,
+    # so the remaining cost is per-chunk overhead: read large blocks into one reused buffer.
     sha256_hash = hashlib.sha256()
-    buffer_size = 65536  # Read in 64k chunks
+    buffer = bytearray(_HASH_BUFFER_SIZE)
+    view = memoryview(buffer)
 
     try:
-        with open(file_path, "rb") as f:
+        with open(file_path, "rb", buffering=0) as f:
+            if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+                digest = _sha256_native(file_path) if _NATIVE_SHA256_COMMAND else None
+                if digest is None:
+                    digest = _sha256_mapped(f)
+                if digest is not None:
+                    return digest
             while True:
-                data = f.read(buffer_size)
-                if not data:
+                size = f.readinto(buffer)
+                if not size:
                     break
-                sha256_hash.update(data)
+                sha256_hash.update(view[:size])
         return sha256_hash.hexdigest()
     except IOError as e:
         logger.error(f"Error reading file {file_path}: {e}")
         return None
     except Exception as e:
         logger.error(f"An unexpected error occurred while hashing {file_path}: {e}")
-        return None
\ No newline at end of file
+        return None
+
+def calculate_sha256_prefix(file_path: Path, prefix_size: int = _PREFIX_HASH_SIZE) -> Optional[str]:
+    """
+    Calculates a SHA-256 over the first prefix_size bytes of a file followed by its
+    total size (8 bytes, little-endian). Reads at most prefix_size bytes however
+    large the file is, which is enough for short identifiers such as the SHA5 token;
+    files of equal size that only differ after the prefix hash the same.
+
+    Args:
+        file_path: The path to the file.
+        prefix_size: The number of leading bytes to hash.
+
+    Returns:
+        The SHA-256 hash as a hexadecimal string, or None if an error occurs.
+    """
+    try:
+        with open(file_path, "rb", buffering=0) as f:
+            file_size = os.fstat(f.fileno()).st_size
+            sha256_hash = hashlib.sha256()
+            buffer = bytearray(min(prefix_size, file_size))
+            view = memoryview(buffer)
+            filled = 0
+            while filled < len(buffer):
+                size = f.readinto(view[filled:])
+                if not size:
+                    break
+                filled += size
+            sha256_hash.update(view[:filled])
+            sha256_hash.update(struct.pack("<Q", file_size))
+        return sha256_hash.hexdigest()
+    except IOError as e:
+        logger.error(f"Error reading file {file_path}: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"An unexpected error occurred while hashing {file_path}: {e}")
+        return None
@@ -3,11 +3,64 @@ import sys
 import datetime
 import re
 import logging
+import functools
 from pathlib import Path
 from typing import Optional, Dict
 
 logger = logging.getLogger(__name__)
 
+# --- Path pattern templates ---
+_PATH_TOKEN_RE = re.compile(r'\[([^\]]+)\]')
+
+# Known tokens (lowercase), including the #### alias for IncrementingValue
+_KNOWN_TOKENS_LC = frozenset({
+    'assettype', 'supplier', 'assetname', 'resolution', 'ext',
+    'incrementingvalue', '####', 'date', 'time', 'sha5', 'applicationpath'
+})
+
+# Tokens with generated defaults, which token_data can override
+_DYNAMIC_TOKENS = {
+    'date': lambda: datetime.datetime.now().strftime('%Y%m%d'),
+    'time': lambda: datetime.datetime.now().strftime('%H%M%S'),
+    'applicationpath': lambda: os.path.abspath(os.getcwd()),
+}
+
+@functools.lru_cache(maxsize=256)
+def _compile_path_pattern(pattern_string: str):
+    """
+    Splits a path pattern once into a template, since the same few patterns are rendered
+    for every file of every asset.
+
+    Returns:
+        (segments, token_occurrences). segments holds literal strings and
+        (lookup_key, original_text) slots; token_occurrences lists (token_name, lookup_key)
+        for every token in pattern order. As with the earlier replace-per-token approach,
+        a slot is only filled for occurrences spelled like the first token of its type
+        (ignoring case), so e.g. [####] after [IncrementingValue] stays unchanged.
+    """
+    segments = []
+    token_occurrences = []
+    first_spelling = {}
+    position = 0
+    for token_match in _PATH_TOKEN_RE.finditer(pattern_string):
+        token_name = token_match.group(1)
+        token_name_lc = token_name.lower()
+        # Handle alias #### for IncrementingValue
+        lookup_key = 'incrementingvalue' if token_name_lc == '####' else token_name_lc
+        token_occurrences.append((token_name, lookup_key))
+        first_spelling.setdefault(lookup_key, token_name_lc)
+
+        if token_match.start() > position:
+            segments.append(pattern_string[position:token_match.start()])
+        if first_spelling[lookup_key] == token_name_lc:
+            segments.append((lookup_key, token_match.group(0)))
+        else:
+            segments.append(token_match.group(0))
+        position = token_match.end()
+    if position < len(pattern_string):
+        segments.append(pattern_string[position:])
+    return tuple(segments), tuple(token_occurrences)
+
 def generate_path_from_pattern(pattern_string: str, token_data: dict) -> str:
     """
     Generates a file path by replacing tokens in a pattern string with values
@@ -36,53 +89,21 @@ def generate_path_from_pattern(pattern_string: str, token_data: dict) -> str:
 
     # Normalize token keys in the input data for case-insensitive matching
     normalized_token_data = {k.lower(): v for k, v in token_data.items()}
+    segments, token_occurrences = _compile_path_pattern(pattern_string)
 
-    # --- Prepare dynamic/default token values ---
-    now = datetime.datetime.now()
-    dynamic_tokens = {
-        'date': now.strftime('%Y%m%d'),
-        'time': now.strftime('%H%M%S'),
-        # Provide a default ApplicationPath, can be overridden by token_data
-        'applicationpath': os.path.abspath(os.getcwd())
-    }
-
-    # Merge dynamic tokens with provided data, allowing overrides
-    # Provided data takes precedence
-    full_token_data = {**dynamic_tokens, **normalized_token_data}
-
-    # --- Define known tokens (lowercase) ---
-    # Add variations like #### for IncrementingValue
-    known_tokens_lc = {
-        'assettype', 'supplier', 'assetname', 'resolution', 'ext',
-        'incrementingvalue', '####', 'date', 'time', 'sha5', 'applicationpath'
-    }
-
-    output_path = pattern_string
-
-    # --- Regex to find all tokens like [TokenName] ---
-    token_pattern = re.compile(r'\[([^\]]+)\]')
-    tokens_found = token_pattern.findall(pattern_string)
-
-    processed_tokens_lc = set()
-
-    for token_name in tokens_found:
-        token_name_lc = token_name.lower()
-
-        # Handle alias #### for IncrementingValue
-        lookup_key = 'incrementingvalue' if token_name_lc == '####' else token_name_lc
-
-        if lookup_key in processed_tokens_lc:
+    # --- Resolve each token type once, in pattern order ---
+    replacements = {}
+    for token_name, lookup_key in token_occurrences:
+        if lookup_key in replacements:
             continue # Already processed this token type
 
-        if lookup_key in full_token_data:
-            replacement_value = str(full_token_data[lookup_key]) # Ensure string
-            # Replace all occurrences of this token (case-insensitive original name)
-            # We use a regex finditer to replace only the specific token format
-            # to avoid replacing substrings within other words.
-            current_token_pattern = re.compile(re.escape(f'[{token_name}]'), re.IGNORECASE)
-            output_path = current_token_pattern.sub(replacement_value, output_path)
-            processed_tokens_lc.add(lookup_key)
-        elif lookup_key in known_tokens_lc:
+        if lookup_key in normalized_token_data:
+            replacements[lookup_key] = str(normalized_token_data[lookup_key]) # Ensure string
+        elif lookup_key in _DYNAMIC_TOKENS:
+            # Dynamic/default token values are only computed when the pattern uses them;
+            # provided data takes precedence
+            replacements[lookup_key] = _DYNAMIC_TOKENS[lookup_key]()
+        elif lookup_key in _KNOWN_TOKENS_LC:
             # Known token but not found in data (and not a dynamic one we generated)
             logger.warning(f"Token '[{token_name}]' found in pattern but not in token_data.")
             # Raise error for non-optional tokens if needed, or replace with placeholder
@@ -92,65 +113,96 @@ def generate_path_from_pattern(pattern_string: str, token_data: dict) -> str:
             # Token not recognized
             logger.warning(f"Unknown token '[{token_name}]' found in pattern string. Leaving it unchanged.")
 
+    # --- Fill the pre-split template; unresolved slots keep their original text ---
+    output_path = ''.join(
+        segment if type(segment) is str else replacements.get(segment[0], segment[1])
+        for segment in segments
+    )
+
     # --- Final path cleaning (optional, e.g., normalize separators) ---
     # output_path = os.path.normpath(output_path) # Consider implications on mixed separators
 
     return output_path
+
+# Incrementing token: [IncrementingValue], [####] or a bare run of '#'
+_INCREMENT_TOKEN_RE = re.compile(r"\[IncrementingValue\]|\[#+\]|#+")
+_ANY_TOKEN_RE = re.compile(r'\[[^\]]+\]')
+_PATTERN_SEPARATOR_RE = re.compile(r'[\\/]')
+
+def _segment_regex(segment: str) -> str:
+    """Regex source for a pattern segment: literal text escaped, other [tokens] matching anything."""
+    return '.*?'.join(re.escape(part) for part in _ANY_TOKEN_RE.split(segment))
+
+@functools.lru_cache(maxsize=128)
+def _compile_increment_pattern(output_directory_pattern: str):
+    """
+    Splits a directory pattern into compiled regexes for its path segments.
+
+    Returns:
+        (parent_regexes, name_regex, num_digits), where parent_regexes match the directories
+        above the segment holding the incrementing token and name_regex captures its digits,
+        or None if the pattern has no incrementing token.
+    """
+    segments = _PATTERN_SEPARATOR_RE.split(output_directory_pattern)
+    for depth, segment in enumerate(segments):
+        token_match = _INCREMENT_TOKEN_RE.search(segment)
+        if token_match:
+            break
+    else:
+        return None
+
+    increment_token = token_match.group(0)
+    num_digits = increment_token.count('#') if '#' in increment_token else 2 # Default to 2 for [IncrementingValue]
+    parent_regexes = tuple(re.compile(_segment_regex(parent) + r'\Z') for parent in segments[:depth])
+    name_regex = re.compile(
+        _segment_regex(segment[:token_match.start()])
+        + rf"(\d{{{num_digits}}})(?!\d)"
+        + _segment_regex(segment[token_match.end():])
+    )
+    return parent_regexes, name_regex, num_digits
+
 def get_next_incrementing_value(output_base_path: Path, output_directory_pattern: str) -> str:
     """Determines the next incrementing value based on existing directories."""
-    logger.debug(f"Calculating next increment value for pattern '{output_directory_pattern}' in '{output_base_path}'")
-    match = re.match(r"(.*?)(\[IncrementingValue\]|(#+))(.*)", output_directory_pattern)
-    if not match:
+    logger.debug("Calculating next increment value for pattern '%s' in '%s'", output_directory_pattern, output_base_path)
+    compiled = _compile_increment_pattern(output_directory_pattern)
+    if compiled is None:
         logger.warning(f"Could not find incrementing token ([IncrementingValue] or #+) in pattern '{output_directory_pattern}'. Defaulting to '00'.")
         return "00" # Default fallback if pattern doesn't contain the token
-
-    prefix_pattern, increment_token, suffix_pattern = match.groups()
-    num_digits = len(increment_token) if increment_token.startswith("#") else 2 # Default to 2 for [IncrementingValue] if not specified otherwise
-    logger.debug(f"Parsed pattern: prefix='{prefix_pattern}', token='{increment_token}' ({num_digits} digits), suffix='{suffix_pattern}'")
-
-    # Replace other tokens in prefix/suffix with '*' for globbing
-    glob_prefix = re.sub(r'\[[^\]]+\]', '*', prefix_pattern)
-    glob_suffix = re.sub(r'\[[^\]]+\]', '*', suffix_pattern)
-    # Construct the glob pattern part for the number itself
-    glob_increment_part = f"[{'0-9' * num_digits}]" # Matches exactly num_digits
-    glob_pattern = f"{glob_prefix}{glob_increment_part}{glob_suffix}"
-    logger.debug(f"Constructed glob pattern: {glob_pattern}")
+    parent_regexes, name_regex, num_digits = compiled
 
     max_value = -1
     try:
-        # Prepare regex to extract the number from directory names matching the full pattern
-        # Escape regex special characters in the literal parts of the pattern
-        extract_prefix_re = re.escape(prefix_pattern)
-        extract_suffix_re = re.escape(suffix_pattern)
-        # The regex captures exactly num_digits between the escaped prefix and suffix
-        extract_regex = re.compile(rf"^{extract_prefix_re}(\d{{{num_digits}}}){extract_suffix_re}.*")
-        logger.debug(f"Constructed extraction regex: {extract_regex.pattern}")
-
-        if not output_base_path.is_dir():
+        if not os.path.isdir(output_base_path):
             logger.warning(f"Output base path '{output_base_path}' does not exist or is not a directory. Cannot scan for existing values.")
         else:
-            for item in output_base_path.glob(glob_pattern):
-                if item.is_dir():
-                    logger.debug(f"Checking directory: {item.name}")
-                    num_match = extract_regex.match(item.name)
+            # Walk only the directories the pattern can produce; scandir entries carry their
+            # type, so no Path objects or stat calls are needed per entry.
+            pending = [(os.fspath(output_base_path), 0)]
+            while pending:
+                directory, depth = pending.pop()
+                try:
+                    with os.scandir(directory) as entries:
+                        subdirs = [entry for entry in entries if entry.is_dir()]
+                except OSError as e:
+                    logger.debug("Skipping unreadable directory '%s': %s", directory, e)
+                    continue
+                if depth < len(parent_regexes):
+                    parent_regex = parent_regexes[depth]
+                    pending.extend((entry.path, depth + 1) for entry in subdirs if parent_regex.match(entry.name))
+                    continue
+                for entry in subdirs:
+                    num_match = name_regex.match(entry.name)
                     if num_match:
-                        try:
-                            current_val = int(num_match.group(1))
-                            logger.debug(f"Extracted value {current_val} from {item.name}")
-                            max_value = max(max_value, current_val)
-                        except (ValueError, IndexError) as e:
-                            logger.warning(f"Could not parse number from matching directory '{item.name}': {e}")
-                    else:
-                         logger.debug(f"Directory '{item.name}' matched glob but not extraction regex.")
+                        current_val = int(num_match.group(1))
+                        if current_val > max_value:
+                            max_value = current_val
 
     except Exception as e:
-        logger.error(f"Error searching for incrementing values using glob pattern '{glob_pattern}' in '{output_base_path}': {e}", exc_info=True)
+        logger.error(f"Error searching for incrementing values for pattern '{output_directory_pattern}' in '{output_base_path}': {e}", exc_info=True)
         # Decide on fallback behavior - returning "00" might be safer than raising
         return "00" # Fallback on error during search
 
-    next_value = max_value + 1
-    format_string = f"{{:0{num_digits}d}}"
-    next_value_str = format_string.format(next_value)
+    next_value_str = f"{max_value + 1:0{num_digits}d}"
     logger.info(f"Determined next incrementing value: {next_value_str} (Max found: {max_value})")
     return next_value_str
 
@@ -0,0 +1,96 @@
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+# Created inside the user config directory
+RESULT_CACHE_FILENAME = "result_cache.sqlite"
+
+def result_fingerprint(source_rule, input_key: Sequence, output_base_path: Union[str, Path], settings_fingerprint: str) -> str:
+    """
+    Identifies one processing job: the input version (e.g. its (path, size, mtime_ns) key),
+    every field of the rule including GUI overrides, the output base directory and the
+    configuration it ran with. Any change to these gives a different fingerprint.
+    """
+    job = [
+        list(input_key),
+        dataclasses.asdict(source_rule),
+        os.fspath(output_base_path),
+        settings_fingerprint,
+    ]
+    return hashlib.sha256(json.dumps(job, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+class ResultCache:
+    """
+    Remembers which processing jobs completed successfully, by result_fingerprint, together
+    with the metadata files they wrote, so an unchanged job can be skipped next time. A job
+    only counts as done while all of its metadata files still exist.
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            db_path: SQLite database file, or None to remember results for this session only.
+        """
+        self._memory = {}
+        self._connection: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            try:
+                self._connection = sqlite3.connect(os.fspath(db_path))
+                self._connection.execute("PRAGMA journal_mode=WAL")
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS results (fingerprint TEXT PRIMARY KEY, metadata_files TEXT NOT NULL)"
+                )
+                self._connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not open result cache database {db_path}: {e}. Remembering results for this session only.")
+                self._connection = None
+
+    def _stored_files(self, fingerprint: str) -> Optional[List[str]]:
+        if fingerprint in self._memory:
+            return self._memory[fingerprint]
+        if self._connection is None:
+            return None
+        try:
+            row = self._connection.execute(
+                "SELECT metadata_files FROM results WHERE fingerprint = ?", (fingerprint,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache lookup failed: {e}")
+            return None
+        return json.loads(row[0]) if row else None
+
+    def completed_outputs(self, fingerprint: str) -> Optional[List[str]]:
+        """Returns the metadata files of a completed job if they all still exist, else None."""
+        metadata_files = self._stored_files(fingerprint)
+        if not metadata_files or not all(os.path.isfile(path) for path in metadata_files):
+            return None
+        return metadata_files
+
+    def record(self, fingerprint: str, metadata_files: List[str]):
+        """Stores a successfully completed job; jobs without metadata files are not recorded."""
+        if not metadata_files:
+            return
+        self._memory[fingerprint] = list(metadata_files)
+        if self._connection is None:
+            return
+        try:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (fingerprint, metadata_files) VALUES (?, ?)",
+                (fingerprint, json.dumps(list(metadata_files))),
+            )
+            self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not store result in the cache: {e}")
+
+    def close(self):
+        """Closes the database connection; results recorded this session remain usable."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
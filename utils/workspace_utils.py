@@ -1,10 +1,18 @@
 
+import io
+import os
+import mmap
+import hashlib
 import tempfile
 import shutil
+import stat
+import threading
 import zipfile
 import logging
+import uuid
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Union
+from typing import BinaryIO, Optional, Tuple, Union
 
 log = logging.getLogger(__name__)
 
@@ -12,7 +20,258 @@ log = logging.getLogger(__name__)
 # Non-zip formats may require additional libraries like patoolib.
 SUPPORTED_ARCHIVES = {'.zip'}
 
-def prepare_processing_workspace(input_path_str: Union[str, Path]) -> Path:
+# Copy buffer used per extracted member (capped at the member's size)
+_EXTRACT_BUFFER_SIZE = 1 << 20
+# Read buffer for the archive file itself; the 8 KiB default means many small reads for member headers
+_ARCHIVE_READ_BUFFER_SIZE = 128 * 1024
+_WINDOWS_ILLEGAL_NAME_CHARS = str.maketrans(':<>|"?*', '_______')
+
+# Workspaces are created under one root so finished ones can be renamed into its graveyard
+# (same filesystem, so the rename is atomic) and deleted later in bulk. The root is private
+# to the current user (see _private_workspace_root) and resolved on first use.
+_WORKSPACE_ROOT_NAME = "afw2_wsp"
+WORKSPACE_ROOT: Optional[Path] = None
+_GRAVEYARD_DIR: Optional[Path] = None
+_workspace_root_lock = threading.Lock()
+# Graveyard batches renamed aside by this process and not removed yet
+_retired_batches = []
+_retired_batches_lock = threading.Lock()
+
+# RAM-backed filesystem used by use_ram_workspace_root, and the free space it must have
+_RAM_FILESYSTEM_DIR = Path("/dev/shm")
+_RAM_WORKSPACE_MIN_FREE = 2 << 30
+
+def use_ram_workspace_root(min_free_bytes: int = _RAM_WORKSPACE_MIN_FREE) -> bool:
+    """
+    Moves the workspace root onto the RAM-backed filesystem (/dev/shm) if there is one
+    with at least min_free_bytes free, so extracted files are written to and read back
+    from memory instead of disk. Workspaces created before the switch are unaffected.
+
+    Returns:
+        True if new workspaces will be created in RAM.
+    """
+    global WORKSPACE_ROOT, _GRAVEYARD_DIR
+    if not _RAM_FILESYSTEM_DIR.is_dir():
+        log.info(f"No RAM-backed filesystem at {_RAM_FILESYSTEM_DIR}; keeping workspaces in the temp directory.")
+        return False
+    try:
+        free_bytes = shutil.disk_usage(_RAM_FILESYSTEM_DIR).free
+    except OSError as e:
+        log.warning(f"Could not check free space on {_RAM_FILESYSTEM_DIR} ({e}); keeping workspaces in the temp directory.")
+        return False
+    if free_bytes < min_free_bytes:
+        log.warning(f"Only {free_bytes // (1 << 20)} MiB free on {_RAM_FILESYSTEM_DIR}; keeping workspaces in the temp directory.")
+        return False
+    # /dev/shm is world-writable like /tmp, so the root there gets the same ownership checks
+    root = _private_workspace_root(_RAM_FILESYSTEM_DIR)
+    if root is None:
+        log.warning(f"Could not create a workspace root on {_RAM_FILESYSTEM_DIR}; keeping workspaces in the temp directory.")
+        return False
+    with _workspace_root_lock:
+        WORKSPACE_ROOT = root
+        _GRAVEYARD_DIR = root / "graveyard"
+    log.info(f"Creating processing workspaces in RAM under {WORKSPACE_ROOT}.")
+    return True
+
+def _is_private_dir(path: Path) -> bool:
+    """True if path is a directory (not a symlink) owned by the current user that nobody else can access."""
+    try:
+        path_stat = os.lstat(path)
+    except OSError:
+        return False
+    return (stat.S_ISDIR(path_stat.st_mode)
+            and path_stat.st_uid == os.getuid()
+            and stat.S_IMODE(path_stat.st_mode) & 0o077 == 0)
+
+def _private_workspace_root(base_dir: Path) -> Optional[Path]:
+    """
+    Returns a workspace root under base_dir that only the current user can access, creating
+    it if needed: '<name>-<uid>' with mode 0700. Shared temp directories are world-writable,
+    so if that path exists but is not such a directory (another user may have created it),
+    a fresh directory for this process only is made with mkdtemp instead.
+    Returns None if neither can be created.
+    """
+    if not hasattr(os, "getuid"):
+        # Windows: the temp directory is already per user
+        root = base_dir / _WORKSPACE_ROOT_NAME
+        try:
+            os.makedirs(root, exist_ok=True)
+            return root
+        except OSError as e:
+            log.warning(f"Could not create workspace root {root} ({e}).")
+            return None
+    root = base_dir / f"{_WORKSPACE_ROOT_NAME}-{os.getuid()}"
+    try:
+        os.mkdir(root, 0o700)
+    except FileExistsError:
+        pass
+    except OSError as e:
+        log.warning(f"Could not create workspace root {root} ({e}).")
+    if _is_private_dir(root):
+        return root
+    if os.path.lexists(root):
+        log.warning(f"Workspace root {root} is not a private directory of this user; using a per-process root instead.")
+    try:
+        return Path(tempfile.mkdtemp(prefix=f"{_WORKSPACE_ROOT_NAME}-", dir=base_dir))
+    except OSError as e:
+        log.warning(f"Could not create a workspace root in {base_dir} ({e}).")
+        return None
+
+def _workspace_root() -> Optional[Path]:
+    """Returns the workspace root, or None if it cannot be created (mkdtemp then uses the system temp directory)."""
+    global WORKSPACE_ROOT, _GRAVEYARD_DIR
+    with _workspace_root_lock:
+        if WORKSPACE_ROOT is None:
+            root = _private_workspace_root(Path(tempfile.gettempdir()))
+            if root is None:
+                log.warning("Using the system temp directory for workspaces.")
+                return None
+            WORKSPACE_ROOT = root
+            _GRAVEYARD_DIR = root / "graveyard"
+        return WORKSPACE_ROOT
+
+def retire_workspace(workspace_path: Union[str, Path]) -> Optional[Path]:
+    """
+    Moves a finished workspace into the graveyard with a single rename, so it leaves
+    the workspace root immediately and can be deleted later by purge_retired_workspaces.
+
+    Returns:
+        The workspace's new path, or None if it could not be moved there (e.g. it lives
+        outside WORKSPACE_ROOT); the caller should then delete it directly.
+    """
+    workspace_path = Path(workspace_path)
+    if WORKSPACE_ROOT is None or workspace_path.parent != WORKSPACE_ROOT:
+        return None
+    retired_path = _GRAVEYARD_DIR / workspace_path.name
+    for _ in range(2):
+        try:
+            os.rename(workspace_path, retired_path)
+            return retired_path
+        except FileNotFoundError:
+            if not workspace_path.exists():
+                return None
+            # The graveyard does not exist yet or was just swapped out by a purge
+            try:
+                os.makedirs(_GRAVEYARD_DIR, 0o700, exist_ok=True)
+            except OSError:
+                return None
+        except OSError as e:
+            log.debug(f"Could not move workspace {workspace_path} to the graveyard: {e}")
+            return None
+    return None
+
+def purge_retired_workspaces():
+    """
+    Deletes every retired workspace with one tree removal: the graveyard is first
+    renamed aside, so workspaces retired meanwhile go into a fresh graveyard. Only
+    batches renamed aside by this process are removed; failed removals are retried
+    on the next call.
+    """
+    if WORKSPACE_ROOT is None:
+        return # No workspace was created under the root yet
+    batch_path = WORKSPACE_ROOT / f"gc-{uuid.uuid4().hex}"
+    try:
+        os.rename(_GRAVEYARD_DIR, batch_path)
+    except FileNotFoundError:
+        pass # Nothing retired since the last purge
+    except OSError as e:
+        log.error(f"Failed to move the workspace graveyard {_GRAVEYARD_DIR} aside: {e}")
+        return
+    else:
+        with _retired_batches_lock:
+            _retired_batches.append(batch_path)
+    with _retired_batches_lock:
+        batch_paths = list(_retired_batches)
+    for path in batch_paths:
+        try:
+            shutil.rmtree(path)
+            log.debug(f"Removed retired workspaces in {path}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.error(f"Failed to remove retired workspaces in {path}: {e}")
+            continue
+        with _retired_batches_lock:
+            _retired_batches.remove(path)
+
+def _zip_member_path(workspace_path: Path, member_name: str) -> Path:
+    """
+    Returns the extraction target for a ZIP member name, sanitized the same way
+    ZipFile.extractall does: drive letters and '', '.', '..' components are dropped.
+    """
+    arcname = member_name.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [part for part in arcname.split(os.path.sep) if part not in ('', os.path.curdir, os.path.pardir)]
+    if os.path.sep == '\\':
+        parts = [part.translate(_WINDOWS_ILLEGAL_NAME_CHARS).rstrip('.') for part in parts]
+        parts = [part for part in parts if part]
+    return workspace_path.joinpath(*parts)
+
+class _MappedReader(io.RawIOBase):
+    """Seekable read-only file object over a memory map, without copying it like BytesIO would."""
+
+    def __init__(self, mapped: mmap.mmap):
+        super().__init__()
+        self._view = memoryview(mapped)
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._position = max(0, offset)
+        return self._position
+
+    def readinto(self, buffer):
+        chunk = self._view[self._position:self._position + len(buffer)]
+        size = len(chunk)
+        buffer[:size] = chunk
+        self._position += size
+        return size
+
+    def close(self):
+        # The view must be released before the mapping itself can be closed
+        self._view.release()
+        super().close()
+
+def _extract_zip(zip_path: Path, workspace_path: Path, archive_file: Optional[BinaryIO] = None):
+    """
+    Extracts a ZIP archive into the workspace with large copy buffers and unbuffered
+    writes. Empty members are created directly without opening a decompressor.
+    An already open archive_file is read instead of opening zip_path.
+    """
+    if archive_file is None:
+        with open(zip_path, 'rb', buffering=_ARCHIVE_READ_BUFFER_SIZE) as archive_file:
+            _extract_zip(zip_path, workspace_path, archive_file)
+        return
+    with zipfile.ZipFile(archive_file, 'r') as zip_ref:
+        for member in zip_ref.infolist():
+            target_path = _zip_member_path(workspace_path, member.filename)
+            if target_path == workspace_path:
+                continue
+            if member.is_dir():
+                target_path.mkdir(parents=True, exist_ok=True)
+                continue
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            if member.file_size == 0:
+                target_path.touch()
+                continue
+            with zip_ref.open(member) as source, open(target_path, 'wb', buffering=0) as target:
+                shutil.copyfileobj(source, target, min(member.file_size, _EXTRACT_BUFFER_SIZE))
+
+def prepare_processing_workspace(input_path_str: Union[str, Path], archive_file: Optional[BinaryIO] = None) -> Path:
     """
     Prepares a temporary workspace for processing an asset source.
 
@@ -22,6 +281,8 @@ def prepare_processing_workspace(input_path_str: Union[str, Path]) -> Path:
     Args:
         input_path_str: The path (as a string or Path object) to the input
                         directory or archive file.
+        archive_file: Optional already open, seekable file object with the
+                      archive's contents, read instead of reopening the path.
 
     Returns:
         The Path object representing the created temporary workspace directory.
@@ -40,7 +301,7 @@ def prepare_processing_workspace(input_path_str: Union[str, Path]) -> Path:
         raise FileNotFoundError(f"Input path does not exist: {input_path}")
 
     try:
-        temp_workspace_dir = tempfile.mkdtemp(prefix="asset_proc_")
+        temp_workspace_dir = tempfile.mkdtemp(prefix="asset_proc_", dir=_workspace_root())
         prepared_workspace_path = Path(temp_workspace_dir)
         log.info(f"Created temporary workspace: {prepared_workspace_path}")
     except OSError as e:
@@ -54,8 +315,7 @@ def prepare_processing_workspace(input_path_str: Union[str, Path]) -> Path:
         elif input_path.is_file() and input_path.suffix.lower() in SUPPORTED_ARCHIVES:
             log.info(f"Input is a supported archive ({input_path.suffix}), extracting to workspace: {input_path}")
             if input_path.suffix.lower() == '.zip':
-                with zipfile.ZipFile(input_path, 'r') as zip_ref:
-                    zip_ref.extractall(prepared_workspace_path)
+                _extract_zip(input_path, prepared_workspace_path, archive_file)
             # Add elif blocks here for other archive types (e.g., using patoolib)
             else:
                 # This case should ideally not be reached if SUPPORTED_ARCHIVES is correct
@@ -74,4 +334,54 @@ def prepare_processing_workspace(input_path_str: Union[str, Path]) -> Path:
                 log.info(f"Cleaned up failed workspace: {prepared_workspace_path}")
             except OSError as cleanup_error:
                 log.error(f"Failed to cleanup workspace {prepared_workspace_path} after error: {cleanup_error}")
-        raise
\ No newline at end of file
+        raise
+
+def prepare_and_hash(input_path_str: Union[str, Path], hash_executor: Optional[Executor] = None) -> Tuple[Path, Optional[str]]:
+    """
+    Prepares a workspace like prepare_processing_workspace and also returns the
+    SHA-256 of a ZIP input, reading the archive from disk only once: the hash and
+    the extraction both read the same read-only memory map, so whichever touches
+    a page second finds it in the page cache.
+
+    Args:
+        input_path_str: The path to the input directory or archive file.
+        hash_executor: Optional executor to hash on while this thread extracts.
+                       Without one, the archive is hashed first, then extracted.
+
+    Returns:
+        (workspace_path, sha256_hexdigest). The digest is None for inputs that are not
+        ZIP files or cannot be memory mapped; callers hash those separately if needed.
+
+    Raises:
+        The same exceptions as prepare_processing_workspace.
+    """
+    input_path = Path(input_path_str)
+    if input_path.suffix.lower() != '.zip' or not input_path.is_file():
+        return prepare_processing_workspace(input_path), None
+
+    with open(input_path, 'rb') as raw_file:
+        try:
+            mapped = mmap.mmap(raw_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, OverflowError) as e:
+            log.debug(f"Could not memory map {input_path} ({e}); extracting and hashing separately.")
+            return prepare_processing_workspace(input_path), None
+
+        with mapped:
+            if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                try:
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                except OSError:
+                    pass # Only a read-ahead hint
+            if hash_executor is None:
+                digest = hashlib.sha256(mapped).hexdigest()
+                with _MappedReader(mapped) as archive_file:
+                    return prepare_processing_workspace(input_path, archive_file), digest
+
+            hash_future = hash_executor.submit(lambda: hashlib.sha256(mapped).hexdigest())
+            try:
+                with _MappedReader(mapped) as archive_file:
+                    workspace_path = prepare_processing_workspace(input_path, archive_file)
+            finally:
+                # The mapping cannot be closed while the hash still reads it
+                digest = hash_future.result()
+            return workspace_path, digest